@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+"""Completion latency benchmarks against bench/fake_docker.py.
+
+Runs 'complete -C' scenarios in fresh fish processes with the repository's
+completions and functions loaded, and times gen_docker_fish_completions.py
+end to end. Every docker call and every external helper process (tr, grep,
+sort, ...) started during a run is logged, so the report shows p50/p95
+latency next to the number of processes each TAB spawned.
+
+    python bench/bench_completions.py --containers 300 --images 1000 --delay 0.05
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+# name, command line, processes the first TAB in a fresh fish starts, processes
+# every later TAB on the same command line starts
+SCENARIOS = [
+    ('docker subcommands', 'docker ', {}, {}),
+    ('docker run options', 'docker run --', {}, {}),
+    # the first listing also creates the cache directory that holds the clock
+    ('docker exec', 'docker exec ', {'docker': 1, 'mkdir': 1}, {}),
+    ('docker rmi', 'docker rmi ', {'docker': 1, 'mkdir': 1}, {}),
+    ('docker network ls', 'docker network ls --', {}, {}),
+    ('docker compose up', 'docker compose up ', {'docker': 1}, {}),
+    # docker-util's helper doesn't cache
+    ('docker-util get-ip', 'docker-util get-ip ', {'docker': 1}, {'docker': 1}),
+]
+
+# container and image listings of a remote engine go through timeout
+REMOTE_LISTINGS = ['docker exec', 'docker rmi']
+
+# logged by the fish scripts after every TAB
+TAB_MARK = '--tab--'
+
+# external commands the completion helpers may start; each gets a logging shim
+SHIMMED = ['cat', 'date', 'grep', 'ip', 'mkdir', 'mktemp', 'mv', 'nsenter', 'rm', 'sort', 'sudo', 'timeout', 'tr', 'uniq']
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+class Sandbox(object):
+    """Temporary PATH with the fake docker binaries and logging shims."""
+
+    def __init__(self, args):
+        self.root = tempfile.mkdtemp(prefix='fish-docker-bench-')
+        self.bin_dir = os.path.join(self.root, 'bin')
+        self.log = os.path.join(self.root, 'spawn.log')
+        os.makedirs(self.bin_dir)
+        fake = os.path.join(BENCH_DIR, 'fake_docker.py')
+        for name in ('docker', 'docker-compose'):
+            os.symlink(fake, os.path.join(self.bin_dir, name))
+        for name in SHIMMED:
+            real = shutil.which(name)
+            if real is None:
+                continue
+            shim = os.path.join(self.bin_dir, name)
+            with open(shim, 'w') as f:
+                f.write('#!/bin/sh\nprintf "%%s\\n" "%s $*" >> "$FAKE_DOCKER_LOG"\nexec %s "$@"\n' % (name, real))
+            os.chmod(shim, 0o755)
+        self.env = dict(os.environ)
+        self.env.update({
+            'PATH': self.bin_dir + os.pathsep + os.environ.get('PATH', ''),
+            'FAKE_DOCKER_LOG': self.log,
+            'FAKE_DOCKER_CONTAINERS': str(args.containers),
+            'FAKE_DOCKER_IMAGES': str(args.images),
+            'FAKE_DOCKER_SERVICES': str(args.services),
+            'FAKE_DOCKER_DELAY': str(args.delay),
+            'XDG_CONFIG_HOME': os.path.join(self.root, 'config'),
+            'XDG_DATA_HOME': os.path.join(self.root, 'data'),
+            'XDG_CACHE_HOME': os.path.join(self.root, 'cache'),
+        })
+        # left to the completions to create, see run()
+        self.runtime_dir = os.path.join(self.env['XDG_CACHE_HOME'], 'fish-docker', 'runtime')
+        # the compose project the scenarios run in
+        self.project_dir = os.path.join(self.root, 'project')
+        os.makedirs(self.project_dir)
+        with open(os.path.join(self.project_dir, 'compose.yaml'), 'w') as f:
+            f.write('services:\n')
+            for i in range(args.services):
+                f.write('  service-%d:\n    image: nginx\n' % i)
+        self.env.pop('DOCKER_HOST', None)
+        self.env.pop('DOCKER_CONTEXT', None)
+        if args.docker_host:
+            # the fake ignores it, but the completions treat the engine as remote
+            self.env['DOCKER_HOST'] = args.docker_host
+
+    def run(self, cmd, fresh=False):
+        """Run cmd in the compose project and return (seconds, processes started by each TAB).
+
+        With fresh, the completions' cache directory is removed first, as on a new install.
+        """
+        if fresh:
+            shutil.rmtree(self.runtime_dir, ignore_errors=True)
+        open(self.log, 'w').close()
+        start = time.perf_counter()
+        subprocess.run(cmd, env=self.env, cwd=self.project_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        tabs = [[]]
+        with open(self.log) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                name = line.split(None, 1)[0]
+                if name == TAB_MARK:
+                    tabs.append([])
+                else:
+                    tabs[-1].append(name)
+        if len(tabs) > 1:
+            # nothing runs after the last TAB
+            tabs.pop()
+        return elapsed, tabs
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def fish_script(commandline, repeat, completions_dirs, functions_dirs):
+    # every TAB inside one fish process, the first one also loads the completion file
+    tabs = '; '.join(['complete -C %s; echo %s >> $FAKE_DOCKER_LOG' % (json.dumps(commandline), TAB_MARK)] * repeat)
+    return 'set -p fish_complete_path {0}; set -p fish_function_path {1}; {2}'.format(
+        ' '.join(completions_dirs), ' '.join(functions_dirs), tabs)
+
+
+def generate_layout(sandbox, layout):
+    # completion files generated from the fake docker in the given --layout
+    completions_dir = os.path.join(sandbox.root, layout, 'completions')
+    functions_dir = os.path.join(sandbox.root, layout, 'functions')
+    sandbox.run([sys.executable, os.path.join(REPO_DIR, 'gen_docker_fish_completions.py'),
+                 '--docker-path', sandbox.bin_dir, '--no-cache', '--layout', layout,
+                 '--output-dir', completions_dir, '--functions-dir', functions_dir])
+    return completions_dir, functions_dir
+
+
+def spawn_counts(names):
+    return dict(sorted(Counter(names).items()))
+
+
+def measure(sandbox, name, cmd, runs, per_run=1, fresh=False):
+    times, docker, other = [], [], []
+    # every distinct set of processes seen on a first TAB and on a later one
+    first_tabs, later_tabs = [], []
+    for _ in range(runs):
+        elapsed, tabs = sandbox.run(cmd, fresh)
+        spawned = sum(tabs, [])
+        d = sum(1 for name in spawned if name in ('docker', 'docker-compose'))
+        times.append(elapsed / per_run)
+        docker.append(d / per_run)
+        other.append((len(spawned) - d) / per_run)
+        for seen, tab in [(first_tabs, tabs[0])] + [(later_tabs, tab) for tab in tabs[1:]]:
+            counts = spawn_counts(tab)
+            if counts not in seen:
+                seen.append(counts)
+    return {
+        'name': name,
+        'runs': runs,
+        'p50_ms': percentile(times, 50) * 1000,
+        'p95_ms': percentile(times, 95) * 1000,
+        'docker_calls': sum(docker) / runs,
+        'other_processes': sum(other) / runs,
+        'first_tab_spawns': first_tabs,
+        'later_tab_spawns': later_tabs,
+    }
+
+
+def bench_completions(sandbox, args):
+    fish = shutil.which('fish')
+    if fish is None:
+        print('fish not found, skipping completion scenarios', file=sys.stderr)
+        return []
+    completions_dirs = [args.completions_dir or os.path.join(REPO_DIR, 'completions')]
+    functions_dirs = [os.path.join(REPO_DIR, 'functions')]
+    if args.layout:
+        # docker-util.fish still comes from the repository
+        for dirs, generated in zip((completions_dirs, functions_dirs), generate_layout(sandbox, args.layout)):
+            dirs.insert(0, generated)
+    startup = measure(sandbox, 'fish startup', [fish, '--no-config', '-c', 'true'], args.runs)
+    startup['scenario'] = 'fish startup'
+    results = [startup]
+    for name, commandline, _, _ in SCENARIOS:
+        if args.scenario and name not in args.scenario:
+            continue
+        script = fish_script(commandline, 1, completions_dirs, functions_dirs)
+        result = measure(sandbox, name, [fish, '--no-config', '-c', script], args.runs, fresh=True)
+        # the first TAB loads the completion file (and, split, the subcommand's functions)
+        result['first_tab_ms'] = result['p50_ms'] - startup['p50_ms']
+        result['scenario'] = name
+        results.append(result)
+        if args.repeat > 1:
+            script = fish_script(commandline, args.repeat, completions_dirs, functions_dirs)
+            result = measure(sandbox, '%s (x%d)' % (name, args.repeat),
+                             [fish, '--no-config', '-c', script], args.runs, args.repeat, fresh=True)
+            result['scenario'] = name
+            results.append(result)
+    return results
+
+
+def bench_generator(sandbox, args):
+    out_dir = os.path.join(sandbox.root, 'out')
+    cmd = [sys.executable, os.path.join(REPO_DIR, 'gen_docker_fish_completions.py'),
+           '--docker-path', sandbox.bin_dir, '--output-dir', out_dir]
+    results = [
+        measure(sandbox, 'generator --no-cache', cmd + ['--no-cache'], args.generator_runs),
+        measure(sandbox, 'generator --no-cache -j 16', cmd + ['--no-cache', '-j', '16'], args.generator_runs),
+        measure(sandbox, 'generator --no-cache -j 1', cmd + ['--no-cache', '-j', '1'], args.generator_runs),
+    ]
+    # prime the help cache, then time warm runs
+    sandbox.run(cmd + ['--refresh'])
+    results.append(measure(sandbox, 'generator (warm cache)', cmd, args.generator_runs))
+    return results
+
+
+def expected_spawns(args):
+    expected = {'fish startup': ({}, {})}
+    for name, _, first, later in SCENARIOS:
+        if args.scenario and name not in args.scenario:
+            continue
+        if args.docker_host and name in REMOTE_LISTINGS:
+            first = spawn_counts(Counter(first) + Counter(timeout=first['docker']))
+        expected[name] = (first, later)
+    return expected
+
+
+def check_spawns(results, expected):
+    # every run must start exactly the expected processes, on the first TAB and
+    # on every later one; the generator timings are not completions
+    failures = []
+    measured = set(r.get('scenario') for r in results)
+    for name in expected:
+        if name not in measured:
+            failures.append('%s: not measured' % name)
+    for r in results:
+        if r.get('scenario') not in expected:
+            continue
+        first, later = expected[r['scenario']]
+        if r['first_tab_spawns'] != [first]:
+            failures.append('%s: first TAB started %s, expected %s' % (
+                r['name'], ' or '.join(map(str, r['first_tab_spawns'])), first))
+        if r['later_tab_spawns'] and r['later_tab_spawns'] != [later]:
+            failures.append('%s: later TABs started %s, expected %s' % (
+                r['name'], ' or '.join(map(str, r['later_tab_spawns'])), later))
+    return failures
+
+
+def report(results):
+    print('%-34s %6s %10s %10s %12s %8s %8s' % (
+        'scenario', 'runs', 'p50 ms', 'p95 ms', 'first TAB ms', 'docker', 'other'))
+    for r in results:
+        first_tab = '%.1f' % r['first_tab_ms'] if 'first_tab_ms' in r else '-'
+        print('%-34s %6d %10.1f %10.1f %12s %8.1f %8.1f' % (
+            r['name'], r['runs'], r['p50_ms'], r['p95_ms'], first_tab, r['docker_calls'], r['other_processes']))
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=20, help='fish runs per scenario (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='also time this many TABs inside one fish process (default: %(default)s)')
+    parser.add_argument('--generator-runs', type=int, default=5,
+                        help='generator runs per mode (default: %(default)s)')
+    parser.add_argument('--containers', type=int, default=100)
+    parser.add_argument('--images', type=int, default=100)
+    parser.add_argument('--services', type=int, default=10)
+    parser.add_argument('--delay', type=float, default=0.0, help='seconds each fake docker call takes')
+    parser.add_argument('--docker-host', help='DOCKER_HOST for the completions, e.g. tcp://remote:2376 '
+                                              'to time the remote engine cache')
+    parser.add_argument('--scenario', action='append', help='only run this scenario (repeatable)')
+    parser.add_argument('--completions-dir', help='completion files to load (default: completions/)')
+    parser.add_argument('--layout', choices=['single', 'split', 'table'],
+                        help='load completions generated from the fake docker in this layout '
+                             'instead of the checked-in ones, e.g. to compare first-TAB latency')
+    parser.add_argument('--no-generator', action='store_true', help='skip the generator timing')
+    parser.add_argument('--json', help='also write the results to this file')
+    parser.add_argument('--check-spawns', action='store_true',
+                        help='exit non-zero unless every TAB starts exactly the docker calls and other '
+                             'processes its scenario expects, in a fresh fish and on later TABs')
+
+    args = parser.parse_args()
+    if args.check_spawns and shutil.which('fish') is None:
+        # without fish there is nothing to check, which must not pass as a success
+        parser.error('--check-spawns needs fish on PATH')
+
+    sandbox = Sandbox(args)
+    try:
+        results = bench_completions(sandbox, args)
+        if not args.no_generator:
+            results += bench_generator(sandbox, args)
+    finally:
+        sandbox.cleanup()
+
+    report(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.check_spawns:
+        failures = check_spawns(results, expected_spawns(args))
+        for failure in failures:
+            print('FAIL %s' % failure, file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
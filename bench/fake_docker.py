@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+"""Scriptable stand-in for the docker and docker-compose binaries.
+
+Answers the help, listing and inspect commands used by the completions and
+docker-util from a synthetic inventory, and logs every invocation. Configured
+through the environment:
+
+    FAKE_DOCKER_CONTAINERS  number of containers (default 20)
+    FAKE_DOCKER_IMAGES      number of images (default 20)
+    FAKE_DOCKER_SERVICES    number of compose services (default 5)
+    FAKE_DOCKER_DELAY       seconds to sleep before answering (default 0)
+    FAKE_DOCKER_LOG         file that gets one line per invocation
+
+Symlink it as 'docker' and 'docker-compose'; the name it is called by picks
+the CLI it pretends to be.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+# path -> (description, usage arguments, switches)
+DOCKER_COMMANDS = {
+    ('attach',): ('Attach local standard input, output, and error streams to a running container', 'CONTAINER', ['--detach-keys string', '--no-stdin', '--sig-proxy']),
+    ('build',): ('Build an image from a Dockerfile', 'PATH | URL | -', ['--build-arg list', '-f, --file string', '--no-cache', '--pull', '-q, --quiet', '-t, --tag list']),
+    ('commit',): ("Create a new image from a container's changes", 'CONTAINER [REPOSITORY[:TAG]]', ['-a, --author string', '-m, --message string', '-p, --pause']),
+    ('cp',): ('Copy files/folders between a container and the local filesystem', 'CONTAINER:SRC_PATH DEST_PATH|-', ['-a, --archive', '-L, --follow-link', '-q, --quiet']),
+    ('create',): ('Create a new container', 'IMAGE [COMMAND] [ARG...]', ['-e, --env list', '--env-file list', '-i, --interactive', '--name string', '-t, --tty', '-v, --volume list']),
+    ('diff',): ("Inspect changes to files or directories on a container's filesystem", 'CONTAINER', []),
+    ('events',): ('Get real time events from the server', '', ['-f, --filter filter', '--format string', '--since string', '--until string']),
+    ('exec',): ('Execute a command in a running container', 'CONTAINER COMMAND [ARG...]', ['-d, --detach', '-e, --env list', '-i, --interactive', '--privileged', '-t, --tty', '-u, --user string', '-w, --workdir string']),
+    ('export',): ("Export a container's filesystem as a tar archive", 'CONTAINER', ['-o, --output string']),
+    ('history',): ('Show the history of an image', 'IMAGE', ['-H, --human', '--no-trunc', '-q, --quiet']),
+    ('images',): ('List images', '[REPOSITORY[:TAG]]', ['-a, --all', '--digests', '-f, --filter filter', '--format string', '--no-trunc', '-q, --quiet']),
+    ('info',): ('Display system-wide information', '', ['-f, --format string']),
+    ('inspect',): ('Return low-level information on Docker objects', 'NAME|ID [NAME|ID...]', ['-f, --format string', '-s, --size', '--type string']),
+    ('kill',): ('Kill one or more running containers', 'CONTAINER [CONTAINER...]', ['-s, --signal string']),
+    ('load',): ('Load an image from a tar archive or STDIN', '', ['-i, --input string', '-q, --quiet']),
+    ('logs',): ('Fetch the logs of a container', 'CONTAINER', ['--details', '-f, --follow', '--since string', '-n, --tail string', '-t, --timestamps']),
+    ('pause',): ('Pause all processes within one or more containers', 'CONTAINER [CONTAINER...]', []),
+    ('port',): ('List port mappings or a specific mapping for the container', 'CONTAINER [PRIVATE_PORT[/PROTO]]', []),
+    ('ps',): ('List containers', '', ['-a, --all', '-f, --filter filter', '--format string', '-n, --last int', '--no-trunc', '-q, --quiet', '-s, --size']),
+    ('pull',): ('Download an image from a registry', 'NAME[:TAG|@DIGEST]', ['-a, --all-tags', '--platform string', '-q, --quiet']),
+    ('push',): ('Upload an image to a registry', 'NAME[:TAG]', ['-a, --all-tags', '-q, --quiet']),
+    ('rename',): ('Rename a container', 'CONTAINER NEW_NAME', []),
+    ('restart',): ('Restart one or more containers', 'CONTAINER [CONTAINER...]', ['-s, --signal string', '-t, --time int']),
+    ('rm',): ('Remove one or more containers', 'CONTAINER [CONTAINER...]', ['-f, --force', '-l, --link', '-v, --volumes']),
+    ('rmi',): ('Remove one or more images', 'IMAGE [IMAGE...]', ['-f, --force', '--no-prune']),
+    ('run',): ('Create and run a new container from an image', 'IMAGE [COMMAND] [ARG...]', ['--add-host list', '-d, --detach', '-e, --env list', '--env-file list', '-i, --interactive', '--name string', '-p, --publish list', '--rm', '-t, --tty', '-v, --volume list', '-w, --workdir string']),
+    ('save',): ('Save one or more images to a tar archive', 'IMAGE [IMAGE...]', ['-o, --output string']),
+    ('search',): ('Search Docker Hub for images', 'TERM', ['-f, --filter filter', '--limit int', '--no-trunc']),
+    ('start',): ('Start one or more stopped containers', 'CONTAINER [CONTAINER...]', ['-a, --attach', '-i, --interactive']),
+    ('stats',): ('Display a live stream of container(s) resource usage statistics', '[CONTAINER...]', ['-a, --all', '--no-stream', '--no-trunc']),
+    ('stop',): ('Stop one or more running containers', 'CONTAINER [CONTAINER...]', ['-s, --signal string', '-t, --time int']),
+    ('tag',): ('Create a tag TARGET_IMAGE that refers to SOURCE_IMAGE', 'SOURCE_IMAGE[:TAG] TARGET_IMAGE[:TAG]', []),
+    ('top',): ('Display the running processes of a container', 'CONTAINER [ps OPTIONS]', []),
+    ('unpause',): ('Unpause all processes within one or more containers', 'CONTAINER [CONTAINER...]', []),
+    ('version',): ('Show the Docker version information', '', ['-f, --format string']),
+    ('wait',): ('Block until one or more containers stop, then print their exit codes', 'CONTAINER [CONTAINER...]', []),
+    ('container',): ('Manage containers', 'COMMAND', []),
+    ('container', 'ls'): ('List containers', '', ['-a, --all', '-f, --filter filter', '--format string', '-q, --quiet']),
+    ('container', 'prune'): ('Remove all stopped containers', '', ['--filter filter', '-f, --force']),
+    ('container', 'rm'): ('Remove one or more containers', 'CONTAINER [CONTAINER...]', ['-f, --force', '-v, --volumes']),
+    ('image',): ('Manage images', 'COMMAND', []),
+    ('image', 'ls'): ('List images', '[REPOSITORY[:TAG]]', ['-a, --all', '-f, --filter filter', '--format string', '-q, --quiet']),
+    ('image', 'prune'): ('Remove unused images', '', ['-a, --all', '--filter filter', '-f, --force']),
+    ('image', 'rm'): ('Remove one or more images', 'IMAGE [IMAGE...]', ['-f, --force', '--no-prune']),
+    ('network',): ('Manage networks', 'COMMAND', []),
+    ('network', 'connect'): ('Connect a container to a network', 'NETWORK CONTAINER', ['--alias strings', '--ip string']),
+    ('network', 'create'): ('Create a network', 'NETWORK', ['-d, --driver string', '--internal', '--subnet strings']),
+    ('network', 'disconnect'): ('Disconnect a container from a network', 'NETWORK CONTAINER', ['-f, --force']),
+    ('network', 'ls'): ('List networks', '', ['-f, --filter filter', '--format string', '--no-trunc', '-q, --quiet']),
+    ('network', 'rm'): ('Remove one or more networks', 'NETWORK [NETWORK...]', ['-f, --force']),
+    ('volume',): ('Manage volumes', 'COMMAND', []),
+    ('volume', 'create'): ('Create a volume', '[VOLUME]', ['-d, --driver string', '--label list']),
+    ('volume', 'ls'): ('List volumes', '', ['-f, --filter filter', '--format string', '-q, --quiet']),
+    ('volume', 'rm'): ('Remove one or more volumes', 'VOLUME [VOLUME...]', ['-f, --force']),
+}
+
+COMPOSE_COMMANDS = {
+    ('build',): ('Build or rebuild services', '[SERVICE...]', ['--no-cache', '--pull', '-q, --quiet']),
+    ('config',): ('Parse, resolve and render compose file in canonical format', '[SERVICE...]', ['--format string', '-q, --quiet', '--services']),
+    ('down',): ('Stop and remove containers, networks', '[SERVICES]', ['--remove-orphans', '-t, --timeout int', '-v, --volumes']),
+    ('exec',): ('Execute a command in a running container', 'SERVICE COMMAND [ARGS...]', ['-d, --detach', '-e, --env stringArray', '-u, --user string']),
+    ('logs',): ('View output from containers', '[SERVICE...]', ['-f, --follow', '-n, --tail string', '-t, --timestamps']),
+    ('ps',): ('List containers', '[SERVICE...]', ['-a, --all', '--format string', '-q, --quiet']),
+    ('pull',): ('Pull service images', '[SERVICE...]', ['--ignore-pull-failures', '-q, --quiet']),
+    ('restart',): ('Restart service containers', '[SERVICE...]', ['-t, --timeout int']),
+    ('run',): ('Run a one-off command on a service', 'SERVICE [COMMAND] [ARGS...]', ['-d, --detach', '-e, --env stringArray', '--rm']),
+    ('start',): ('Start services', '[SERVICE...]', []),
+    ('stop',): ('Stop services', '[SERVICE...]', ['-t, --timeout int']),
+    ('up',): ('Create and start containers', '[SERVICE...]', ['-d, --detach', '--build', '--force-recreate', '--remove-orphans', '-t, --timeout int']),
+}
+
+GLOBAL_OPTIONS = [
+    ('--config string', 'Location of client config files'),
+    ('-c, --context string', 'Name of the context to use to connect to the daemon'),
+    ('-D, --debug', 'Enable debug mode'),
+    ('-H, --host list', 'Daemon socket to connect to'),
+    ('-l, --log-level string', 'Set the logging level'),
+    ('-v, --version', 'Print version information and quit'),
+]
+
+
+class Inventory(object):
+    def __init__(self, containers, images, services):
+        self.containers = []
+        for i in range(containers):
+            name = 'app-%04d' % i
+            digest = hashlib.sha256(name.encode()).hexdigest()
+            running = i % 3 != 2
+            self.containers.append({
+                'Id': digest,
+                'Name': '/' + name,
+                'Names': name,
+                'Status': 'running' if running else 'exited',
+                'State': {'Pid': 1000 + i if running else 0, 'Status': 'running' if running else 'exited'},
+                'NetworkSettings': {'Networks': {
+                    'bridge': {'IPAddress': '172.17.%d.%d' % (i // 250, i % 250 + 2)},
+                }},
+            })
+        self.images = []
+        for i in range(images):
+            digest = hashlib.sha256(b'image-%d' % i).hexdigest()
+            if i % 10 == 9:
+                repository, tag = '<none>', '<none>'
+            else:
+                repository, tag = 'registry.local/team%d/image-%04d' % (i % 7, i), 'v%d' % (i % 3)
+            self.images.append({'Id': 'sha256:' + digest, 'ID': digest[:12], 'Repository': repository, 'Tag': tag})
+        self.services = ['service-%d' % i for i in range(services)]
+
+    def find_container(self, ref):
+        for container in self.containers:
+            if ref in (container['Names'], container['Name']) or container['Id'].startswith(ref):
+                return container
+        return None
+
+
+# -- a small subset of Go's text/template, enough for the formats used in this repo
+
+ACTION = re.compile(r'\{\{-?\s*(.*?)\s*-?\}\}', re.S)
+
+
+def parse_template(text):
+    parts = ACTION.split(text)
+    nodes, _ = _parse(parts, [0], ())
+    return nodes
+
+
+def _parse(parts, pos, terminators):
+    nodes = []
+    while pos[0] < len(parts):
+        i = pos[0]
+        pos[0] += 1
+        if i % 2 == 0:
+            if parts[i]:
+                nodes.append(('text', parts[i]))
+            continue
+        action = parts[i]
+        keyword = action.split(None, 1)[0] if action else ''
+        if keyword in terminators:
+            return nodes, action
+        if keyword == 'if':
+            then, end = _parse(parts, pos, ('else', 'end'))
+            otherwise = []
+            if end == 'else':
+                otherwise, _ = _parse(parts, pos, ('end',))
+            nodes.append(('if', action[2:].strip(), then, otherwise))
+        elif keyword == 'range':
+            body, _ = _parse(parts, pos, ('end',))
+            nodes.append(('range', action[5:].strip(), body))
+        else:
+            nodes.append(('expr', action))
+    return nodes, None
+
+
+def render(nodes, dot, variables=None):
+    variables = dict(variables or {})
+    out = []
+    for node in nodes:
+        if node[0] == 'text':
+            out.append(node[1])
+        elif node[0] == 'expr':
+            value = evaluate(node[1], dot, variables)
+            out.append(value if isinstance(value, str) else json.dumps(value) if isinstance(value, (dict, list)) else str(value))
+        elif node[0] == 'if':
+            branch = node[2] if evaluate(node[1], dot, variables) else node[3]
+            out.append(render(branch, dot, variables))
+        elif node[0] == 'range':
+            m = re.match(r'(\$\w+)\s*,\s*(\$\w+)\s*:=\s*(.+)', node[1])
+            if m:
+                items = evaluate(m.group(3), dot, variables) or {}
+                for key in sorted(items):
+                    variables[m.group(1)], variables[m.group(2)] = key, items[key]
+                    out.append(render(node[2], items[key], variables))
+            else:
+                for item in evaluate(node[1], dot, variables) or []:
+                    out.append(render(node[2], item, variables))
+    return ''.join(out)
+
+
+def evaluate(expr, dot, variables):
+    args = re.findall(r'"[^"]*"|\S+', expr)
+    if args[0] == 'eq':
+        return evaluate(args[1], dot, variables) == evaluate(args[2], dot, variables)
+    if args[0] == 'json':
+        return json.dumps(evaluate(args[1], dot, variables))
+    if args[0] == 'index':
+        return (evaluate(args[1], dot, variables) or {}).get(evaluate(args[2], dot, variables), '')
+    token = args[0]
+    if token.startswith('"'):
+        return token[1:-1]
+    if token.startswith('$'):
+        name, _, rest = token.partition('.')
+        value = variables.get(name)
+        fields = rest.split('.') if rest else []
+    else:
+        value = dot
+        fields = [x for x in token.split('.') if x]
+    for field in fields:
+        value = value.get(field, '') if isinstance(value, dict) else ''
+    return value
+
+
+def format_rows(fmt, rows):
+    # docker's table formatter turns literal \t and \n into real ones
+    fmt = fmt.replace('\\t', '\t').replace('\\n', '\n')
+    nodes = parse_template(fmt)
+    return [render(nodes, row) for row in rows]
+
+
+# -- commands
+
+def parse_options(args, with_value):
+    options = {}
+    rest = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith('-') and arg != '-':
+            name, eq, value = arg.partition('=')
+            if name in with_value:
+                if not eq:
+                    i += 1
+                    value = args[i] if i < len(args) else ''
+                options.setdefault(name, []).append(value)
+            else:
+                options.setdefault(name, []).append(True)
+        else:
+            rest.append(arg)
+        i += 1
+    return options, rest
+
+
+def help_page(binary, commands, path):
+    if not path:
+        lines = ['', 'Usage:  %s [OPTIONS] COMMAND' % binary, '', 'A self-sufficient runtime for containers', '']
+        lines.append('Management Commands:')
+        for key in sorted(commands):
+            if len(key) == 1 and commands[key][1] == 'COMMAND':
+                lines.append('  %-11s %s' % (key[0], commands[key][0]))
+        lines += ['', 'Commands:']
+        for key in sorted(commands):
+            if len(key) == 1 and commands[key][1] != 'COMMAND':
+                lines.append('  %-11s %s' % (key[0], commands[key][0]))
+        lines += ['', 'Global Options:']
+        for switch, description in GLOBAL_OPTIONS:
+            lines.append('  %-24s %s' % (switch, description))
+        return '\n'.join(lines) + '\n'
+    if path not in commands:
+        return None
+    description, usage, switches = commands[path]
+    options = ' [OPTIONS]' if switches else ''
+    lines = ['', 'Usage:  %s %s%s %s' % (binary, ' '.join(path), options, usage), '', description, '']
+    children = sorted(key for key in commands if key[:-1] == path)
+    if children:
+        lines.append('Commands:')
+        for key in children:
+            lines.append('  %-11s %s' % (key[-1], commands[key][0]))
+        lines.append('')
+    if switches:
+        lines.append('Options:')
+        for switch in switches:
+            padded = switch if switch.startswith('-') and not switch.startswith('--') else '    ' + switch
+            name = switch.split(', ')[-1].split()[0].lstrip('-')
+            lines.append('  %-26s %s' % (padded, name.replace('-', ' ').capitalize()))
+    return '\n'.join(lines) + '\n'
+
+
+def ps(inventory, args):
+    options, _ = parse_options(args, ('--filter', '-f', '--format', '-n', '--last'))
+    containers = inventory.containers
+    if not ('--all' in options or '-a' in options):
+        containers = [c for c in containers if c['Status'] == 'running']
+    filters = {}
+    for value in options.get('--filter', []) + options.get('-f', []):
+        key, _, value = value.partition('=')
+        filters.setdefault(key, []).append(value)
+    if 'status' in filters:
+        containers = [c for c in containers if c['Status'] in filters['status']]
+    if 'name' in filters:
+        containers = [c for c in containers if any(re.search(p, c['Names']) or re.search(p, c['Name']) for p in filters['name'])]
+    if 'id' in filters:
+        containers = [c for c in containers if any(c['Id'].startswith(p) for p in filters['id'])]
+    no_trunc = '--no-trunc' in options
+    rows = [dict(c, ID=c['Id'] if no_trunc else c['Id'][:12]) for c in containers]
+    if '-q' in options or '--quiet' in options:
+        return [row['ID'] for row in rows]
+    fmt = (options.get('--format') or ['{{.ID}}\t{{.Names}}'])[-1]
+    return format_rows(fmt, rows)
+
+
+def images(inventory, args):
+    options, rest = parse_options(args, ('--filter', '-f', '--format'))
+    rows = inventory.images
+    filters = options.get('--filter', []) + options.get('-f', [])
+    if 'dangling=true' in filters:
+        rows = [r for r in rows if r['Repository'] == '<none>']
+    patterns = [v.partition('=')[2] for v in filters if v.startswith('reference=')]
+    patterns += rest
+    if patterns:
+        rows = [r for r in rows if any(fnmatch.fnmatchcase(r['Repository'], p) or fnmatch.fnmatchcase('%s:%s' % (r['Repository'], r['Tag']), p) for p in patterns)]
+    fmt = (options.get('--format') or ['{{.Repository}}\t{{.Tag}}\t{{.ID}}'])[-1]
+    return format_rows(fmt, rows)
+
+
+def inspect(inventory, args):
+    options, refs = parse_options(args, ('--format', '-f', '--type'))
+    fmt = (options.get('--format') or options.get('-f') or [None])[-1]
+    nodes = parse_template(fmt) if fmt else None
+    out, errors = [], []
+    found = []
+    for ref in refs:
+        container = inventory.find_container(ref)
+        if container is None:
+            errors.append('Error: No such container: %s' % ref)
+            continue
+        found.append(container)
+        if nodes is not None:
+            out.append(render(nodes, container))
+    if nodes is None:
+        out = [json.dumps(found, indent=4)]
+    return out, errors
+
+
+def main():
+    binary = os.path.basename(sys.argv[0])
+    if binary.endswith('.py'):
+        binary = 'docker'
+    args = sys.argv[1:]
+
+    log = os.environ.get('FAKE_DOCKER_LOG')
+    if log:
+        with open(log, 'a') as f:
+            f.write(' '.join([binary] + args) + '\n')
+    delay = float(os.environ.get('FAKE_DOCKER_DELAY', '0'))
+    if delay:
+        time.sleep(delay)
+
+    inventory = Inventory(
+        int(os.environ.get('FAKE_DOCKER_CONTAINERS', '20')),
+        int(os.environ.get('FAKE_DOCKER_IMAGES', '20')),
+        int(os.environ.get('FAKE_DOCKER_SERVICES', '5')))
+
+    commands = COMPOSE_COMMANDS if binary == 'docker-compose' else DOCKER_COMMANDS
+    # global options with a value
+    while args and args[0] in ('-H', '--host', '-c', '--context', '--config', '-l', '--log-level'):
+        args = args[2:]
+    if args and args[0] == 'compose' and binary == 'docker':
+        binary, commands, args = 'docker compose', COMPOSE_COMMANDS, args[1:]
+        while args and args[0] in ('-f', '--file', '-p', '--project-name', '--profile', '--project-directory', '--env-file'):
+            args = args[2:]
+
+    if args in (['--version'], ['-v']):
+        print('%s version 99.0.0-fake, build 0000000' % binary)
+        return 0
+    if not args or args[0] in ('help', '--help') or '--help' in args:
+        path = tuple(a for a in args if a not in ('help', '--help'))
+        page = help_page(binary, commands, path)
+        if page is None:
+            print('unknown help topic: %s' % ' '.join(path), file=sys.stderr)
+            return 1
+        sys.stdout.write(page)
+        return 0
+
+    if binary != 'docker':
+        if args[:1] == ['config'] and '--services' in args:
+            print('\n'.join(inventory.services))
+            return 0
+    elif args[0] == 'ps' or args[:2] == ['container', 'ls']:
+        lines = ps(inventory, args[1 if args[0] == 'ps' else 2:])
+        print('\n'.join(lines))
+        return 0
+    elif args[0] == 'images' or args[:2] == ['image', 'ls']:
+        lines = images(inventory, args[1 if args[0] == 'images' else 2:])
+        print('\n'.join(lines))
+        return 0
+    elif args[0] == 'inspect' or args[:2] == ['container', 'inspect']:
+        out, errors = inspect(inventory, args[1 if args[0] == 'inspect' else 2:])
+        if out:
+            print('\n'.join(out))
+        for error in errors:
+            print(error, file=sys.stderr)
+        return 1 if errors else 0
+
+    print('fake docker: unsupported command: %s' % ' '.join(args), file=sys.stderr)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,554 +7,653 @@
 # mkdir -p ~/.config/fish/completions
 # cp docker-compose.fish ~/.config/fish/completions
 #
+# Needs fish 3.5 or later, for the path builtin.
+#
 # Completion supported:
 # - parameters
 # - commands
 # - services
 
-function __fish_docker_no_subcommand --description 'Test if docker has yet to be given the subcommand'
-    for i in (commandline -opc)
-        if contains -- $i Run attach bridge build commit config cp create down events exec export images kill logs ls pause port ps publish pull push restart rm run scale start stats stop top unknown unpause up version volumes wait watch
-            return 1
+function __fish_print_docker-compose_services --description 'Print a list of docker-compose services'
+    __fish_docker_compose_services docker-compose
+end
+
+function __fish_docker_compose_services --description 'Print the services of the compose project on the command line'
+    # argv is the compose command, e.g. `docker compose` or `docker-compose`
+    set -l cmd (commandline -opc)
+    set -l i (contains -i -- $argv[-1] $cmd); or return
+    set -l opts
+    set -l files
+    set -l env_files
+    set -l dir
+    set -l option
+    # only the options before the compose subcommand select the project
+    for token in $cmd[(math $i + 1)..-1]
+        if not set -q option[1]
+            switch $token
+                case -f --file --profile --env-file --project-directory
+                    set option $token
+                    continue
+                case '--file=*' '--profile=*' '--env-file=*' '--project-directory=*'
+                    set option (string split -m 1 = -- $token)
+                    set token $option[2]
+                    set option $option[1]
+                case -p --project-name --ansi --progress --parallel
+                    # takes a value that doesn't change the service list
+                    set option skip
+                    continue
+                case '-*'
+                    continue
+                case '*'
+                    break
+            end
+        end
+        switch $option
+            case -f --file
+                set -a files $token
+            case --env-file
+                set -a env_files $token
+            case --project-directory
+                set dir $token
+        end
+        if test $option != skip
+            set -a opts $option $token
         end
+        set option
+    end
+
+    if not set -q files[1]
+        if set -q COMPOSE_FILE[1]
+            set -q COMPOSE_PATH_SEPARATOR[1]; or set -l COMPOSE_PATH_SEPARATOR :
+            set files (string split -- $COMPOSE_PATH_SEPARATOR $COMPOSE_FILE)
+        else
+            # like compose, use the first directory upwards that has a compose file
+            set -l search (path resolve -- $dir .)[1]
+            while true
+                set files (path filter -f -- $search/{compose,docker-compose}{,.override}.{yaml,yml})
+                if set -q files[1]; or test "$search" = /
+                    break
+                end
+                set search (path dirname -- $search)
+            end
+        end
+    end
+    set -q files[1]; or return
+    set files (path resolve -- $files)
+    set -q dir[1]; or set dir (path dirname -- $files[1])
+    set dir (path resolve -- $dir)
+
+    # an entry is reused while every file still has the mtime it had when it was made
+    set -l stamp
+    for file in $files $dir/.env (path resolve -- $env_files)
+        set -a stamp $file (path mtime -- $file; or echo -)
     end
-    return 0
+    set -l var __fish_docker_compose_services_(string escape --style=var -- "$argv $dir $opts $COMPOSE_PROFILES")
+    if not set -q $var; or test "$$var[1][1]" != "$stamp"
+        set -l services ($argv config --services $opts 2>/dev/null); or return
+        set -g $var "$stamp" (path sort -- $services)
+    end
+    string join \n -- $$var[1][2..-1]
+end
+
+function __fish_docker-compose_update_path --description 'Find the docker-compose subcommand path of the command line'
+    set -l cmd (commandline -opc)
+    if test "$cmd" = "$__fish_docker_compose_path_key"; and set -q __fish_docker_compose_path
+        return
+    end
+    set -g __fish_docker_compose_path_key "$cmd"
+    set -g __fish_docker_compose_path
+    for token in $cmd[2..-1]
+        switch "$__fish_docker_compose_path"
+            case ''
+                switch $token
+                    case Run attach bridge build commit config cp create down events exec export images kill logs ls pause port ps publish pull push restart rm run scale start stats stop top unknown unpause up version volumes wait watch
+                        set -a __fish_docker_compose_path $token
+                end
+        end
+    end
+end
+
+function __fish_docker-compose_using --description 'Test if the docker-compose subcommand path is exactly the given one'
+    __fish_docker-compose_update_path
+    test "$__fish_docker_compose_path" = "$argv"
 end
 
-function __fish_print_docker_compose_services --description 'Print a list of docker-compose services'
-    docker-compose config --services ^/dev/null | command sort
+function __fish_docker-compose_no_subcommand --description 'Test if docker-compose has yet to be given the subcommand'
+    __fish_docker-compose_update_path
+    test -z "$__fish_docker_compose_path"
 end
 
 # common options
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -n '__fish_docker_no_subcommand' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -n '__fish_docker-compose_no_subcommand' -s p -l project-name -f -d 'Project name'
 
 # subcommands
 # bridge
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a bridge -d 'Convert compose files into another model'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from bridge' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a bridge -d 'Convert compose files into another model'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using bridge' -s p -l project-name -f -d 'Project name'
 
 # attach
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a attach -d "Attach local standard input, output, and error streams to a service's running container"
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from attach' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a attach -d "Attach local standard input, output, and error streams to a service's running container"
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using attach' -s p -l project-name -f -d 'Project name'
 
 # build
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a build -d 'Build or rebuild services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from build' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a build -d 'Build or rebuild services'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using build' -s p -l project-name -f -d 'Project name'
 
 # commit
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a commit -d "Create a new image from a service container's changes"
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from commit' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a commit -d "Create a new image from a service container's changes"
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using commit' -s p -l project-name -f -d 'Project name'
 
 # config
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a config -d 'Parse, resolve and render compose file in canonical format'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from config' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a config -d 'Parse, resolve and render compose file in canonical format'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using config' -s p -l project-name -f -d 'Project name'
 
 # cp
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a cp -d 'Copy files/folders between a service container and the local filesystem'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from cp' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a cp -d 'Copy files/folders between a service container and the local filesystem'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using cp' -s p -l project-name -f -d 'Project name'
 
 # create
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a create -d 'Creates containers for a service'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from create' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a create -d 'Creates containers for a service'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using create' -s p -l project-name -f -d 'Project name'
 
 # down
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a down -d 'Stop and remove containers, networks'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from down' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a down -d 'Stop and remove containers, networks'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using down' -s p -l project-name -f -d 'Project name'
 
 # events
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a events -d 'Receive real time events from containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from events' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a events -d 'Receive real time events from containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using events' -s p -l project-name -f -d 'Project name'
 
 # exec
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a exec -d 'Execute a command in a running container'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from exec' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a exec -d 'Execute a command in a running container'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using exec' -s p -l project-name -f -d 'Project name'
 
 # export
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a export -d "Export a service container's filesystem as a tar archive"
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from export' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a export -d "Export a service container's filesystem as a tar archive"
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using export' -s p -l project-name -f -d 'Project name'
 
 # images
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a images -d 'List images used by the created containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from images' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a images -d 'List images used by the created containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using images' -s p -l project-name -f -d 'Project name'
 
 # kill
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a kill -d 'Force stop service containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from kill' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a kill -d 'Force stop service containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using kill' -s p -l project-name -f -d 'Project name'
 
 # logs
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a logs -d 'View output from containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from logs' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a logs -d 'View output from containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using logs' -s p -l project-name -f -d 'Project name'
 
 # ls
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a ls -d 'List running compose projects'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ls' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a ls -d 'List running compose projects'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using ls' -s p -l project-name -f -d 'Project name'
 
 # pause
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a pause -d 'Pause services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pause' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a pause -d 'Pause services'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using pause' -s p -l project-name -f -d 'Project name'
 
 # port
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a port -d 'Print the public port for a port binding'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from port' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a port -d 'Print the public port for a port binding'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using port' -s p -l project-name -f -d 'Project name'
 
 # ps
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a ps -d 'List containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from ps' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a ps -d 'List containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using ps' -s p -l project-name -f -d 'Project name'
 
 # publish
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a publish -d 'Publish compose application'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from publish' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a publish -d 'Publish compose application'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using publish' -s p -l project-name -f -d 'Project name'
 
 # pull
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a pull -d 'Pull service images'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from pull' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a pull -d 'Pull service images'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using pull' -s p -l project-name -f -d 'Project name'
 
 # push
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a push -d 'Push service images'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from push' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a push -d 'Push service images'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using push' -s p -l project-name -f -d 'Project name'
 
 # restart
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a restart -d 'Restart service containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from restart' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a restart -d 'Restart service containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using restart' -s p -l project-name -f -d 'Project name'
 
 # rm
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a rm -d 'Removes stopped service containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from rm' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a rm -d 'Removes stopped service containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using rm' -s p -l project-name -f -d 'Project name'
 
 # run
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a run -d 'Run a one-off command on a service'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from run' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a run -d 'Run a one-off command on a service'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using run' -s p -l project-name -f -d 'Project name'
 
 # scale
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a scale -d 'Scale services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from scale' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a scale -d 'Scale services'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using scale' -s p -l project-name -f -d 'Project name'
 
 # start
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a start -d 'Start services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from start' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a start -d 'Start services'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using start' -s p -l project-name -f -d 'Project name'
 
 # stats
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a stats -d 'Display a live stream of container(s) resource usage statistics'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stats' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a stats -d 'Display a live stream of container(s) resource usage statistics'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using stats' -s p -l project-name -f -d 'Project name'
 
 # stop
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a stop -d 'Stop services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from stop' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a stop -d 'Stop services'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using stop' -s p -l project-name -f -d 'Project name'
 
 # top
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a top -d 'Display the running processes'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from top' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a top -d 'Display the running processes'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using top' -s p -l project-name -f -d 'Project name'
 
 # unpause
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a unpause -d 'Unpause services'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unpause' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a unpause -d 'Unpause services'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using unpause' -s p -l project-name -f -d 'Project name'
 
 # up
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a up -d 'Create and start containers'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from up' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a up -d 'Create and start containers'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using up' -s p -l project-name -f -d 'Project name'
 
 # version
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a version -d 'Show the Docker Compose version information'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from version' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a version -d 'Show the Docker Compose version information'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using version' -s p -l project-name -f -d 'Project name'
 
 # volumes
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a volumes -d 'List volumes'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from volumes' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a volumes -d 'List volumes'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using volumes' -s p -l project-name -f -d 'Project name'
 
 # wait
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a wait -d 'Block until containers of all (or specified) services stop.'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from wait' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a wait -d 'Block until containers of all (or specified) services stop.'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using wait' -s p -l project-name -f -d 'Project name'
 
 # watch
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a watch -d 'Watch build context for service and rebuild/refresh containers when files are updated'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from watch' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a watch -d 'Watch build context for service and rebuild/refresh containers when files are updated'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using watch' -s p -l project-name -f -d 'Project name'
 
 # Run
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a Run -d "'docker compose COMMAND --help' for more information on a command."
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from Run' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a Run -d "'docker compose COMMAND --help' for more information on a command."
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using Run' -s p -l project-name -f -d 'Project name'
 
 # unknown
-complete -c docker-compose -f -n '__fish_docker_no_subcommand' -a unknown -d 'docker command: "compose help"'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l all-resources -f -d 'Include all resources, even those not'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l ansi -f -d 'Control when to print ANSI control'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l compatibility -f -d 'Run compose in backward compatibility mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l dry-run -f -d 'Execute command in dry run mode'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l env-file -f -d 'Specify an alternate environment file'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -s f -l file -f -d 'Compose configuration files'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l parallel -f -d 'Control max parallelism, -1 for'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l profile -f -d 'Specify a profile to enable'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l progress -f -d 'Set type of progress output (auto,'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -l project-directory -f -d 'Specify an alternate working directory'
-complete -c docker-compose -A -n '__fish_seen_subcommand_from unknown' -s p -l project-name -f -d 'Project name'
+complete -c docker-compose -f -n '__fish_docker-compose_no_subcommand' -a unknown -d 'docker command: "compose help"'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l all-resources -f -d 'Include all resources, even those not'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l ansi -f -d 'Control when to print ANSI control'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l compatibility -f -d 'Run compose in backward compatibility mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l dry-run -f -d 'Execute command in dry run mode'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l env-file -f -d 'Specify an alternate environment file'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -s f -l file -f -d 'Compose configuration files'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l parallel -f -d 'Control max parallelism, -1 for'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l profile -f -d 'Specify a profile to enable'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l progress -f -d 'Set type of progress output (auto,'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -l project-directory -f -d 'Specify an alternate working directory'
+complete -c docker-compose -A -n '__fish_docker-compose_using unknown' -s p -l project-name -f -d 'Project name'
 
 
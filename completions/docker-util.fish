@@ -2,22 +2,32 @@
 
 # Helper: list running docker containers (self-contained, doesn't depend on docker.fish)
 function __fish_docker_util_print_containers
-    docker ps --no-trunc --filter status=running --format '{{.ID}}\n{{.Names}}' 2>/dev/null | tr ',' '\n'
+    if set -q fish_docker_api_helper[1]
+        $fish_docker_api_helper containers running 2>/dev/null
+        and return
+    end
+    docker ps --filter status=running --format '{{.ID}}\n{{.Names}}' 2>/dev/null | string split ,
 end
 
 # Helper: check if no subcommand given yet
 function __fish_docker_util_no_subcommand
-    not __fish_seen_subcommand_from nsenter get-veth get-ip
+    not __fish_seen_subcommand_from nsenter nsenter-all get-veth get-ip watch-veth watch-ip
 end
 
-# Helper: check if get-veth subcommand is active
+# Helper: check if get-veth or watch-veth subcommand is active
 function __fish_docker_util_using_get_veth
-    __fish_seen_subcommand_from get-veth
+    __fish_seen_subcommand_from get-veth watch-veth
 end
 
-# Helper: check if get-ip subcommand is active
+# Helper: check if get-ip or watch-ip subcommand is active
 function __fish_docker_util_using_get_ip
-    __fish_seen_subcommand_from get-ip
+    __fish_seen_subcommand_from get-ip watch-ip
+end
+
+# Helper: check if nsenter-all options are expected (before --)
+function __fish_docker_util_nsenter_all_needs_option
+    set -l cmd (commandline -opc)
+    contains nsenter-all $cmd; and not contains -- -- $cmd
 end
 
 # Helper: check if -- has been seen (for nsenter container completion)
@@ -35,14 +45,21 @@ end
 
 # Subcommand completion
 complete -c docker-util -f -n __fish_docker_util_no_subcommand -a nsenter -d 'Enter container namespace with nsenter'
+complete -c docker-util -f -n __fish_docker_util_no_subcommand -a nsenter-all -d 'Run a command in the namespaces of many containers'
 complete -c docker-util -f -n __fish_docker_util_no_subcommand -a get-veth -d 'Get veth interface names for containers'
 complete -c docker-util -f -n __fish_docker_util_no_subcommand -a get-ip -d 'Get IP addresses for containers'
+complete -c docker-util -f -n __fish_docker_util_no_subcommand -a watch-veth -d 'Stream veth changes as containers come and go'
+complete -c docker-util -f -n __fish_docker_util_no_subcommand -a watch-ip -d 'Stream IP address changes as containers come and go'
 
 # Container completion for nsenter (after --)
 complete -c docker-util -f -n __fish_docker_util_nsenter_needs_container -a '(__fish_docker_util_print_containers)' -d "Container"
 
-# Container completion for get-veth
+# Options for nsenter-all (before --)
+complete -c docker-util -f -n __fish_docker_util_nsenter_all_needs_option -s j -l jobs -x -d 'Number of containers to run at once (default 8)'
+complete -c docker-util -f -n __fish_docker_util_nsenter_all_needs_option -l container -x -a '(__fish_docker_util_print_containers)' -d 'Only this container (repeatable)'
+
+# Container completion for get-veth and watch-veth
 complete -c docker-util -f -n __fish_docker_util_using_get_veth -a '(__fish_docker_util_print_containers)' -d "Container"
 
-# Container completion for get-ip
+# Container completion for get-ip and watch-ip
 complete -c docker-util -f -n __fish_docker_util_using_get_ip -a '(__fish_docker_util_print_containers)' -d "Container"
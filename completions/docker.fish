@@ -7,6 +7,8 @@
 # mkdir -p ~/.config/fish/completions
 # cp docker.fish ~/.config/fish/completions
 #
+# Needs fish 3.5 or later, for the path builtin.
+#
 # Completion supported:
 # - parameters
 # - commands
@@ -14,32 +16,411 @@
 # - images
 # - repositories
 
-function __fish_docker_no_subcommand --description 'Test if docker has yet to be given the subcommand'
-    for i in (commandline -opc)
-        if contains -- $i compose attach bake build builder commit container context cp create diff events exec export history image images import info inspect kill load login logout logs manifest network pause plugin port ps pull push rename restart rm rmi run save search start stats stop swarm system tag top unpause update version volume wait
-            return 1
+function __fish_docker_context --description 'Print the docker host or context that completions are for, fail if it is the local daemon'
+    if set -q DOCKER_HOST[1]
+        echo $DOCKER_HOST
+        not string match -q -- 'unix://*' $DOCKER_HOST
+        return
+    end
+    set -l config_dir ~/.docker
+    set -q DOCKER_CONFIG[1]; and set config_dir $DOCKER_CONFIG
+    set -l context $DOCKER_CONTEXT
+    if not set -q context[1]; and test -r $config_dir/config.json
+        set context (string replace -rf -- '.*"currentContext"\s*:\s*"([^"]*)".*' '$1' < $config_dir/config.json)
+    end
+    if test -z "$context"; or test "$context" = default
+        echo default
+        return 1
+    end
+    echo $context
+    # a context is remote when its docker endpoint is, whatever it is called
+    set -l name (string escape --style=regex -- $context)
+    for meta in $config_dir/contexts/meta/*/meta.json
+        read -z -l json < $meta
+        if string match -qr -- '"Name"\s*:\s*"'$name'"' "$json"
+            set -l host (string replace -rf -- '(?s).*"docker"\s*:\s*\{[^}]*"Host"\s*:\s*"([^"]*)".*' '$1' "$json")
+            string match -qr -- '^(tcp|ssh|https?)://' "$host"
+            return
+        end
+    end
+    return 1
+end
+
+function __fish_docker_cached --description 'List docker containers or images, reusing the output for fish_docker_cache_ttl seconds' -a resource select prefix
+    set -q fish_docker_cache_ttl; or set -l fish_docker_cache_ttl 10
+    set -l context (__fish_docker_context)
+    set -l remote (test $status -eq 0; and echo 1)
+    if test "$fish_docker_cache_ttl" -le 0
+        __fish_docker_query $resource $select $prefix
+        return
+    end
+    set -q __fish_docker_cache_gen; or set -g __fish_docker_cache_gen 0
+
+    # A list cached for a shorter prefix, or for none, already holds every
+    # match, so typing on only filters it the way docker would have. Short IDs
+    # can't be filtered by a prefix longer than they are, and containers are
+    # listed by ID too until there is a prefix.
+    set -l shortest 0
+    set -l escaped (string escape --style=regex -- "$prefix")
+    set -l match '^'$escaped'.*'
+    switch $resource
+        case containers
+            test -n "$prefix"; and set shortest 1
+            set match '^(?:[^,]*,)*'$escaped'.*'
+        case container-ids
+            test (string length -- "$prefix") -gt 12; and set shortest 13
+        case images
+            # unnamed images never match a reference filter, image-ids lists them
+            test -n "$prefix"; and set match '^'$escaped'[^\t]*$'
+    end
+    set -l length (string length -- "$prefix")
+    while test $length -ge $shortest
+        set -l cached ''
+        test $length -gt 0; and set cached (string sub -l $length -- $prefix)
+        set -l key (string escape --style=var -- "$context $resource $select $cached")
+        if set -q remote[1]
+            # Remote engines are cached in files, so that a refresh running in the
+            # background can update them: a stale list is shown straight away.
+            set -l file (__fish_docker_cache_dir)/$key
+            if test -f $file
+                read -z -l lines < $file
+                set -l output (string split -n \n -- "$lines")
+                if test (path mtime -R -- $file) -ge $fish_docker_cache_ttl
+                    __fish_docker_refresh $file $resource $select $cached
+                end
+                set -q output[1]; and string match -r -- $match $output
+                return 0
+            end
+        else
+            set -l var __fish_docker_cache_entry_$key
+            if set -q $var
+                # entry: command line generation, timestamp, output lines
+                set -l entry $$var
+                if test "$entry[1]" = $__fish_docker_cache_gen; or test (math (__fish_docker_now) - $entry[2]) -lt $fish_docker_cache_ttl
+                    set -q entry[3]; and string match -r -- $match $entry[3..-1]
+                    return 0
+                end
+            end
+        end
+        set length (math $length - 1)
+    end
+
+    set -l key (string escape --style=var -- "$context $resource $select $prefix")
+    set -l output (__fish_docker_query $resource $select $prefix)
+    set -l query_status $status
+    if set -q remote[1]
+        test $query_status -eq 0; or return $query_status
+        set -l dir (__fish_docker_cache_dir)
+        # past 64 files, listings older than the TTL go
+        set -l files $dir/*
+        if test (count $files) -gt 64
+            set -l stale
+            for file in $files
+                test (path mtime -R -- $file) -lt $fish_docker_cache_ttl; or set -a stale $file
+            end
+            set -q stale[1]; and command rm -f -- $stale
+        end
+        printf '%s\n' $output > $dir/$key
+    else
+        set -g __fish_docker_cache_entry_$key $__fish_docker_cache_gen (__fish_docker_now) $output
+    end
+    # docker's filters are looser than a prefix, e.g. id= matches anywhere in the ID
+    set -q output[1]; and string match -r -- $match $output
+    return 0
+end
+
+function __fish_docker_cache_dir --description 'Print the directory that keeps cached docker listings and the clock'
+    set -l dir ~/.cache/fish-docker/runtime
+    set -q XDG_CACHE_HOME[1]; and set dir $XDG_CACHE_HOME/fish-docker/runtime
+    path is -d -- $dir; or command mkdir -p -- $dir
+    echo $dir
+end
+
+function __fish_docker_now --description 'Print the current time in seconds, without starting date'
+    set -l clock (__fish_docker_cache_dir)/clock
+    true > $clock
+    path mtime -- $clock
+end
+
+function __fish_docker_refresh --description 'Refresh a cached docker listing in the background' -a file resource select prefix
+    set -q fish_docker_timeout; or set -l fish_docker_timeout 3
+    # one refresh at a time; a lock older than the timeout was left by one that died
+    if test -f $file.lock; and test (path mtime -R -- $file.lock) -le $fish_docker_timeout
+        return
+    end
+    true > $file.lock
+    set -l cmd (__fish_docker_timeout) (__fish_docker_list_command $resource $select $prefix)
+    command sh -c 'f=$1; shift; "$@" > "$f.$$" 2>/dev/null && mv "$f.$$" "$f"; rm -f "$f.$$" "$f.lock"' sh $file $cmd </dev/null >/dev/null 2>&1 &
+    disown
+end
+
+function __fish_docker_cache_invalidate --on-event fish_preexec --description 'Expire cached docker listings'
+    # TABs within one command line always reuse the cache, afterwards the TTL applies
+    set -q __fish_docker_cache_gen; or set -g __fish_docker_cache_gen 0
+    set -g __fish_docker_cache_gen (math $__fish_docker_cache_gen + 1)
+    set -l entries (set -n | string match '__fish_docker_cache_entry_*')
+    set -l tokens (string split -n ' ' -- $argv[1])
+    if contains -- docker $tokens
+        for token in $tokens
+            if contains -- $token build commit compose create down import kill load prune pull rename restart rm rmi run start stop tag up
+                set -q entries[1]; and set -e $entries
+                if __fish_docker_context >/dev/null
+                    set -l files (__fish_docker_cache_dir)/*
+                    set -q files[1]; and command rm -f -- $files
+                end
+                return
+            end
+        end
+    end
+    # one entry is left per prefix typed; drop the ones the TTL has run out on
+    if set -q entries[1]
+        set -q fish_docker_cache_ttl; or set -l fish_docker_cache_ttl 10
+        set -l now (__fish_docker_now)
+        for var in $entries
+            set -l entry $$var
+            test (math $now - $entry[2]) -lt $fish_docker_cache_ttl; or set -e $var
         end
     end
+end
+
+function __fish_docker_timeout --description 'Print the command prefix that bounds a docker call by fish_docker_timeout seconds, one argument per line'
+    set -q fish_docker_timeout; or set -l fish_docker_timeout 3
+    command -q timeout; and printf '%s\n' timeout $fish_docker_timeout
+end
+
+function __fish_docker_list_command --description 'Print the docker command that lists containers or images, one argument per line' -a resource select prefix
+    # a prefix is pushed down into docker filters, so only matches are sent back
+    switch $resource
+        case containers container-ids
+            set -l cmd docker ps
+            switch $select
+                case running
+                    set -a cmd --filter status=running
+                case stopped
+                    set -a cmd --filter status=exited --filter status=created
+                case all
+                    set -a cmd --all
+            end
+            if test $resource = container-ids
+                # the id filter matches anywhere in the ID, __fish_docker_cached keeps the
+                # ones that start with prefix; short IDs can't start with a longer one
+                set -a cmd --filter id=$prefix --format '{{.ID}}'
+                test (string length -- "$prefix") -gt 12; and set -a cmd --no-trunc
+            else if test -n "$prefix"
+                set -a cmd --filter 'name=^/?'(string escape --style=regex -- $prefix) --format '{{.Names}}'
+            else
+                set -a cmd --format '{{.ID}}\n{{.Names}}'
+            end
+            printf '%s\n' $cmd
+        case image-ids
+            # images have no id filter; only unnamed ones are completed by ID
+            printf '%s\n' docker images --filter dangling=true --format '{{.ID}}\tUnnamed Image'
+        case images repositories
+            set -l cmd docker images
+            if test $resource = repositories
+                set -a cmd --format '{{.Repository}}'
+            else
+                set -a cmd --format '{{if eq .Repository "<none>"}}{{.ID}}\tUnnamed Image{{else}}{{.Repository}}:{{.Tag}}{{end}}'
+            end
+            # '*' doesn't match '/' in reference filters
+            if test -n "$prefix"
+                for pattern in $prefix\* $prefix\*/\* $prefix\*/\*/\*
+                    set -a cmd --filter reference=$pattern
+                end
+            end
+            printf '%s\n' $cmd
+    end
+end
+
+function __fish_docker_query --description 'List docker containers or images, through fish_docker_api_helper when it is set' -a resource select prefix
+    set -l context (__fish_docker_context)
+    if test $status -eq 0
+        # remote engine: never let an unreachable one hang the shell
+        set -l cmd (__fish_docker_timeout) (__fish_docker_list_command $resource $select $prefix)
+        $cmd
+        return
+    end
+    # the helper only knows DOCKER_HOST and the default socket, not other local contexts
+    if set -q fish_docker_api_helper[1]; and contains -- "$context" default $DOCKER_HOST
+        $fish_docker_api_helper $resource $select --prefix "$prefix" 2>/dev/null
+        and return
+    end
+    set -l cmd (__fish_docker_list_command $resource $select $prefix)
+    $cmd
+end
+
+function __fish_docker_token --description 'Print the token being completed if it can narrow down a docker listing, fail if nothing can match it'
+    set -l token (commandline -ct)
+    # options are completed elsewhere, and docker names never start with a dash
+    string match -q -- '-*' $token; and return 1
+    # quoted or escaped tokens are left to fish to match
+    string match -qr -- '^[\w.:/@-]+$' $token; and echo $token
     return 0
 end
 
 function __fish_print_docker_containers --description 'Print a list of docker containers' -a select
-    switch $select
-        case running
-            docker ps --no-trunc --filter status=running --format '{{.ID}}\n{{.Names}}' | tr ',' '\n'
-        case stopped
-            docker ps --no-trunc --filter status=exited --filter status=created --format '{{.ID}}\n{{.Names}}' | tr ',' '\n'
-        case all
-            docker ps --no-trunc --all --format '{{.ID}}\n{{.Names}}' | tr ',' '\n'
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached containers $select $prefix | string split ,)
+    if string match -qr -- '^[0-9a-f]+$' "$prefix"
+        set -a candidates (__fish_docker_cached container-ids $select $prefix)
     end
+    string join \n -- $candidates[1..$fish_docker_max_candidates]
 end
 
 function __fish_print_docker_images --description 'Print a list of docker images'
-    docker images --format '{{if eq .Repository "<none>"}}{{.ID}}\tUnnamed Image{{else}}{{.Repository}}:{{.Tag}}{{end}}'
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached images all $prefix)
+    if string match -qr -- '^[0-9a-f]+$' "$prefix"
+        set -a candidates (__fish_docker_cached image-ids all $prefix)
+    end
+    string join \n -- $candidates[1..$fish_docker_max_candidates]
 end
 
 function __fish_print_docker_repositories --description 'Print a list of docker repositories'
-    docker images --format '{{.Repository}}' | command grep -v '<none>' | command sort | command uniq
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached repositories all $prefix | string match -v '<none>' | path sort -u)
+    string join \n -- $candidates[1..$fish_docker_max_candidates]
+end
+
+function __fish_print_docker_compose_services --description 'Print a list of docker compose services'
+    __fish_docker_compose_services docker compose
+end
+
+function __fish_docker_compose_services --description 'Print the services of the compose project on the command line'
+    # argv is the compose command, e.g. `docker compose` or `docker-compose`
+    set -l cmd (commandline -opc)
+    set -l i (contains -i -- $argv[-1] $cmd); or return
+    set -l opts
+    set -l files
+    set -l env_files
+    set -l dir
+    set -l option
+    # only the options before the compose subcommand select the project
+    for token in $cmd[(math $i + 1)..-1]
+        if not set -q option[1]
+            switch $token
+                case -f --file --profile --env-file --project-directory
+                    set option $token
+                    continue
+                case '--file=*' '--profile=*' '--env-file=*' '--project-directory=*'
+                    set option (string split -m 1 = -- $token)
+                    set token $option[2]
+                    set option $option[1]
+                case -p --project-name --ansi --progress --parallel
+                    # takes a value that doesn't change the service list
+                    set option skip
+                    continue
+                case '-*'
+                    continue
+                case '*'
+                    break
+            end
+        end
+        switch $option
+            case -f --file
+                set -a files $token
+            case --env-file
+                set -a env_files $token
+            case --project-directory
+                set dir $token
+        end
+        if test $option != skip
+            set -a opts $option $token
+        end
+        set option
+    end
+
+    if not set -q files[1]
+        if set -q COMPOSE_FILE[1]
+            set -q COMPOSE_PATH_SEPARATOR[1]; or set -l COMPOSE_PATH_SEPARATOR :
+            set files (string split -- $COMPOSE_PATH_SEPARATOR $COMPOSE_FILE)
+        else
+            # like compose, use the first directory upwards that has a compose file
+            set -l search (path resolve -- $dir .)[1]
+            while true
+                set files (path filter -f -- $search/{compose,docker-compose}{,.override}.{yaml,yml})
+                if set -q files[1]; or test "$search" = /
+                    break
+                end
+                set search (path dirname -- $search)
+            end
+        end
+    end
+    set -q files[1]; or return
+    set files (path resolve -- $files)
+    set -q dir[1]; or set dir (path dirname -- $files[1])
+    set dir (path resolve -- $dir)
+
+    # an entry is reused while every file still has the mtime it had when it was made
+    set -l stamp
+    for file in $files $dir/.env (path resolve -- $env_files)
+        set -a stamp $file (path mtime -- $file; or echo -)
+    end
+    set -l var __fish_docker_compose_services_(string escape --style=var -- "$argv $dir $opts $COMPOSE_PROFILES")
+    if not set -q $var; or test "$$var[1][1]" != "$stamp"
+        set -l services ($argv config --services $opts 2>/dev/null); or return
+        set -g $var "$stamp" (path sort -- $services)
+    end
+    string join \n -- $$var[1][2..-1]
+end
+
+function __fish_docker_update_path --description 'Find the docker subcommand path of the command line'
+    set -l cmd (commandline -opc)
+    if test "$cmd" = "$__fish_docker_path_key"; and set -q __fish_docker_path
+        return
+    end
+    set -g __fish_docker_path_key "$cmd"
+    set -g __fish_docker_path
+    for token in $cmd[2..-1]
+        switch "$__fish_docker_path"
+            case ''
+                switch $token
+                    case attach bake build builder commit compose container context cp create diff events exec export history image images import info inspect kill load login logout logs manifest network pause plugin port ps pull push rename restart rm rmi run save search start stats stop swarm system tag top unpause update version volume wait
+                        set -a __fish_docker_path $token
+                end
+            case 'container'
+                switch $token
+                    case attach commit cp create diff exec export kill logs ls pause port rename restart rm run start stats stop top unpause update wait
+                        set -a __fish_docker_path $token
+                    case bake build builder context events history images import info inspect load login logout manifest network plugin ps pull push rmi save search swarm tag version volume
+                        set __fish_docker_path $token
+                end
+            case 'image'
+                switch $token
+                    case history import load ls pull push rm save tag
+                        set -a __fish_docker_path $token
+                    case attach bake build builder commit context cp create diff events exec export images info inspect kill login logout logs manifest network pause plugin port ps rename restart rmi run search start stats stop swarm top unpause update version volume wait
+                        set __fish_docker_path $token
+                end
+            case 'system'
+                switch $token
+                    case events info
+                        set -a __fish_docker_path $token
+                    case attach bake build builder commit context cp create diff exec export history images import inspect kill load login logout logs manifest network pause plugin port ps pull push rename restart rm rmi run save search start stats stop swarm tag top unpause update version volume wait
+                        set __fish_docker_path $token
+                end
+            case 'compose'
+                switch $token
+                    case attach build commit config cp create down events exec export images kill logs ls pause port ps publish pull push restart rm run scale start stats stop top unpause up version volumes wait watch
+                        set -a __fish_docker_path $token
+                    case bake builder context diff history import info inspect load login logout manifest network plugin rename rmi save search swarm tag update volume
+                        set __fish_docker_path $token
+                end
+        end
+    end
+end
+
+function __fish_docker_using --description 'Test if the docker subcommand path is exactly the given one'
+    __fish_docker_update_path
+    test "$__fish_docker_path" = "$argv"
+end
+
+function __fish_docker_no_subcommand --description 'Test if docker has yet to be given the subcommand'
+    __fish_docker_update_path
+    test -z "$__fish_docker_path"
 end
 
 # common options
@@ -58,214 +439,214 @@ complete -c docker -n '__fish_docker_no_subcommand' -s v -l version -f -d 'Print
 # subcommands
 # run
 complete -c docker -f -n '__fish_docker_no_subcommand' -a run -d 'Create and run a new container from an image'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l add-host -f -d 'Add a custom host-to-IP mapping'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l annotation -f -d 'Add an annotation to the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l blkio-weight -f -d 'Block IO (relative weight),'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l blkio-weight-device -f -d 'Block IO weight (relative device'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cap-add -f -d 'Add Linux capabilities'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cap-drop -f -d 'Drop Linux capabilities'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cgroup-parent -f -d 'Optional parent cgroup for the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cgroupns -f -d 'Cgroup namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cidfile -f -d 'Write the container ID to the file'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpus -f -d 'Number of CPUs'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l cpuset-mems -f -d 'MEMs in which to allow execution'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s d -l detach -f -d 'Run container in background and'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l detach-keys -f -d 'Override the key sequence for'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device -f -d 'Add a host device to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device-read-bps -f -d 'Limit read rate (bytes per'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device-read-iops -f -d 'Limit read rate (IO per second)'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device-write-bps -f -d 'Limit write rate (bytes per'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l device-write-iops -f -d 'Limit write rate (IO per second)'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l dns -f -d 'Set custom DNS servers'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l dns-option -f -d 'Set DNS options'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l dns-search -f -d 'Set custom DNS search domains'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l domainname -f -d 'Container NIS domain name'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l env-file -f -d 'Read in a file of environment'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l expose -f -d 'Expose a port or a range of ports'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l gpus -f -d 'GPU devices to add to the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l group-add -f -d 'Add additional groups to join'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-cmd -f -d 'Command to run to check health'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-interval -f -d 'Time between running the check'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-retries -f -d 'Consecutive failures needed to'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-start-interval -f -d 'Time between running the check'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-start-period -f -d 'Start period for the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l health-timeout -f -d 'Maximum time to allow one check'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l help -f -d 'Print usage'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s h -l hostname -f -d 'Container host name'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l init -f -d 'Run an init inside the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l ipc -f -d 'IPC mode to use'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l isolation -f -d 'Container isolation technology'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s l -l label -f -d 'Set meta data on a container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l label-file -f -d 'Read in a line delimited file of'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l link -f -d 'Add link to another container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l log-driver -f -d 'Logging driver for the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l log-opt -f -d 'Log driver options'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l mac-address -f -d 'Container MAC address (e.g.,'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s m -l memory -f -d 'Memory limit'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l memory-reservation -f -d 'Memory soft limit'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l memory-swap -f -d 'Swap limit equal to memory plus'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l memory-swappiness -f -d 'Tune container memory swappiness'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l mount -f -d 'Attach a filesystem mount to the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l name -f -d 'Assign a name to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l network -f -d 'Connect a container to a network'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l network-alias -f -d 'Add network-scoped alias for the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l no-healthcheck -f -d 'Disable any container-specified'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l oom-kill-disable -f -d 'Disable OOM Killer'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l oom-score-adj -f -d "Tune host's OOM preferences"
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l pid -f -d 'PID namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l pids-limit -f -d 'Tune container pids limit (set'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l platform -f -d 'Set platform if server is'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l privileged -f -d 'Give extended privileges to this'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s p -l publish -f -d "Publish a container's port(s) to"
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s P -l publish-all -f -d 'Publish all exposed ports to'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l pull -f -d 'Pull image before running'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s q -l quiet -f -d 'Suppress the pull output'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l read-only -f -d "Mount the container's root"
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l restart -f -d 'Restart policy to apply when a'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l rm -f -d 'Automatically remove the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l runtime -f -d 'Runtime to use for this container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l security-opt -f -d 'Security Options'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l shm-size -f -d 'Size of /dev/shm'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l sig-proxy -f -d 'Proxy received signals to the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l stop-signal -f -d 'Signal to stop the container'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l storage-opt -f -d 'Storage driver options for the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l sysctl -f -d 'Sysctl options (default map[])'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l tmpfs -f -d 'Mount a tmpfs directory'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s t -l tty -f -d 'Allocate a pseudo-TTY'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l ulimit -f -d 'Ulimit options (default [])'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l use-api-socket -f -d 'Bind mount Docker API socket and'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s u -l user -f -d 'Username or UID (format:'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l userns -f -d 'User namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l uts -f -d 'UTS namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s v -l volume -f -d 'Bind mount a volume'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l volume-driver -f -d 'Optional volume driver for the'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -l volumes-from -f -d 'Mount volumes from the specified'
-complete -c docker -A -n '__fish_seen_subcommand_from run' -s w -l workdir -f -d 'Working directory inside the'
-complete -c docker -A -f -n '__fish_seen_subcommand_from run' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -n '__fish_docker_using run' -l add-host -f -d 'Add a custom host-to-IP mapping'
+complete -c docker -A -n '__fish_docker_using run' -l annotation -f -d 'Add an annotation to the'
+complete -c docker -A -n '__fish_docker_using run' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
+complete -c docker -A -n '__fish_docker_using run' -l blkio-weight -f -d 'Block IO (relative weight),'
+complete -c docker -A -n '__fish_docker_using run' -l blkio-weight-device -f -d 'Block IO weight (relative device'
+complete -c docker -A -n '__fish_docker_using run' -l cap-add -f -d 'Add Linux capabilities'
+complete -c docker -A -n '__fish_docker_using run' -l cap-drop -f -d 'Drop Linux capabilities'
+complete -c docker -A -n '__fish_docker_using run' -l cgroup-parent -f -d 'Optional parent cgroup for the'
+complete -c docker -A -n '__fish_docker_using run' -l cgroupns -f -d 'Cgroup namespace to use'
+complete -c docker -A -n '__fish_docker_using run' -l cidfile -f -d 'Write the container ID to the file'
+complete -c docker -A -n '__fish_docker_using run' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using run' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using run' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using run' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using run' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using run' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using run' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using run' -l cpuset-mems -f -d 'MEMs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using run' -s d -l detach -f -d 'Run container in background and'
+complete -c docker -A -n '__fish_docker_using run' -l detach-keys -f -d 'Override the key sequence for'
+complete -c docker -A -n '__fish_docker_using run' -l device -f -d 'Add a host device to the container'
+complete -c docker -A -n '__fish_docker_using run' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
+complete -c docker -A -n '__fish_docker_using run' -l device-read-bps -f -d 'Limit read rate (bytes per'
+complete -c docker -A -n '__fish_docker_using run' -l device-read-iops -f -d 'Limit read rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using run' -l device-write-bps -f -d 'Limit write rate (bytes per'
+complete -c docker -A -n '__fish_docker_using run' -l device-write-iops -f -d 'Limit write rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using run' -l dns -f -d 'Set custom DNS servers'
+complete -c docker -A -n '__fish_docker_using run' -l dns-option -f -d 'Set DNS options'
+complete -c docker -A -n '__fish_docker_using run' -l dns-search -f -d 'Set custom DNS search domains'
+complete -c docker -A -n '__fish_docker_using run' -l domainname -f -d 'Container NIS domain name'
+complete -c docker -A -n '__fish_docker_using run' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
+complete -c docker -A -n '__fish_docker_using run' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using run' -l env-file -f -d 'Read in a file of environment'
+complete -c docker -A -n '__fish_docker_using run' -l expose -f -d 'Expose a port or a range of ports'
+complete -c docker -A -n '__fish_docker_using run' -l gpus -f -d 'GPU devices to add to the'
+complete -c docker -A -n '__fish_docker_using run' -l group-add -f -d 'Add additional groups to join'
+complete -c docker -A -n '__fish_docker_using run' -l health-cmd -f -d 'Command to run to check health'
+complete -c docker -A -n '__fish_docker_using run' -l health-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using run' -l health-retries -f -d 'Consecutive failures needed to'
+complete -c docker -A -n '__fish_docker_using run' -l health-start-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using run' -l health-start-period -f -d 'Start period for the container'
+complete -c docker -A -n '__fish_docker_using run' -l health-timeout -f -d 'Maximum time to allow one check'
+complete -c docker -A -n '__fish_docker_using run' -l help -f -d 'Print usage'
+complete -c docker -A -n '__fish_docker_using run' -s h -l hostname -f -d 'Container host name'
+complete -c docker -A -n '__fish_docker_using run' -l init -f -d 'Run an init inside the container'
+complete -c docker -A -n '__fish_docker_using run' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using run' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
+complete -c docker -A -n '__fish_docker_using run' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
+complete -c docker -A -n '__fish_docker_using run' -l ipc -f -d 'IPC mode to use'
+complete -c docker -A -n '__fish_docker_using run' -l isolation -f -d 'Container isolation technology'
+complete -c docker -A -n '__fish_docker_using run' -s l -l label -f -d 'Set meta data on a container'
+complete -c docker -A -n '__fish_docker_using run' -l label-file -f -d 'Read in a line delimited file of'
+complete -c docker -A -n '__fish_docker_using run' -l link -f -d 'Add link to another container'
+complete -c docker -A -n '__fish_docker_using run' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
+complete -c docker -A -n '__fish_docker_using run' -l log-driver -f -d 'Logging driver for the container'
+complete -c docker -A -n '__fish_docker_using run' -l log-opt -f -d 'Log driver options'
+complete -c docker -A -n '__fish_docker_using run' -l mac-address -f -d 'Container MAC address (e.g.,'
+complete -c docker -A -n '__fish_docker_using run' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using run' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using run' -l memory-swap -f -d 'Swap limit equal to memory plus'
+complete -c docker -A -n '__fish_docker_using run' -l memory-swappiness -f -d 'Tune container memory swappiness'
+complete -c docker -A -n '__fish_docker_using run' -l mount -f -d 'Attach a filesystem mount to the'
+complete -c docker -A -n '__fish_docker_using run' -l name -f -d 'Assign a name to the container'
+complete -c docker -A -n '__fish_docker_using run' -l network -f -d 'Connect a container to a network'
+complete -c docker -A -n '__fish_docker_using run' -l network-alias -f -d 'Add network-scoped alias for the'
+complete -c docker -A -n '__fish_docker_using run' -l no-healthcheck -f -d 'Disable any container-specified'
+complete -c docker -A -n '__fish_docker_using run' -l oom-kill-disable -f -d 'Disable OOM Killer'
+complete -c docker -A -n '__fish_docker_using run' -l oom-score-adj -f -d "Tune host's OOM preferences"
+complete -c docker -A -n '__fish_docker_using run' -l pid -f -d 'PID namespace to use'
+complete -c docker -A -n '__fish_docker_using run' -l pids-limit -f -d 'Tune container pids limit (set'
+complete -c docker -A -n '__fish_docker_using run' -l platform -f -d 'Set platform if server is'
+complete -c docker -A -n '__fish_docker_using run' -l privileged -f -d 'Give extended privileges to this'
+complete -c docker -A -n '__fish_docker_using run' -s p -l publish -f -d "Publish a container's port(s) to"
+complete -c docker -A -n '__fish_docker_using run' -s P -l publish-all -f -d 'Publish all exposed ports to'
+complete -c docker -A -n '__fish_docker_using run' -l pull -f -d 'Pull image before running'
+complete -c docker -A -n '__fish_docker_using run' -s q -l quiet -f -d 'Suppress the pull output'
+complete -c docker -A -n '__fish_docker_using run' -l read-only -f -d "Mount the container's root"
+complete -c docker -A -n '__fish_docker_using run' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -n '__fish_docker_using run' -l rm -f -d 'Automatically remove the'
+complete -c docker -A -n '__fish_docker_using run' -l runtime -f -d 'Runtime to use for this container'
+complete -c docker -A -n '__fish_docker_using run' -l security-opt -f -d 'Security Options'
+complete -c docker -A -n '__fish_docker_using run' -l shm-size -f -d 'Size of /dev/shm'
+complete -c docker -A -n '__fish_docker_using run' -l sig-proxy -f -d 'Proxy received signals to the'
+complete -c docker -A -n '__fish_docker_using run' -l stop-signal -f -d 'Signal to stop the container'
+complete -c docker -A -n '__fish_docker_using run' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
+complete -c docker -A -n '__fish_docker_using run' -l storage-opt -f -d 'Storage driver options for the'
+complete -c docker -A -n '__fish_docker_using run' -l sysctl -f -d 'Sysctl options (default map[])'
+complete -c docker -A -n '__fish_docker_using run' -l tmpfs -f -d 'Mount a tmpfs directory'
+complete -c docker -A -n '__fish_docker_using run' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using run' -l ulimit -f -d 'Ulimit options (default [])'
+complete -c docker -A -n '__fish_docker_using run' -l use-api-socket -f -d 'Bind mount Docker API socket and'
+complete -c docker -A -n '__fish_docker_using run' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using run' -l userns -f -d 'User namespace to use'
+complete -c docker -A -n '__fish_docker_using run' -l uts -f -d 'UTS namespace to use'
+complete -c docker -A -n '__fish_docker_using run' -s v -l volume -f -d 'Bind mount a volume'
+complete -c docker -A -n '__fish_docker_using run' -l volume-driver -f -d 'Optional volume driver for the'
+complete -c docker -A -n '__fish_docker_using run' -l volumes-from -f -d 'Mount volumes from the specified'
+complete -c docker -A -n '__fish_docker_using run' -s w -l workdir -f -d 'Working directory inside the'
+complete -c docker -A -f -n '__fish_docker_using run' -a '(__fish_print_docker_images)' -d "Image"
 
 # exec
 complete -c docker -f -n '__fish_docker_no_subcommand' -a exec -d 'Execute a command in a running container'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s d -l detach -f -d 'Detached mode: run command in the background'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -l detach-keys -f -d 'Override the key sequence for detaching a'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -l env-file -f -d 'Read in a file of environment variables'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -l privileged -f -d 'Give extended privileges to the command'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s t -l tty -f -d 'Allocate a pseudo-TTY'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s u -l user -f -d 'Username or UID (format:'
-complete -c docker -A -n '__fish_seen_subcommand_from exec' -s w -l workdir -f -d 'Working directory inside the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from exec' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using exec' -s d -l detach -f -d 'Detached mode: run command in the background'
+complete -c docker -A -n '__fish_docker_using exec' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using exec' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using exec' -l env-file -f -d 'Read in a file of environment variables'
+complete -c docker -A -n '__fish_docker_using exec' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using exec' -l privileged -f -d 'Give extended privileges to the command'
+complete -c docker -A -n '__fish_docker_using exec' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using exec' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using exec' -s w -l workdir -f -d 'Working directory inside the container'
+complete -c docker -A -f -n '__fish_docker_using exec' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # ps
 complete -c docker -f -n '__fish_docker_no_subcommand' -a ps -d 'List containers'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s a -l all -f -d 'Show all containers (default shows just running)'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s f -l filter -f -d 'Filter output based on conditions provided'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s n -l last -f -d 'Show n last created containers (includes all'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s l -l latest -f -d 'Show the latest created container (includes all'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -l no-trunc -f -d "Don't truncate output"
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s q -l quiet -f -d 'Only display container IDs'
-complete -c docker -A -n '__fish_seen_subcommand_from ps' -s s -l size -f -d 'Display total file sizes'
+complete -c docker -A -n '__fish_docker_using ps' -s a -l all -f -d 'Show all containers (default shows just running)'
+complete -c docker -A -n '__fish_docker_using ps' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using ps' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using ps' -s n -l last -f -d 'Show n last created containers (includes all'
+complete -c docker -A -n '__fish_docker_using ps' -s l -l latest -f -d 'Show the latest created container (includes all'
+complete -c docker -A -n '__fish_docker_using ps' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using ps' -s q -l quiet -f -d 'Only display container IDs'
+complete -c docker -A -n '__fish_docker_using ps' -s s -l size -f -d 'Display total file sizes'
 
 # build
 complete -c docker -f -n '__fish_docker_no_subcommand' -a build -d 'Build an image from a Dockerfile'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l add-host -f -d 'Add a custom host-to-IP mapping ("host:ip")'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l build-arg -f -d 'Set build-time variables'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cache-from -f -d 'Images to consider as cache sources'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cgroup-parent -f -d 'Set the parent cgroup for the "RUN"'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l compress -f -d 'Compress the build context using gzip'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cpu-period -f -d 'Limit the CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cpu-quota -f -d 'Limit the CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cpuset-cpus -f -d 'CPUs in which to allow execution (0-3, 0,1)'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l cpuset-mems -f -d 'MEMs in which to allow execution (0-3, 0,1)'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -s f -l file -f -d 'Name of the Dockerfile (Default is'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l force-rm -f -d 'Always remove intermediate containers'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l iidfile -f -d 'Write the image ID to the file'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l isolation -f -d 'Container isolation technology'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l label -f -d 'Set metadata for an image'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -s m -l memory -f -d 'Memory limit'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l memory-swap -f -d 'Swap limit equal to memory plus swap: -1'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l network -f -d 'Set the networking mode for the RUN'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l no-cache -f -d 'Do not use cache when building the image'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l platform -f -d 'Set platform if server is multi-platform'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l pull -f -d 'Always attempt to pull a newer version of'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -s q -l quiet -f -d 'Suppress the build output and print image'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l rm -f -d 'Remove intermediate containers after a'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l security-opt -f -d 'Security options'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l shm-size -f -d 'Size of "/dev/shm"'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -s t -l tag -f -d 'Name and optionally a tag in the'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l target -f -d 'Set the target build stage to build.'
-complete -c docker -A -n '__fish_seen_subcommand_from build' -l ulimit -f -d 'Ulimit options (default [])'
+complete -c docker -A -n '__fish_docker_using build' -l add-host -f -d 'Add a custom host-to-IP mapping ("host:ip")'
+complete -c docker -A -n '__fish_docker_using build' -l build-arg -f -d 'Set build-time variables'
+complete -c docker -A -n '__fish_docker_using build' -l cache-from -f -d 'Images to consider as cache sources'
+complete -c docker -A -n '__fish_docker_using build' -l cgroup-parent -f -d 'Set the parent cgroup for the "RUN"'
+complete -c docker -A -n '__fish_docker_using build' -l compress -f -d 'Compress the build context using gzip'
+complete -c docker -A -n '__fish_docker_using build' -l cpu-period -f -d 'Limit the CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using build' -l cpu-quota -f -d 'Limit the CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using build' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using build' -l cpuset-cpus -f -d 'CPUs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using build' -l cpuset-mems -f -d 'MEMs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using build' -s f -l file -f -d 'Name of the Dockerfile (Default is'
+complete -c docker -A -n '__fish_docker_using build' -l force-rm -f -d 'Always remove intermediate containers'
+complete -c docker -A -n '__fish_docker_using build' -l iidfile -f -d 'Write the image ID to the file'
+complete -c docker -A -n '__fish_docker_using build' -l isolation -f -d 'Container isolation technology'
+complete -c docker -A -n '__fish_docker_using build' -l label -f -d 'Set metadata for an image'
+complete -c docker -A -n '__fish_docker_using build' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using build' -l memory-swap -f -d 'Swap limit equal to memory plus swap: -1'
+complete -c docker -A -n '__fish_docker_using build' -l network -f -d 'Set the networking mode for the RUN'
+complete -c docker -A -n '__fish_docker_using build' -l no-cache -f -d 'Do not use cache when building the image'
+complete -c docker -A -n '__fish_docker_using build' -l platform -f -d 'Set platform if server is multi-platform'
+complete -c docker -A -n '__fish_docker_using build' -l pull -f -d 'Always attempt to pull a newer version of'
+complete -c docker -A -n '__fish_docker_using build' -s q -l quiet -f -d 'Suppress the build output and print image'
+complete -c docker -A -n '__fish_docker_using build' -l rm -f -d 'Remove intermediate containers after a'
+complete -c docker -A -n '__fish_docker_using build' -l security-opt -f -d 'Security options'
+complete -c docker -A -n '__fish_docker_using build' -l shm-size -f -d 'Size of "/dev/shm"'
+complete -c docker -A -n '__fish_docker_using build' -s t -l tag -f -d 'Name and optionally a tag in the'
+complete -c docker -A -n '__fish_docker_using build' -l target -f -d 'Set the target build stage to build.'
+complete -c docker -A -n '__fish_docker_using build' -l ulimit -f -d 'Ulimit options (default [])'
 
 # bake
 complete -c docker -f -n '__fish_docker_no_subcommand' -a bake -d 'Build from a file'
 
 # pull
 complete -c docker -f -n '__fish_docker_no_subcommand' -a pull -d 'Download an image from a registry'
-complete -c docker -A -n '__fish_seen_subcommand_from pull' -s a -l all-tags -f -d 'Download all tagged images in the repository'
-complete -c docker -A -n '__fish_seen_subcommand_from pull' -l platform -f -d 'Set platform if server is multi-platform capable'
-complete -c docker -A -n '__fish_seen_subcommand_from pull' -s q -l quiet -f -d 'Suppress verbose output'
-complete -c docker -A -f -n '__fish_seen_subcommand_from pull' -a '(__fish_print_docker_images)' -d "Image"
-complete -c docker -A -f -n '__fish_seen_subcommand_from pull' -a '(__fish_print_docker_repositories)' -d "Repository"
+complete -c docker -A -n '__fish_docker_using pull' -s a -l all-tags -f -d 'Download all tagged images in the repository'
+complete -c docker -A -n '__fish_docker_using pull' -l platform -f -d 'Set platform if server is multi-platform capable'
+complete -c docker -A -n '__fish_docker_using pull' -s q -l quiet -f -d 'Suppress verbose output'
+complete -c docker -A -f -n '__fish_docker_using pull' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -f -n '__fish_docker_using pull' -a '(__fish_print_docker_repositories)' -d "Repository"
 
 # push
 complete -c docker -f -n '__fish_docker_no_subcommand' -a push -d 'Upload an image to a registry'
-complete -c docker -A -n '__fish_seen_subcommand_from push' -s a -l all-tags -f -d 'Push all tags of an image to the repository'
-complete -c docker -A -n '__fish_seen_subcommand_from push' -l platform -f -d 'Push a platform-specific manifest as a'
-complete -c docker -A -n '__fish_seen_subcommand_from push' -s q -l quiet -f -d 'Suppress verbose output'
-complete -c docker -A -f -n '__fish_seen_subcommand_from push' -a '(__fish_print_docker_images)' -d "Image"
-complete -c docker -A -f -n '__fish_seen_subcommand_from push' -a '(__fish_print_docker_repositories)' -d "Repository"
+complete -c docker -A -n '__fish_docker_using push' -s a -l all-tags -f -d 'Push all tags of an image to the repository'
+complete -c docker -A -n '__fish_docker_using push' -l platform -f -d 'Push a platform-specific manifest as a'
+complete -c docker -A -n '__fish_docker_using push' -s q -l quiet -f -d 'Suppress verbose output'
+complete -c docker -A -f -n '__fish_docker_using push' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -f -n '__fish_docker_using push' -a '(__fish_print_docker_repositories)' -d "Repository"
 
 # images
 complete -c docker -f -n '__fish_docker_no_subcommand' -a images -d 'List images'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -s a -l all -f -d 'Show all images (default hides intermediate and'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -l digests -f -d 'Show digests'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -s f -l filter -f -d 'Filter output based on conditions provided'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -l no-trunc -f -d "Don't truncate output"
-complete -c docker -A -n '__fish_seen_subcommand_from images' -s q -l quiet -f -d 'Only show image IDs'
-complete -c docker -A -n '__fish_seen_subcommand_from images' -l tree -f -d 'List multi-platform images as a tree (EXPERIMENTAL)'
-complete -c docker -A -f -n '__fish_seen_subcommand_from images' -a '(__fish_print_docker_repositories)' -d "Repository"
+complete -c docker -A -n '__fish_docker_using images' -s a -l all -f -d 'Show all images (default hides intermediate and'
+complete -c docker -A -n '__fish_docker_using images' -l digests -f -d 'Show digests'
+complete -c docker -A -n '__fish_docker_using images' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using images' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using images' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using images' -s q -l quiet -f -d 'Only show image IDs'
+complete -c docker -A -n '__fish_docker_using images' -l tree -f -d 'List multi-platform images as a tree (EXPERIMENTAL)'
+complete -c docker -A -f -n '__fish_docker_using images' -a '(__fish_print_docker_repositories)' -d "Repository"
 
 # login
 complete -c docker -f -n '__fish_docker_no_subcommand' -a login -d 'Authenticate to a registry'
-complete -c docker -A -n '__fish_seen_subcommand_from login' -s p -l password -f -d 'Password or Personal Access Token (PAT)'
-complete -c docker -A -n '__fish_seen_subcommand_from login' -l password-stdin -f -d 'Take the Password or Personal Access Token'
-complete -c docker -A -n '__fish_seen_subcommand_from login' -s u -l username -f -d 'Username'
+complete -c docker -A -n '__fish_docker_using login' -s p -l password -f -d 'Password or Personal Access Token (PAT)'
+complete -c docker -A -n '__fish_docker_using login' -l password-stdin -f -d 'Take the Password or Personal Access Token'
+complete -c docker -A -n '__fish_docker_using login' -s u -l username -f -d 'Username'
 
 # logout
 complete -c docker -f -n '__fish_docker_no_subcommand' -a logout -d 'Log out from a registry'
 
 # search
 complete -c docker -f -n '__fish_docker_no_subcommand' -a search -d 'Search Docker Hub for images'
-complete -c docker -A -n '__fish_seen_subcommand_from search' -s f -l filter -f -d 'Filter output based on conditions provided'
-complete -c docker -A -n '__fish_seen_subcommand_from search' -l format -f -d 'Pretty-print search using a Go template'
-complete -c docker -A -n '__fish_seen_subcommand_from search' -l limit -f -d 'Max number of search results'
-complete -c docker -A -n '__fish_seen_subcommand_from search' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using search' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using search' -l format -f -d 'Pretty-print search using a Go template'
+complete -c docker -A -n '__fish_docker_using search' -l limit -f -d 'Max number of search results'
+complete -c docker -A -n '__fish_docker_using search' -l no-trunc -f -d "Don't truncate output"
 
 # version
 complete -c docker -f -n '__fish_docker_no_subcommand' -a version -d 'Show the Docker version information'
-complete -c docker -A -n '__fish_seen_subcommand_from version' -s f -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using version' -s f -l format -f -d 'Format output using a custom template:'
 
 # info
 complete -c docker -f -n '__fish_docker_no_subcommand' -a info -d 'Display system-wide information'
-complete -c docker -A -n '__fish_seen_subcommand_from info' -s f -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using info' -s f -l format -f -d 'Format output using a custom template:'
 
 # builder
 complete -c docker -f -n '__fish_docker_no_subcommand' -a builder -d 'Manage builds'
@@ -273,12 +654,422 @@ complete -c docker -f -n '__fish_docker_no_subcommand' -a builder -d 'Manage bui
 # container
 complete -c docker -f -n '__fish_docker_no_subcommand' -a container -d 'Manage containers'
 
+# container attach
+complete -c docker -f -n '__fish_docker_using container' -a attach -d 'Attach local standard input, output, and error streams to a running container'
+complete -c docker -A -n '__fish_docker_using container attach' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using container attach' -l no-stdin -f -d 'Do not attach STDIN'
+complete -c docker -A -n '__fish_docker_using container attach' -l sig-proxy -f -d 'Proxy all received signals to the process'
+complete -c docker -A -f -n '__fish_docker_using container attach' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container commit
+complete -c docker -f -n '__fish_docker_using container' -a commit -d "Create a new image from a container's changes"
+complete -c docker -A -n '__fish_docker_using container commit' -s a -l author -f -d 'Author (e.g., "John Hannibal Smith'
+complete -c docker -A -n '__fish_docker_using container commit' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
+complete -c docker -A -n '__fish_docker_using container commit' -s m -l message -f -d 'Commit message'
+complete -c docker -A -n '__fish_docker_using container commit' -l no-pause -f -d 'Disable pausing container during commit'
+complete -c docker -A -f -n '__fish_docker_using container commit' -a '(__fish_print_docker_containers all)' -d "Container"
+
+# container cp
+complete -c docker -f -n '__fish_docker_using container' -a cp -d 'Copy files/folders between a container and the local filesystem'
+complete -c docker -A -n '__fish_docker_using container cp' -s a -l archive -f -d 'Archive mode (copy all uid/gid information)'
+complete -c docker -A -n '__fish_docker_using container cp' -s L -l follow-link -f -d 'Always follow symbol link in SRC_PATH'
+complete -c docker -A -n '__fish_docker_using container cp' -s q -l quiet -f -d 'Suppress progress output during copy. Progress'
+
+# container create
+complete -c docker -f -n '__fish_docker_using container' -a create -d 'Create a new container'
+complete -c docker -A -n '__fish_docker_using container create' -l add-host -f -d 'Add a custom host-to-IP mapping'
+complete -c docker -A -n '__fish_docker_using container create' -l annotation -f -d 'Add an annotation to the'
+complete -c docker -A -n '__fish_docker_using container create' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
+complete -c docker -A -n '__fish_docker_using container create' -l blkio-weight -f -d 'Block IO (relative weight),'
+complete -c docker -A -n '__fish_docker_using container create' -l blkio-weight-device -f -d 'Block IO weight (relative device'
+complete -c docker -A -n '__fish_docker_using container create' -l cap-add -f -d 'Add Linux capabilities'
+complete -c docker -A -n '__fish_docker_using container create' -l cap-drop -f -d 'Drop Linux capabilities'
+complete -c docker -A -n '__fish_docker_using container create' -l cgroup-parent -f -d 'Optional parent cgroup for the'
+complete -c docker -A -n '__fish_docker_using container create' -l cgroupns -f -d 'Cgroup namespace to use'
+complete -c docker -A -n '__fish_docker_using container create' -l cidfile -f -d 'Write the container ID to the file'
+complete -c docker -A -n '__fish_docker_using container create' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container create' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container create' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using container create' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using container create' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using container create' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using container create' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using container create' -l cpuset-mems -f -d 'MEMs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using container create' -l device -f -d 'Add a host device to the container'
+complete -c docker -A -n '__fish_docker_using container create' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
+complete -c docker -A -n '__fish_docker_using container create' -l device-read-bps -f -d 'Limit read rate (bytes per'
+complete -c docker -A -n '__fish_docker_using container create' -l device-read-iops -f -d 'Limit read rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using container create' -l device-write-bps -f -d 'Limit write rate (bytes per'
+complete -c docker -A -n '__fish_docker_using container create' -l device-write-iops -f -d 'Limit write rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using container create' -l dns -f -d 'Set custom DNS servers'
+complete -c docker -A -n '__fish_docker_using container create' -l dns-option -f -d 'Set DNS options'
+complete -c docker -A -n '__fish_docker_using container create' -l dns-search -f -d 'Set custom DNS search domains'
+complete -c docker -A -n '__fish_docker_using container create' -l domainname -f -d 'Container NIS domain name'
+complete -c docker -A -n '__fish_docker_using container create' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
+complete -c docker -A -n '__fish_docker_using container create' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using container create' -l env-file -f -d 'Read in a file of environment'
+complete -c docker -A -n '__fish_docker_using container create' -l expose -f -d 'Expose a port or a range of ports'
+complete -c docker -A -n '__fish_docker_using container create' -l gpus -f -d 'GPU devices to add to the'
+complete -c docker -A -n '__fish_docker_using container create' -l group-add -f -d 'Add additional groups to join'
+complete -c docker -A -n '__fish_docker_using container create' -l health-cmd -f -d 'Command to run to check health'
+complete -c docker -A -n '__fish_docker_using container create' -l health-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using container create' -l health-retries -f -d 'Consecutive failures needed to'
+complete -c docker -A -n '__fish_docker_using container create' -l health-start-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using container create' -l health-start-period -f -d 'Start period for the container'
+complete -c docker -A -n '__fish_docker_using container create' -l health-timeout -f -d 'Maximum time to allow one check'
+complete -c docker -A -n '__fish_docker_using container create' -l help -f -d 'Print usage'
+complete -c docker -A -n '__fish_docker_using container create' -s h -l hostname -f -d 'Container host name'
+complete -c docker -A -n '__fish_docker_using container create' -l init -f -d 'Run an init inside the container'
+complete -c docker -A -n '__fish_docker_using container create' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using container create' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
+complete -c docker -A -n '__fish_docker_using container create' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
+complete -c docker -A -n '__fish_docker_using container create' -l ipc -f -d 'IPC mode to use'
+complete -c docker -A -n '__fish_docker_using container create' -l isolation -f -d 'Container isolation technology'
+complete -c docker -A -n '__fish_docker_using container create' -s l -l label -f -d 'Set meta data on a container'
+complete -c docker -A -n '__fish_docker_using container create' -l label-file -f -d 'Read in a line delimited file of'
+complete -c docker -A -n '__fish_docker_using container create' -l link -f -d 'Add link to another container'
+complete -c docker -A -n '__fish_docker_using container create' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
+complete -c docker -A -n '__fish_docker_using container create' -l log-driver -f -d 'Logging driver for the container'
+complete -c docker -A -n '__fish_docker_using container create' -l log-opt -f -d 'Log driver options'
+complete -c docker -A -n '__fish_docker_using container create' -l mac-address -f -d 'Container MAC address (e.g.,'
+complete -c docker -A -n '__fish_docker_using container create' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using container create' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using container create' -l memory-swap -f -d 'Swap limit equal to memory plus'
+complete -c docker -A -n '__fish_docker_using container create' -l memory-swappiness -f -d 'Tune container memory swappiness'
+complete -c docker -A -n '__fish_docker_using container create' -l mount -f -d 'Attach a filesystem mount to the'
+complete -c docker -A -n '__fish_docker_using container create' -l name -f -d 'Assign a name to the container'
+complete -c docker -A -n '__fish_docker_using container create' -l network -f -d 'Connect a container to a network'
+complete -c docker -A -n '__fish_docker_using container create' -l network-alias -f -d 'Add network-scoped alias for the'
+complete -c docker -A -n '__fish_docker_using container create' -l no-healthcheck -f -d 'Disable any container-specified'
+complete -c docker -A -n '__fish_docker_using container create' -l oom-kill-disable -f -d 'Disable OOM Killer'
+complete -c docker -A -n '__fish_docker_using container create' -l oom-score-adj -f -d "Tune host's OOM preferences"
+complete -c docker -A -n '__fish_docker_using container create' -l pid -f -d 'PID namespace to use'
+complete -c docker -A -n '__fish_docker_using container create' -l pids-limit -f -d 'Tune container pids limit (set'
+complete -c docker -A -n '__fish_docker_using container create' -l platform -f -d 'Set platform if server is'
+complete -c docker -A -n '__fish_docker_using container create' -l privileged -f -d 'Give extended privileges to this'
+complete -c docker -A -n '__fish_docker_using container create' -s p -l publish -f -d "Publish a container's port(s) to"
+complete -c docker -A -n '__fish_docker_using container create' -s P -l publish-all -f -d 'Publish all exposed ports to'
+complete -c docker -A -n '__fish_docker_using container create' -l pull -f -d 'Pull image before creating'
+complete -c docker -A -n '__fish_docker_using container create' -s q -l quiet -f -d 'Suppress the pull output'
+complete -c docker -A -n '__fish_docker_using container create' -l read-only -f -d "Mount the container's root"
+complete -c docker -A -n '__fish_docker_using container create' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -n '__fish_docker_using container create' -l rm -f -d 'Automatically remove the'
+complete -c docker -A -n '__fish_docker_using container create' -l runtime -f -d 'Runtime to use for this container'
+complete -c docker -A -n '__fish_docker_using container create' -l security-opt -f -d 'Security Options'
+complete -c docker -A -n '__fish_docker_using container create' -l shm-size -f -d 'Size of /dev/shm'
+complete -c docker -A -n '__fish_docker_using container create' -l stop-signal -f -d 'Signal to stop the container'
+complete -c docker -A -n '__fish_docker_using container create' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
+complete -c docker -A -n '__fish_docker_using container create' -l storage-opt -f -d 'Storage driver options for the'
+complete -c docker -A -n '__fish_docker_using container create' -l sysctl -f -d 'Sysctl options (default map[])'
+complete -c docker -A -n '__fish_docker_using container create' -l tmpfs -f -d 'Mount a tmpfs directory'
+complete -c docker -A -n '__fish_docker_using container create' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using container create' -l ulimit -f -d 'Ulimit options (default [])'
+complete -c docker -A -n '__fish_docker_using container create' -l use-api-socket -f -d 'Bind mount Docker API socket and'
+complete -c docker -A -n '__fish_docker_using container create' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using container create' -l userns -f -d 'User namespace to use'
+complete -c docker -A -n '__fish_docker_using container create' -l uts -f -d 'UTS namespace to use'
+complete -c docker -A -n '__fish_docker_using container create' -s v -l volume -f -d 'Bind mount a volume'
+complete -c docker -A -n '__fish_docker_using container create' -l volume-driver -f -d 'Optional volume driver for the'
+complete -c docker -A -n '__fish_docker_using container create' -l volumes-from -f -d 'Mount volumes from the specified'
+complete -c docker -A -n '__fish_docker_using container create' -s w -l workdir -f -d 'Working directory inside the'
+complete -c docker -A -f -n '__fish_docker_using container create' -a '(__fish_print_docker_images)' -d "Image"
+
+# container diff
+complete -c docker -f -n '__fish_docker_using container' -a diff -d "Inspect changes to files or directories on a container's filesystem"
+complete -c docker -A -f -n '__fish_docker_using container diff' -a '(__fish_print_docker_containers all)' -d "Container"
+
+# container exec
+complete -c docker -f -n '__fish_docker_using container' -a exec -d 'Execute a command in a running container'
+complete -c docker -A -n '__fish_docker_using container exec' -s d -l detach -f -d 'Detached mode: run command in the background'
+complete -c docker -A -n '__fish_docker_using container exec' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using container exec' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using container exec' -l env-file -f -d 'Read in a file of environment variables'
+complete -c docker -A -n '__fish_docker_using container exec' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using container exec' -l privileged -f -d 'Give extended privileges to the command'
+complete -c docker -A -n '__fish_docker_using container exec' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using container exec' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using container exec' -s w -l workdir -f -d 'Working directory inside the container'
+complete -c docker -A -f -n '__fish_docker_using container exec' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container export
+complete -c docker -f -n '__fish_docker_using container' -a export -d "Export a container's filesystem as a tar archive"
+complete -c docker -A -n '__fish_docker_using container export' -s o -l output -f -d 'Write to a file, instead of STDOUT'
+complete -c docker -A -f -n '__fish_docker_using container export' -a '(__fish_print_docker_containers all)' -d "Container"
+
+# container kill
+complete -c docker -f -n '__fish_docker_using container' -a kill -d 'Kill one or more running containers'
+complete -c docker -A -n '__fish_docker_using container kill' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -f -n '__fish_docker_using container kill' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container logs
+complete -c docker -f -n '__fish_docker_using container' -a logs -d 'Fetch the logs of a container'
+complete -c docker -A -n '__fish_docker_using container logs' -l details -f -d 'Show extra details provided to logs'
+complete -c docker -A -n '__fish_docker_using container logs' -s f -l follow -f -d 'Follow log output'
+complete -c docker -A -n '__fish_docker_using container logs' -l since -f -d 'Show logs since timestamp (e.g.'
+complete -c docker -A -n '__fish_docker_using container logs' -s n -l tail -f -d 'Number of lines to show from the end of the logs'
+complete -c docker -A -n '__fish_docker_using container logs' -s t -l timestamps -f -d 'Show timestamps'
+complete -c docker -A -n '__fish_docker_using container logs' -l until -f -d 'Show logs before a timestamp (e.g.'
+complete -c docker -A -f -n '__fish_docker_using container logs' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container ls
+complete -c docker -f -n '__fish_docker_using container' -a ls -d 'List containers'
+complete -c docker -A -n '__fish_docker_using container ls' -s a -l all -f -d 'Show all containers (default shows just running)'
+complete -c docker -A -n '__fish_docker_using container ls' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using container ls' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using container ls' -s n -l last -f -d 'Show n last created containers (includes all'
+complete -c docker -A -n '__fish_docker_using container ls' -s l -l latest -f -d 'Show the latest created container (includes all'
+complete -c docker -A -n '__fish_docker_using container ls' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using container ls' -s q -l quiet -f -d 'Only display container IDs'
+complete -c docker -A -n '__fish_docker_using container ls' -s s -l size -f -d 'Display total file sizes'
+
+# container pause
+complete -c docker -f -n '__fish_docker_using container' -a pause -d 'Pause all processes within one or more containers'
+complete -c docker -A -f -n '__fish_docker_using container pause' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container port
+complete -c docker -f -n '__fish_docker_using container' -a port -d 'List port mappings or a specific mapping for the container'
+complete -c docker -A -f -n '__fish_docker_using container port' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container rename
+complete -c docker -f -n '__fish_docker_using container' -a rename -d 'Rename a container'
+complete -c docker -A -f -n '__fish_docker_using container rename' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container restart
+complete -c docker -f -n '__fish_docker_using container' -a restart -d 'Restart one or more containers'
+complete -c docker -A -n '__fish_docker_using container restart' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -n '__fish_docker_using container restart' -s t -l timeout -f -d 'Seconds to wait before killing the container'
+complete -c docker -A -f -n '__fish_docker_using container restart' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container rm
+complete -c docker -f -n '__fish_docker_using container' -a rm -d 'Remove one or more containers'
+complete -c docker -A -n '__fish_docker_using container rm' -s f -l force -f -d 'Force the removal of a running container (uses SIGKILL)'
+complete -c docker -A -n '__fish_docker_using container rm' -s l -l link -f -d 'Remove the specified link'
+complete -c docker -A -n '__fish_docker_using container rm' -s v -l volumes -f -d 'Remove anonymous volumes associated with the container'
+complete -c docker -A -f -n '__fish_docker_using container rm' -a '(__fish_print_docker_containers stopped)' -d "Container"
+
+# container run
+complete -c docker -f -n '__fish_docker_using container' -a run -d 'Create and run a new container from an image'
+complete -c docker -A -n '__fish_docker_using container run' -l add-host -f -d 'Add a custom host-to-IP mapping'
+complete -c docker -A -n '__fish_docker_using container run' -l annotation -f -d 'Add an annotation to the'
+complete -c docker -A -n '__fish_docker_using container run' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
+complete -c docker -A -n '__fish_docker_using container run' -l blkio-weight -f -d 'Block IO (relative weight),'
+complete -c docker -A -n '__fish_docker_using container run' -l blkio-weight-device -f -d 'Block IO weight (relative device'
+complete -c docker -A -n '__fish_docker_using container run' -l cap-add -f -d 'Add Linux capabilities'
+complete -c docker -A -n '__fish_docker_using container run' -l cap-drop -f -d 'Drop Linux capabilities'
+complete -c docker -A -n '__fish_docker_using container run' -l cgroup-parent -f -d 'Optional parent cgroup for the'
+complete -c docker -A -n '__fish_docker_using container run' -l cgroupns -f -d 'Cgroup namespace to use'
+complete -c docker -A -n '__fish_docker_using container run' -l cidfile -f -d 'Write the container ID to the file'
+complete -c docker -A -n '__fish_docker_using container run' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container run' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container run' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using container run' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using container run' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using container run' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using container run' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using container run' -l cpuset-mems -f -d 'MEMs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using container run' -s d -l detach -f -d 'Run container in background and'
+complete -c docker -A -n '__fish_docker_using container run' -l detach-keys -f -d 'Override the key sequence for'
+complete -c docker -A -n '__fish_docker_using container run' -l device -f -d 'Add a host device to the container'
+complete -c docker -A -n '__fish_docker_using container run' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
+complete -c docker -A -n '__fish_docker_using container run' -l device-read-bps -f -d 'Limit read rate (bytes per'
+complete -c docker -A -n '__fish_docker_using container run' -l device-read-iops -f -d 'Limit read rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using container run' -l device-write-bps -f -d 'Limit write rate (bytes per'
+complete -c docker -A -n '__fish_docker_using container run' -l device-write-iops -f -d 'Limit write rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using container run' -l dns -f -d 'Set custom DNS servers'
+complete -c docker -A -n '__fish_docker_using container run' -l dns-option -f -d 'Set DNS options'
+complete -c docker -A -n '__fish_docker_using container run' -l dns-search -f -d 'Set custom DNS search domains'
+complete -c docker -A -n '__fish_docker_using container run' -l domainname -f -d 'Container NIS domain name'
+complete -c docker -A -n '__fish_docker_using container run' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
+complete -c docker -A -n '__fish_docker_using container run' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using container run' -l env-file -f -d 'Read in a file of environment'
+complete -c docker -A -n '__fish_docker_using container run' -l expose -f -d 'Expose a port or a range of ports'
+complete -c docker -A -n '__fish_docker_using container run' -l gpus -f -d 'GPU devices to add to the'
+complete -c docker -A -n '__fish_docker_using container run' -l group-add -f -d 'Add additional groups to join'
+complete -c docker -A -n '__fish_docker_using container run' -l health-cmd -f -d 'Command to run to check health'
+complete -c docker -A -n '__fish_docker_using container run' -l health-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using container run' -l health-retries -f -d 'Consecutive failures needed to'
+complete -c docker -A -n '__fish_docker_using container run' -l health-start-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using container run' -l health-start-period -f -d 'Start period for the container'
+complete -c docker -A -n '__fish_docker_using container run' -l health-timeout -f -d 'Maximum time to allow one check'
+complete -c docker -A -n '__fish_docker_using container run' -l help -f -d 'Print usage'
+complete -c docker -A -n '__fish_docker_using container run' -s h -l hostname -f -d 'Container host name'
+complete -c docker -A -n '__fish_docker_using container run' -l init -f -d 'Run an init inside the container'
+complete -c docker -A -n '__fish_docker_using container run' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using container run' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
+complete -c docker -A -n '__fish_docker_using container run' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
+complete -c docker -A -n '__fish_docker_using container run' -l ipc -f -d 'IPC mode to use'
+complete -c docker -A -n '__fish_docker_using container run' -l isolation -f -d 'Container isolation technology'
+complete -c docker -A -n '__fish_docker_using container run' -s l -l label -f -d 'Set meta data on a container'
+complete -c docker -A -n '__fish_docker_using container run' -l label-file -f -d 'Read in a line delimited file of'
+complete -c docker -A -n '__fish_docker_using container run' -l link -f -d 'Add link to another container'
+complete -c docker -A -n '__fish_docker_using container run' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
+complete -c docker -A -n '__fish_docker_using container run' -l log-driver -f -d 'Logging driver for the container'
+complete -c docker -A -n '__fish_docker_using container run' -l log-opt -f -d 'Log driver options'
+complete -c docker -A -n '__fish_docker_using container run' -l mac-address -f -d 'Container MAC address (e.g.,'
+complete -c docker -A -n '__fish_docker_using container run' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using container run' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using container run' -l memory-swap -f -d 'Swap limit equal to memory plus'
+complete -c docker -A -n '__fish_docker_using container run' -l memory-swappiness -f -d 'Tune container memory swappiness'
+complete -c docker -A -n '__fish_docker_using container run' -l mount -f -d 'Attach a filesystem mount to the'
+complete -c docker -A -n '__fish_docker_using container run' -l name -f -d 'Assign a name to the container'
+complete -c docker -A -n '__fish_docker_using container run' -l network -f -d 'Connect a container to a network'
+complete -c docker -A -n '__fish_docker_using container run' -l network-alias -f -d 'Add network-scoped alias for the'
+complete -c docker -A -n '__fish_docker_using container run' -l no-healthcheck -f -d 'Disable any container-specified'
+complete -c docker -A -n '__fish_docker_using container run' -l oom-kill-disable -f -d 'Disable OOM Killer'
+complete -c docker -A -n '__fish_docker_using container run' -l oom-score-adj -f -d "Tune host's OOM preferences"
+complete -c docker -A -n '__fish_docker_using container run' -l pid -f -d 'PID namespace to use'
+complete -c docker -A -n '__fish_docker_using container run' -l pids-limit -f -d 'Tune container pids limit (set'
+complete -c docker -A -n '__fish_docker_using container run' -l platform -f -d 'Set platform if server is'
+complete -c docker -A -n '__fish_docker_using container run' -l privileged -f -d 'Give extended privileges to this'
+complete -c docker -A -n '__fish_docker_using container run' -s p -l publish -f -d "Publish a container's port(s) to"
+complete -c docker -A -n '__fish_docker_using container run' -s P -l publish-all -f -d 'Publish all exposed ports to'
+complete -c docker -A -n '__fish_docker_using container run' -l pull -f -d 'Pull image before running'
+complete -c docker -A -n '__fish_docker_using container run' -s q -l quiet -f -d 'Suppress the pull output'
+complete -c docker -A -n '__fish_docker_using container run' -l read-only -f -d "Mount the container's root"
+complete -c docker -A -n '__fish_docker_using container run' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -n '__fish_docker_using container run' -l rm -f -d 'Automatically remove the'
+complete -c docker -A -n '__fish_docker_using container run' -l runtime -f -d 'Runtime to use for this container'
+complete -c docker -A -n '__fish_docker_using container run' -l security-opt -f -d 'Security Options'
+complete -c docker -A -n '__fish_docker_using container run' -l shm-size -f -d 'Size of /dev/shm'
+complete -c docker -A -n '__fish_docker_using container run' -l sig-proxy -f -d 'Proxy received signals to the'
+complete -c docker -A -n '__fish_docker_using container run' -l stop-signal -f -d 'Signal to stop the container'
+complete -c docker -A -n '__fish_docker_using container run' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
+complete -c docker -A -n '__fish_docker_using container run' -l storage-opt -f -d 'Storage driver options for the'
+complete -c docker -A -n '__fish_docker_using container run' -l sysctl -f -d 'Sysctl options (default map[])'
+complete -c docker -A -n '__fish_docker_using container run' -l tmpfs -f -d 'Mount a tmpfs directory'
+complete -c docker -A -n '__fish_docker_using container run' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using container run' -l ulimit -f -d 'Ulimit options (default [])'
+complete -c docker -A -n '__fish_docker_using container run' -l use-api-socket -f -d 'Bind mount Docker API socket and'
+complete -c docker -A -n '__fish_docker_using container run' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using container run' -l userns -f -d 'User namespace to use'
+complete -c docker -A -n '__fish_docker_using container run' -l uts -f -d 'UTS namespace to use'
+complete -c docker -A -n '__fish_docker_using container run' -s v -l volume -f -d 'Bind mount a volume'
+complete -c docker -A -n '__fish_docker_using container run' -l volume-driver -f -d 'Optional volume driver for the'
+complete -c docker -A -n '__fish_docker_using container run' -l volumes-from -f -d 'Mount volumes from the specified'
+complete -c docker -A -n '__fish_docker_using container run' -s w -l workdir -f -d 'Working directory inside the'
+complete -c docker -A -f -n '__fish_docker_using container run' -a '(__fish_print_docker_images)' -d "Image"
+
+# container start
+complete -c docker -f -n '__fish_docker_using container' -a start -d 'Start one or more stopped containers'
+complete -c docker -A -n '__fish_docker_using container start' -s a -l attach -f -d 'Attach STDOUT/STDERR and forward signals'
+complete -c docker -A -n '__fish_docker_using container start' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using container start' -s i -l interactive -f -d "Attach container's STDIN"
+complete -c docker -A -f -n '__fish_docker_using container start' -a '(__fish_print_docker_containers stopped)' -d "Container"
+
+# container stats
+complete -c docker -f -n '__fish_docker_using container' -a stats -d 'Display a live stream of container(s) resource usage statistics'
+complete -c docker -A -n '__fish_docker_using container stats' -s a -l all -f -d 'Show all containers (default shows just running)'
+complete -c docker -A -n '__fish_docker_using container stats' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using container stats' -l no-stream -f -d 'Disable streaming stats and only pull the first result'
+complete -c docker -A -n '__fish_docker_using container stats' -l no-trunc -f -d 'Do not truncate output'
+complete -c docker -A -f -n '__fish_docker_using container stats' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container stop
+complete -c docker -f -n '__fish_docker_using container' -a stop -d 'Stop one or more running containers'
+complete -c docker -A -n '__fish_docker_using container stop' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -n '__fish_docker_using container stop' -s t -l timeout -f -d 'Seconds to wait before killing the container'
+complete -c docker -A -f -n '__fish_docker_using container stop' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container top
+complete -c docker -f -n '__fish_docker_using container' -a top -d 'Display the running processes of a container'
+complete -c docker -A -f -n '__fish_docker_using container top' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container unpause
+complete -c docker -f -n '__fish_docker_using container' -a unpause -d 'Unpause all processes within one or more containers'
+complete -c docker -A -f -n '__fish_docker_using container unpause' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container update
+complete -c docker -f -n '__fish_docker_using container' -a update -d 'Update configuration of one or more containers'
+complete -c docker -A -n '__fish_docker_using container update' -l blkio-weight -f -d 'Block IO (relative weight), between 10'
+complete -c docker -A -n '__fish_docker_using container update' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container update' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using container update' -l cpu-rt-period -f -d 'Limit the CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using container update' -l cpu-rt-runtime -f -d 'Limit the CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using container update' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using container update' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using container update' -l cpuset-cpus -f -d 'CPUs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using container update' -l cpuset-mems -f -d 'MEMs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using container update' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using container update' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using container update' -l memory-swap -f -d 'Swap limit equal to memory plus swap:'
+complete -c docker -A -n '__fish_docker_using container update' -l pids-limit -f -d 'Tune container pids limit (set -1 for'
+complete -c docker -A -n '__fish_docker_using container update' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -f -n '__fish_docker_using container update' -a '(__fish_print_docker_containers running)' -d "Container"
+
+# container wait
+complete -c docker -f -n '__fish_docker_using container' -a wait -d 'Block until one or more containers stop, then print their exit codes'
+complete -c docker -A -f -n '__fish_docker_using container wait' -a '(__fish_print_docker_containers running)' -d "Container"
+
 # context
 complete -c docker -f -n '__fish_docker_no_subcommand' -a context -d 'Manage contexts'
 
 # image
 complete -c docker -f -n '__fish_docker_no_subcommand' -a image -d 'Manage images'
 
+# image history
+complete -c docker -f -n '__fish_docker_using image' -a history -d 'Show the history of an image'
+complete -c docker -A -n '__fish_docker_using image history' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using image history' -s H -l human -f -d 'Print sizes and dates in human readable format'
+complete -c docker -A -n '__fish_docker_using image history' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using image history' -l platform -f -d 'Show history for the given platform. Formatted'
+complete -c docker -A -n '__fish_docker_using image history' -s q -l quiet -f -d 'Only show image IDs'
+complete -c docker -A -f -n '__fish_docker_using image history' -a '(__fish_print_docker_images)' -d "Image"
+
+# image import
+complete -c docker -f -n '__fish_docker_using image' -a import -d 'Import the contents from a tarball to create a filesystem image'
+complete -c docker -A -n '__fish_docker_using image import' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
+complete -c docker -A -n '__fish_docker_using image import' -s m -l message -f -d 'Set commit message for imported image'
+complete -c docker -A -n '__fish_docker_using image import' -l platform -f -d 'Set platform if server is multi-platform capable'
+
+# image load
+complete -c docker -f -n '__fish_docker_using image' -a load -d 'Load an image from a tar archive or STDIN'
+complete -c docker -A -n '__fish_docker_using image load' -s i -l input -f -d 'Read from tar archive file, instead of STDIN'
+complete -c docker -A -n '__fish_docker_using image load' -l platform -f -d 'Load only the given platform(s). Formatted as'
+complete -c docker -A -n '__fish_docker_using image load' -s q -l quiet -f -d 'Suppress the load output'
+
+# image ls
+complete -c docker -f -n '__fish_docker_using image' -a ls -d 'List images'
+complete -c docker -A -n '__fish_docker_using image ls' -s a -l all -f -d 'Show all images (default hides intermediate and'
+complete -c docker -A -n '__fish_docker_using image ls' -l digests -f -d 'Show digests'
+complete -c docker -A -n '__fish_docker_using image ls' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using image ls' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using image ls' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using image ls' -s q -l quiet -f -d 'Only show image IDs'
+complete -c docker -A -n '__fish_docker_using image ls' -l tree -f -d 'List multi-platform images as a tree (EXPERIMENTAL)'
+complete -c docker -A -f -n '__fish_docker_using image ls' -a '(__fish_print_docker_repositories)' -d "Repository"
+
+# image pull
+complete -c docker -f -n '__fish_docker_using image' -a pull -d 'Download an image from a registry'
+complete -c docker -A -n '__fish_docker_using image pull' -s a -l all-tags -f -d 'Download all tagged images in the repository'
+complete -c docker -A -n '__fish_docker_using image pull' -l platform -f -d 'Set platform if server is multi-platform capable'
+complete -c docker -A -n '__fish_docker_using image pull' -s q -l quiet -f -d 'Suppress verbose output'
+complete -c docker -A -f -n '__fish_docker_using image pull' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -f -n '__fish_docker_using image pull' -a '(__fish_print_docker_repositories)' -d "Repository"
+
+# image push
+complete -c docker -f -n '__fish_docker_using image' -a push -d 'Upload an image to a registry'
+complete -c docker -A -n '__fish_docker_using image push' -s a -l all-tags -f -d 'Push all tags of an image to the repository'
+complete -c docker -A -n '__fish_docker_using image push' -l platform -f -d 'Push a platform-specific manifest as a'
+complete -c docker -A -n '__fish_docker_using image push' -s q -l quiet -f -d 'Suppress verbose output'
+complete -c docker -A -f -n '__fish_docker_using image push' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -f -n '__fish_docker_using image push' -a '(__fish_print_docker_repositories)' -d "Repository"
+
+# image rm
+complete -c docker -f -n '__fish_docker_using image' -a rm -d 'Remove one or more images'
+complete -c docker -A -n '__fish_docker_using image rm' -s f -l force -f -d 'Force removal of the image'
+complete -c docker -A -n '__fish_docker_using image rm' -l no-prune -f -d 'Do not delete untagged parents'
+complete -c docker -A -n '__fish_docker_using image rm' -l platform -f -d 'Remove only the given platform variant.'
+complete -c docker -A -f -n '__fish_docker_using image rm' -a '(__fish_print_docker_images)' -d "Image"
+
+# image save
+complete -c docker -f -n '__fish_docker_using image' -a save -d 'Save one or more images to a tar archive (streamed to STDOUT by default)'
+complete -c docker -A -n '__fish_docker_using image save' -s o -l output -f -d 'Write to a file, instead of STDOUT'
+complete -c docker -A -n '__fish_docker_using image save' -l platform -f -d 'Save only the given platform(s). Formatted as'
+complete -c docker -A -f -n '__fish_docker_using image save' -a '(__fish_print_docker_images)' -d "Image"
+
+# image tag
+complete -c docker -f -n '__fish_docker_using image' -a tag -d 'Create a tag TARGET_IMAGE that refers to SOURCE_IMAGE'
+
 # manifest
 complete -c docker -f -n '__fish_docker_no_subcommand' -a manifest -d 'Manage Docker image manifests and manifest lists'
 
@@ -291,6 +1082,17 @@ complete -c docker -f -n '__fish_docker_no_subcommand' -a plugin -d 'Manage plug
 # system
 complete -c docker -f -n '__fish_docker_no_subcommand' -a system -d 'Manage Docker'
 
+# system events
+complete -c docker -f -n '__fish_docker_using system' -a events -d 'Get real time events from the server'
+complete -c docker -A -n '__fish_docker_using system events' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using system events' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using system events' -l since -f -d 'Show all events created since timestamp'
+complete -c docker -A -n '__fish_docker_using system events' -l until -f -d 'Stream events until this timestamp'
+
+# system info
+complete -c docker -f -n '__fish_docker_using system' -a info -d 'Display system-wide information'
+complete -c docker -A -n '__fish_docker_using system info' -s f -l format -f -d 'Format output using a custom template:'
+
 # volume
 complete -c docker -f -n '__fish_docker_no_subcommand' -a volume -d 'Manage volumes'
 
@@ -299,469 +1101,487 @@ complete -c docker -f -n '__fish_docker_no_subcommand' -a swarm -d 'Manage Swarm
 
 # attach
 complete -c docker -f -n '__fish_docker_no_subcommand' -a attach -d 'Attach local standard input, output, and error streams to a running container'
-complete -c docker -A -n '__fish_seen_subcommand_from attach' -l detach-keys -f -d 'Override the key sequence for detaching a'
-complete -c docker -A -n '__fish_seen_subcommand_from attach' -l no-stdin -f -d 'Do not attach STDIN'
-complete -c docker -A -n '__fish_seen_subcommand_from attach' -l sig-proxy -f -d 'Proxy all received signals to the process'
-complete -c docker -A -f -n '__fish_seen_subcommand_from attach' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using attach' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using attach' -l no-stdin -f -d 'Do not attach STDIN'
+complete -c docker -A -n '__fish_docker_using attach' -l sig-proxy -f -d 'Proxy all received signals to the process'
+complete -c docker -A -f -n '__fish_docker_using attach' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # commit
 complete -c docker -f -n '__fish_docker_no_subcommand' -a commit -d "Create a new image from a container's changes"
-complete -c docker -A -n '__fish_seen_subcommand_from commit' -s a -l author -f -d 'Author (e.g., "John Hannibal Smith'
-complete -c docker -A -n '__fish_seen_subcommand_from commit' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
-complete -c docker -A -n '__fish_seen_subcommand_from commit' -s m -l message -f -d 'Commit message'
-complete -c docker -A -n '__fish_seen_subcommand_from commit' -l no-pause -f -d 'Disable pausing container during commit'
-complete -c docker -A -f -n '__fish_seen_subcommand_from commit' -a '(__fish_print_docker_containers all)' -d "Container"
+complete -c docker -A -n '__fish_docker_using commit' -s a -l author -f -d 'Author (e.g., "John Hannibal Smith'
+complete -c docker -A -n '__fish_docker_using commit' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
+complete -c docker -A -n '__fish_docker_using commit' -s m -l message -f -d 'Commit message'
+complete -c docker -A -n '__fish_docker_using commit' -l no-pause -f -d 'Disable pausing container during commit'
+complete -c docker -A -f -n '__fish_docker_using commit' -a '(__fish_print_docker_containers all)' -d "Container"
 
 # cp
 complete -c docker -f -n '__fish_docker_no_subcommand' -a cp -d 'Copy files/folders between a container and the local filesystem'
-complete -c docker -A -n '__fish_seen_subcommand_from cp' -s a -l archive -f -d 'Archive mode (copy all uid/gid information)'
-complete -c docker -A -n '__fish_seen_subcommand_from cp' -s L -l follow-link -f -d 'Always follow symbol link in SRC_PATH'
-complete -c docker -A -n '__fish_seen_subcommand_from cp' -s q -l quiet -f -d 'Suppress progress output during copy. Progress'
+complete -c docker -A -n '__fish_docker_using cp' -s a -l archive -f -d 'Archive mode (copy all uid/gid information)'
+complete -c docker -A -n '__fish_docker_using cp' -s L -l follow-link -f -d 'Always follow symbol link in SRC_PATH'
+complete -c docker -A -n '__fish_docker_using cp' -s q -l quiet -f -d 'Suppress progress output during copy. Progress'
 
 # create
 complete -c docker -f -n '__fish_docker_no_subcommand' -a create -d 'Create a new container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l add-host -f -d 'Add a custom host-to-IP mapping'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l annotation -f -d 'Add an annotation to the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l blkio-weight -f -d 'Block IO (relative weight),'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l blkio-weight-device -f -d 'Block IO weight (relative device'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cap-add -f -d 'Add Linux capabilities'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cap-drop -f -d 'Drop Linux capabilities'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cgroup-parent -f -d 'Optional parent cgroup for the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cgroupns -f -d 'Cgroup namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cidfile -f -d 'Write the container ID to the file'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpus -f -d 'Number of CPUs'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l cpuset-mems -f -d 'MEMs in which to allow execution'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device -f -d 'Add a host device to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device-read-bps -f -d 'Limit read rate (bytes per'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device-read-iops -f -d 'Limit read rate (IO per second)'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device-write-bps -f -d 'Limit write rate (bytes per'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l device-write-iops -f -d 'Limit write rate (IO per second)'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l dns -f -d 'Set custom DNS servers'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l dns-option -f -d 'Set DNS options'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l dns-search -f -d 'Set custom DNS search domains'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l domainname -f -d 'Container NIS domain name'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l env-file -f -d 'Read in a file of environment'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l expose -f -d 'Expose a port or a range of ports'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l gpus -f -d 'GPU devices to add to the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l group-add -f -d 'Add additional groups to join'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-cmd -f -d 'Command to run to check health'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-interval -f -d 'Time between running the check'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-retries -f -d 'Consecutive failures needed to'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-start-interval -f -d 'Time between running the check'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-start-period -f -d 'Start period for the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l health-timeout -f -d 'Maximum time to allow one check'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l help -f -d 'Print usage'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s h -l hostname -f -d 'Container host name'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l init -f -d 'Run an init inside the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l ipc -f -d 'IPC mode to use'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l isolation -f -d 'Container isolation technology'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s l -l label -f -d 'Set meta data on a container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l label-file -f -d 'Read in a line delimited file of'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l link -f -d 'Add link to another container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l log-driver -f -d 'Logging driver for the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l log-opt -f -d 'Log driver options'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l mac-address -f -d 'Container MAC address (e.g.,'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s m -l memory -f -d 'Memory limit'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l memory-reservation -f -d 'Memory soft limit'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l memory-swap -f -d 'Swap limit equal to memory plus'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l memory-swappiness -f -d 'Tune container memory swappiness'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l mount -f -d 'Attach a filesystem mount to the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l name -f -d 'Assign a name to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l network -f -d 'Connect a container to a network'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l network-alias -f -d 'Add network-scoped alias for the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l no-healthcheck -f -d 'Disable any container-specified'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l oom-kill-disable -f -d 'Disable OOM Killer'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l oom-score-adj -f -d "Tune host's OOM preferences"
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l pid -f -d 'PID namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l pids-limit -f -d 'Tune container pids limit (set'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l platform -f -d 'Set platform if server is'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l privileged -f -d 'Give extended privileges to this'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s p -l publish -f -d "Publish a container's port(s) to"
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s P -l publish-all -f -d 'Publish all exposed ports to'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l pull -f -d 'Pull image before creating'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s q -l quiet -f -d 'Suppress the pull output'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l read-only -f -d "Mount the container's root"
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l restart -f -d 'Restart policy to apply when a'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l rm -f -d 'Automatically remove the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l runtime -f -d 'Runtime to use for this container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l security-opt -f -d 'Security Options'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l shm-size -f -d 'Size of /dev/shm'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l stop-signal -f -d 'Signal to stop the container'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l storage-opt -f -d 'Storage driver options for the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l sysctl -f -d 'Sysctl options (default map[])'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l tmpfs -f -d 'Mount a tmpfs directory'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s t -l tty -f -d 'Allocate a pseudo-TTY'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l ulimit -f -d 'Ulimit options (default [])'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l use-api-socket -f -d 'Bind mount Docker API socket and'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s u -l user -f -d 'Username or UID (format:'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l userns -f -d 'User namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l uts -f -d 'UTS namespace to use'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s v -l volume -f -d 'Bind mount a volume'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l volume-driver -f -d 'Optional volume driver for the'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -l volumes-from -f -d 'Mount volumes from the specified'
-complete -c docker -A -n '__fish_seen_subcommand_from create' -s w -l workdir -f -d 'Working directory inside the'
-complete -c docker -A -f -n '__fish_seen_subcommand_from create' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -n '__fish_docker_using create' -l add-host -f -d 'Add a custom host-to-IP mapping'
+complete -c docker -A -n '__fish_docker_using create' -l annotation -f -d 'Add an annotation to the'
+complete -c docker -A -n '__fish_docker_using create' -s a -l attach -f -d 'Attach to STDIN, STDOUT or STDERR'
+complete -c docker -A -n '__fish_docker_using create' -l blkio-weight -f -d 'Block IO (relative weight),'
+complete -c docker -A -n '__fish_docker_using create' -l blkio-weight-device -f -d 'Block IO weight (relative device'
+complete -c docker -A -n '__fish_docker_using create' -l cap-add -f -d 'Add Linux capabilities'
+complete -c docker -A -n '__fish_docker_using create' -l cap-drop -f -d 'Drop Linux capabilities'
+complete -c docker -A -n '__fish_docker_using create' -l cgroup-parent -f -d 'Optional parent cgroup for the'
+complete -c docker -A -n '__fish_docker_using create' -l cgroupns -f -d 'Cgroup namespace to use'
+complete -c docker -A -n '__fish_docker_using create' -l cidfile -f -d 'Write the container ID to the file'
+complete -c docker -A -n '__fish_docker_using create' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using create' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using create' -l cpu-rt-period -f -d 'Limit CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using create' -l cpu-rt-runtime -f -d 'Limit CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using create' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using create' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using create' -l cpuset-cpus -f -d 'CPUs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using create' -l cpuset-mems -f -d 'MEMs in which to allow execution'
+complete -c docker -A -n '__fish_docker_using create' -l device -f -d 'Add a host device to the container'
+complete -c docker -A -n '__fish_docker_using create' -l device-cgroup-rule -f -d 'Add a rule to the cgroup allowed'
+complete -c docker -A -n '__fish_docker_using create' -l device-read-bps -f -d 'Limit read rate (bytes per'
+complete -c docker -A -n '__fish_docker_using create' -l device-read-iops -f -d 'Limit read rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using create' -l device-write-bps -f -d 'Limit write rate (bytes per'
+complete -c docker -A -n '__fish_docker_using create' -l device-write-iops -f -d 'Limit write rate (IO per second)'
+complete -c docker -A -n '__fish_docker_using create' -l dns -f -d 'Set custom DNS servers'
+complete -c docker -A -n '__fish_docker_using create' -l dns-option -f -d 'Set DNS options'
+complete -c docker -A -n '__fish_docker_using create' -l dns-search -f -d 'Set custom DNS search domains'
+complete -c docker -A -n '__fish_docker_using create' -l domainname -f -d 'Container NIS domain name'
+complete -c docker -A -n '__fish_docker_using create' -l entrypoint -f -d 'Overwrite the default ENTRYPOINT'
+complete -c docker -A -n '__fish_docker_using create' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using create' -l env-file -f -d 'Read in a file of environment'
+complete -c docker -A -n '__fish_docker_using create' -l expose -f -d 'Expose a port or a range of ports'
+complete -c docker -A -n '__fish_docker_using create' -l gpus -f -d 'GPU devices to add to the'
+complete -c docker -A -n '__fish_docker_using create' -l group-add -f -d 'Add additional groups to join'
+complete -c docker -A -n '__fish_docker_using create' -l health-cmd -f -d 'Command to run to check health'
+complete -c docker -A -n '__fish_docker_using create' -l health-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using create' -l health-retries -f -d 'Consecutive failures needed to'
+complete -c docker -A -n '__fish_docker_using create' -l health-start-interval -f -d 'Time between running the check'
+complete -c docker -A -n '__fish_docker_using create' -l health-start-period -f -d 'Start period for the container'
+complete -c docker -A -n '__fish_docker_using create' -l health-timeout -f -d 'Maximum time to allow one check'
+complete -c docker -A -n '__fish_docker_using create' -l help -f -d 'Print usage'
+complete -c docker -A -n '__fish_docker_using create' -s h -l hostname -f -d 'Container host name'
+complete -c docker -A -n '__fish_docker_using create' -l init -f -d 'Run an init inside the container'
+complete -c docker -A -n '__fish_docker_using create' -s i -l interactive -f -d 'Keep STDIN open even if not attached'
+complete -c docker -A -n '__fish_docker_using create' -l ip -f -d 'IPv4 address (e.g., 172.30.100.104)'
+complete -c docker -A -n '__fish_docker_using create' -l ip6 -f -d 'IPv6 address (e.g., 2001:db8::33)'
+complete -c docker -A -n '__fish_docker_using create' -l ipc -f -d 'IPC mode to use'
+complete -c docker -A -n '__fish_docker_using create' -l isolation -f -d 'Container isolation technology'
+complete -c docker -A -n '__fish_docker_using create' -s l -l label -f -d 'Set meta data on a container'
+complete -c docker -A -n '__fish_docker_using create' -l label-file -f -d 'Read in a line delimited file of'
+complete -c docker -A -n '__fish_docker_using create' -l link -f -d 'Add link to another container'
+complete -c docker -A -n '__fish_docker_using create' -l link-local-ip -f -d 'Container IPv4/IPv6 link-local'
+complete -c docker -A -n '__fish_docker_using create' -l log-driver -f -d 'Logging driver for the container'
+complete -c docker -A -n '__fish_docker_using create' -l log-opt -f -d 'Log driver options'
+complete -c docker -A -n '__fish_docker_using create' -l mac-address -f -d 'Container MAC address (e.g.,'
+complete -c docker -A -n '__fish_docker_using create' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using create' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using create' -l memory-swap -f -d 'Swap limit equal to memory plus'
+complete -c docker -A -n '__fish_docker_using create' -l memory-swappiness -f -d 'Tune container memory swappiness'
+complete -c docker -A -n '__fish_docker_using create' -l mount -f -d 'Attach a filesystem mount to the'
+complete -c docker -A -n '__fish_docker_using create' -l name -f -d 'Assign a name to the container'
+complete -c docker -A -n '__fish_docker_using create' -l network -f -d 'Connect a container to a network'
+complete -c docker -A -n '__fish_docker_using create' -l network-alias -f -d 'Add network-scoped alias for the'
+complete -c docker -A -n '__fish_docker_using create' -l no-healthcheck -f -d 'Disable any container-specified'
+complete -c docker -A -n '__fish_docker_using create' -l oom-kill-disable -f -d 'Disable OOM Killer'
+complete -c docker -A -n '__fish_docker_using create' -l oom-score-adj -f -d "Tune host's OOM preferences"
+complete -c docker -A -n '__fish_docker_using create' -l pid -f -d 'PID namespace to use'
+complete -c docker -A -n '__fish_docker_using create' -l pids-limit -f -d 'Tune container pids limit (set'
+complete -c docker -A -n '__fish_docker_using create' -l platform -f -d 'Set platform if server is'
+complete -c docker -A -n '__fish_docker_using create' -l privileged -f -d 'Give extended privileges to this'
+complete -c docker -A -n '__fish_docker_using create' -s p -l publish -f -d "Publish a container's port(s) to"
+complete -c docker -A -n '__fish_docker_using create' -s P -l publish-all -f -d 'Publish all exposed ports to'
+complete -c docker -A -n '__fish_docker_using create' -l pull -f -d 'Pull image before creating'
+complete -c docker -A -n '__fish_docker_using create' -s q -l quiet -f -d 'Suppress the pull output'
+complete -c docker -A -n '__fish_docker_using create' -l read-only -f -d "Mount the container's root"
+complete -c docker -A -n '__fish_docker_using create' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -n '__fish_docker_using create' -l rm -f -d 'Automatically remove the'
+complete -c docker -A -n '__fish_docker_using create' -l runtime -f -d 'Runtime to use for this container'
+complete -c docker -A -n '__fish_docker_using create' -l security-opt -f -d 'Security Options'
+complete -c docker -A -n '__fish_docker_using create' -l shm-size -f -d 'Size of /dev/shm'
+complete -c docker -A -n '__fish_docker_using create' -l stop-signal -f -d 'Signal to stop the container'
+complete -c docker -A -n '__fish_docker_using create' -l stop-timeout -f -d 'Timeout (in seconds) to stop a'
+complete -c docker -A -n '__fish_docker_using create' -l storage-opt -f -d 'Storage driver options for the'
+complete -c docker -A -n '__fish_docker_using create' -l sysctl -f -d 'Sysctl options (default map[])'
+complete -c docker -A -n '__fish_docker_using create' -l tmpfs -f -d 'Mount a tmpfs directory'
+complete -c docker -A -n '__fish_docker_using create' -s t -l tty -f -d 'Allocate a pseudo-TTY'
+complete -c docker -A -n '__fish_docker_using create' -l ulimit -f -d 'Ulimit options (default [])'
+complete -c docker -A -n '__fish_docker_using create' -l use-api-socket -f -d 'Bind mount Docker API socket and'
+complete -c docker -A -n '__fish_docker_using create' -s u -l user -f -d 'Username or UID (format:'
+complete -c docker -A -n '__fish_docker_using create' -l userns -f -d 'User namespace to use'
+complete -c docker -A -n '__fish_docker_using create' -l uts -f -d 'UTS namespace to use'
+complete -c docker -A -n '__fish_docker_using create' -s v -l volume -f -d 'Bind mount a volume'
+complete -c docker -A -n '__fish_docker_using create' -l volume-driver -f -d 'Optional volume driver for the'
+complete -c docker -A -n '__fish_docker_using create' -l volumes-from -f -d 'Mount volumes from the specified'
+complete -c docker -A -n '__fish_docker_using create' -s w -l workdir -f -d 'Working directory inside the'
+complete -c docker -A -f -n '__fish_docker_using create' -a '(__fish_print_docker_images)' -d "Image"
 
 # diff
 complete -c docker -f -n '__fish_docker_no_subcommand' -a diff -d "Inspect changes to files or directories on a container's filesystem"
-complete -c docker -A -f -n '__fish_seen_subcommand_from diff' -a '(__fish_print_docker_containers all)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using diff' -a '(__fish_print_docker_containers all)' -d "Container"
 
 # events
 complete -c docker -f -n '__fish_docker_no_subcommand' -a events -d 'Get real time events from the server'
-complete -c docker -A -n '__fish_seen_subcommand_from events' -s f -l filter -f -d 'Filter output based on conditions provided'
-complete -c docker -A -n '__fish_seen_subcommand_from events' -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from events' -l since -f -d 'Show all events created since timestamp'
-complete -c docker -A -n '__fish_seen_subcommand_from events' -l until -f -d 'Stream events until this timestamp'
+complete -c docker -A -n '__fish_docker_using events' -s f -l filter -f -d 'Filter output based on conditions provided'
+complete -c docker -A -n '__fish_docker_using events' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using events' -l since -f -d 'Show all events created since timestamp'
+complete -c docker -A -n '__fish_docker_using events' -l until -f -d 'Stream events until this timestamp'
 
 # export
 complete -c docker -f -n '__fish_docker_no_subcommand' -a export -d "Export a container's filesystem as a tar archive"
-complete -c docker -A -n '__fish_seen_subcommand_from export' -s o -l output -f -d 'Write to a file, instead of STDOUT'
-complete -c docker -A -f -n '__fish_seen_subcommand_from export' -a '(__fish_print_docker_containers all)' -d "Container"
+complete -c docker -A -n '__fish_docker_using export' -s o -l output -f -d 'Write to a file, instead of STDOUT'
+complete -c docker -A -f -n '__fish_docker_using export' -a '(__fish_print_docker_containers all)' -d "Container"
 
 # history
 complete -c docker -f -n '__fish_docker_no_subcommand' -a history -d 'Show the history of an image'
-complete -c docker -A -n '__fish_seen_subcommand_from history' -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from history' -s H -l human -f -d 'Print sizes and dates in human readable format'
-complete -c docker -A -n '__fish_seen_subcommand_from history' -l no-trunc -f -d "Don't truncate output"
-complete -c docker -A -n '__fish_seen_subcommand_from history' -l platform -f -d 'Show history for the given platform. Formatted'
-complete -c docker -A -n '__fish_seen_subcommand_from history' -s q -l quiet -f -d 'Only show image IDs'
-complete -c docker -A -f -n '__fish_seen_subcommand_from history' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -n '__fish_docker_using history' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using history' -s H -l human -f -d 'Print sizes and dates in human readable format'
+complete -c docker -A -n '__fish_docker_using history' -l no-trunc -f -d "Don't truncate output"
+complete -c docker -A -n '__fish_docker_using history' -l platform -f -d 'Show history for the given platform. Formatted'
+complete -c docker -A -n '__fish_docker_using history' -s q -l quiet -f -d 'Only show image IDs'
+complete -c docker -A -f -n '__fish_docker_using history' -a '(__fish_print_docker_images)' -d "Image"
 
 # import
 complete -c docker -f -n '__fish_docker_no_subcommand' -a import -d 'Import the contents from a tarball to create a filesystem image'
-complete -c docker -A -n '__fish_seen_subcommand_from import' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
-complete -c docker -A -n '__fish_seen_subcommand_from import' -s m -l message -f -d 'Set commit message for imported image'
-complete -c docker -A -n '__fish_seen_subcommand_from import' -l platform -f -d 'Set platform if server is multi-platform capable'
+complete -c docker -A -n '__fish_docker_using import' -s c -l change -f -d 'Apply Dockerfile instruction to the created image'
+complete -c docker -A -n '__fish_docker_using import' -s m -l message -f -d 'Set commit message for imported image'
+complete -c docker -A -n '__fish_docker_using import' -l platform -f -d 'Set platform if server is multi-platform capable'
 
 # inspect
 complete -c docker -f -n '__fish_docker_no_subcommand' -a inspect -d 'Return low-level information on Docker objects'
-complete -c docker -A -n '__fish_seen_subcommand_from inspect' -s f -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from inspect' -s s -l size -f -d 'Display total file sizes if the type is container'
-complete -c docker -A -n '__fish_seen_subcommand_from inspect' -l type -f -d 'Only inspect objects of the given type'
+complete -c docker -A -n '__fish_docker_using inspect' -s f -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using inspect' -s s -l size -f -d 'Display total file sizes if the type is container'
+complete -c docker -A -n '__fish_docker_using inspect' -l type -f -d 'Only inspect objects of the given type'
 
 # kill
 complete -c docker -f -n '__fish_docker_no_subcommand' -a kill -d 'Kill one or more running containers'
-complete -c docker -A -n '__fish_seen_subcommand_from kill' -s s -l signal -f -d 'Signal to send to the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from kill' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using kill' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -f -n '__fish_docker_using kill' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # load
 complete -c docker -f -n '__fish_docker_no_subcommand' -a load -d 'Load an image from a tar archive or STDIN'
-complete -c docker -A -n '__fish_seen_subcommand_from load' -s i -l input -f -d 'Read from tar archive file, instead of STDIN'
-complete -c docker -A -n '__fish_seen_subcommand_from load' -l platform -f -d 'Load only the given platform(s). Formatted as'
-complete -c docker -A -n '__fish_seen_subcommand_from load' -s q -l quiet -f -d 'Suppress the load output'
+complete -c docker -A -n '__fish_docker_using load' -s i -l input -f -d 'Read from tar archive file, instead of STDIN'
+complete -c docker -A -n '__fish_docker_using load' -l platform -f -d 'Load only the given platform(s). Formatted as'
+complete -c docker -A -n '__fish_docker_using load' -s q -l quiet -f -d 'Suppress the load output'
 
 # logs
 complete -c docker -f -n '__fish_docker_no_subcommand' -a logs -d 'Fetch the logs of a container'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -l details -f -d 'Show extra details provided to logs'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -s f -l follow -f -d 'Follow log output'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -l since -f -d 'Show logs since timestamp (e.g.'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -s n -l tail -f -d 'Number of lines to show from the end of the logs'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -s t -l timestamps -f -d 'Show timestamps'
-complete -c docker -A -n '__fish_seen_subcommand_from logs' -l until -f -d 'Show logs before a timestamp (e.g.'
-complete -c docker -A -f -n '__fish_seen_subcommand_from logs' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using logs' -l details -f -d 'Show extra details provided to logs'
+complete -c docker -A -n '__fish_docker_using logs' -s f -l follow -f -d 'Follow log output'
+complete -c docker -A -n '__fish_docker_using logs' -l since -f -d 'Show logs since timestamp (e.g.'
+complete -c docker -A -n '__fish_docker_using logs' -s n -l tail -f -d 'Number of lines to show from the end of the logs'
+complete -c docker -A -n '__fish_docker_using logs' -s t -l timestamps -f -d 'Show timestamps'
+complete -c docker -A -n '__fish_docker_using logs' -l until -f -d 'Show logs before a timestamp (e.g.'
+complete -c docker -A -f -n '__fish_docker_using logs' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # pause
 complete -c docker -f -n '__fish_docker_no_subcommand' -a pause -d 'Pause all processes within one or more containers'
-complete -c docker -A -f -n '__fish_seen_subcommand_from pause' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using pause' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # port
 complete -c docker -f -n '__fish_docker_no_subcommand' -a port -d 'List port mappings or a specific mapping for the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from port' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using port' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # rename
 complete -c docker -f -n '__fish_docker_no_subcommand' -a rename -d 'Rename a container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from rename' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using rename' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # restart
 complete -c docker -f -n '__fish_docker_no_subcommand' -a restart -d 'Restart one or more containers'
-complete -c docker -A -n '__fish_seen_subcommand_from restart' -s s -l signal -f -d 'Signal to send to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from restart' -s t -l timeout -f -d 'Seconds to wait before killing the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from restart' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using restart' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -n '__fish_docker_using restart' -s t -l timeout -f -d 'Seconds to wait before killing the container'
+complete -c docker -A -f -n '__fish_docker_using restart' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # rm
 complete -c docker -f -n '__fish_docker_no_subcommand' -a rm -d 'Remove one or more containers'
-complete -c docker -A -n '__fish_seen_subcommand_from rm' -s f -l force -f -d 'Force the removal of a running container (uses SIGKILL)'
-complete -c docker -A -n '__fish_seen_subcommand_from rm' -s l -l link -f -d 'Remove the specified link'
-complete -c docker -A -n '__fish_seen_subcommand_from rm' -s v -l volumes -f -d 'Remove anonymous volumes associated with the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from rm' -a '(__fish_print_docker_containers stopped)' -d "Container"
+complete -c docker -A -n '__fish_docker_using rm' -s f -l force -f -d 'Force the removal of a running container (uses SIGKILL)'
+complete -c docker -A -n '__fish_docker_using rm' -s l -l link -f -d 'Remove the specified link'
+complete -c docker -A -n '__fish_docker_using rm' -s v -l volumes -f -d 'Remove anonymous volumes associated with the container'
+complete -c docker -A -f -n '__fish_docker_using rm' -a '(__fish_print_docker_containers stopped)' -d "Container"
 
 # rmi
 complete -c docker -f -n '__fish_docker_no_subcommand' -a rmi -d 'Remove one or more images'
-complete -c docker -A -n '__fish_seen_subcommand_from rmi' -s f -l force -f -d 'Force removal of the image'
-complete -c docker -A -n '__fish_seen_subcommand_from rmi' -l no-prune -f -d 'Do not delete untagged parents'
-complete -c docker -A -n '__fish_seen_subcommand_from rmi' -l platform -f -d 'Remove only the given platform variant.'
-complete -c docker -A -f -n '__fish_seen_subcommand_from rmi' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -n '__fish_docker_using rmi' -s f -l force -f -d 'Force removal of the image'
+complete -c docker -A -n '__fish_docker_using rmi' -l no-prune -f -d 'Do not delete untagged parents'
+complete -c docker -A -n '__fish_docker_using rmi' -l platform -f -d 'Remove only the given platform variant.'
+complete -c docker -A -f -n '__fish_docker_using rmi' -a '(__fish_print_docker_images)' -d "Image"
 
 # save
 complete -c docker -f -n '__fish_docker_no_subcommand' -a save -d 'Save one or more images to a tar archive (streamed to STDOUT by default)'
-complete -c docker -A -n '__fish_seen_subcommand_from save' -s o -l output -f -d 'Write to a file, instead of STDOUT'
-complete -c docker -A -n '__fish_seen_subcommand_from save' -l platform -f -d 'Save only the given platform(s). Formatted as'
-complete -c docker -A -f -n '__fish_seen_subcommand_from save' -a '(__fish_print_docker_images)' -d "Image"
+complete -c docker -A -n '__fish_docker_using save' -s o -l output -f -d 'Write to a file, instead of STDOUT'
+complete -c docker -A -n '__fish_docker_using save' -l platform -f -d 'Save only the given platform(s). Formatted as'
+complete -c docker -A -f -n '__fish_docker_using save' -a '(__fish_print_docker_images)' -d "Image"
 
 # start
 complete -c docker -f -n '__fish_docker_no_subcommand' -a start -d 'Start one or more stopped containers'
-complete -c docker -A -n '__fish_seen_subcommand_from start' -s a -l attach -f -d 'Attach STDOUT/STDERR and forward signals'
-complete -c docker -A -n '__fish_seen_subcommand_from start' -l detach-keys -f -d 'Override the key sequence for detaching a'
-complete -c docker -A -n '__fish_seen_subcommand_from start' -s i -l interactive -f -d "Attach container's STDIN"
-complete -c docker -A -f -n '__fish_seen_subcommand_from start' -a '(__fish_print_docker_containers stopped)' -d "Container"
+complete -c docker -A -n '__fish_docker_using start' -s a -l attach -f -d 'Attach STDOUT/STDERR and forward signals'
+complete -c docker -A -n '__fish_docker_using start' -l detach-keys -f -d 'Override the key sequence for detaching a'
+complete -c docker -A -n '__fish_docker_using start' -s i -l interactive -f -d "Attach container's STDIN"
+complete -c docker -A -f -n '__fish_docker_using start' -a '(__fish_print_docker_containers stopped)' -d "Container"
 
 # stats
 complete -c docker -f -n '__fish_docker_no_subcommand' -a stats -d 'Display a live stream of container(s) resource usage statistics'
-complete -c docker -A -n '__fish_seen_subcommand_from stats' -s a -l all -f -d 'Show all containers (default shows just running)'
-complete -c docker -A -n '__fish_seen_subcommand_from stats' -l format -f -d 'Format output using a custom template:'
-complete -c docker -A -n '__fish_seen_subcommand_from stats' -l no-stream -f -d 'Disable streaming stats and only pull the first result'
-complete -c docker -A -n '__fish_seen_subcommand_from stats' -l no-trunc -f -d 'Do not truncate output'
-complete -c docker -A -f -n '__fish_seen_subcommand_from stats' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using stats' -s a -l all -f -d 'Show all containers (default shows just running)'
+complete -c docker -A -n '__fish_docker_using stats' -l format -f -d 'Format output using a custom template:'
+complete -c docker -A -n '__fish_docker_using stats' -l no-stream -f -d 'Disable streaming stats and only pull the first result'
+complete -c docker -A -n '__fish_docker_using stats' -l no-trunc -f -d 'Do not truncate output'
+complete -c docker -A -f -n '__fish_docker_using stats' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # stop
 complete -c docker -f -n '__fish_docker_no_subcommand' -a stop -d 'Stop one or more running containers'
-complete -c docker -A -n '__fish_seen_subcommand_from stop' -s s -l signal -f -d 'Signal to send to the container'
-complete -c docker -A -n '__fish_seen_subcommand_from stop' -s t -l timeout -f -d 'Seconds to wait before killing the container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from stop' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using stop' -s s -l signal -f -d 'Signal to send to the container'
+complete -c docker -A -n '__fish_docker_using stop' -s t -l timeout -f -d 'Seconds to wait before killing the container'
+complete -c docker -A -f -n '__fish_docker_using stop' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # tag
 complete -c docker -f -n '__fish_docker_no_subcommand' -a tag -d 'Create a tag TARGET_IMAGE that refers to SOURCE_IMAGE'
 
 # top
 complete -c docker -f -n '__fish_docker_no_subcommand' -a top -d 'Display the running processes of a container'
-complete -c docker -A -f -n '__fish_seen_subcommand_from top' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using top' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # unpause
 complete -c docker -f -n '__fish_docker_no_subcommand' -a unpause -d 'Unpause all processes within one or more containers'
-complete -c docker -A -f -n '__fish_seen_subcommand_from unpause' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -f -n '__fish_docker_using unpause' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # update
 complete -c docker -f -n '__fish_docker_no_subcommand' -a update -d 'Update configuration of one or more containers'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l blkio-weight -f -d 'Block IO (relative weight), between 10'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpu-rt-period -f -d 'Limit the CPU real-time period in'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpu-rt-runtime -f -d 'Limit the CPU real-time runtime in'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpus -f -d 'Number of CPUs'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpuset-cpus -f -d 'CPUs in which to allow execution (0-3, 0,1)'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l cpuset-mems -f -d 'MEMs in which to allow execution (0-3, 0,1)'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -s m -l memory -f -d 'Memory limit'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l memory-reservation -f -d 'Memory soft limit'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l memory-swap -f -d 'Swap limit equal to memory plus swap:'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l pids-limit -f -d 'Tune container pids limit (set -1 for'
-complete -c docker -A -n '__fish_seen_subcommand_from update' -l restart -f -d 'Restart policy to apply when a'
-complete -c docker -A -f -n '__fish_seen_subcommand_from update' -a '(__fish_print_docker_containers running)' -d "Container"
+complete -c docker -A -n '__fish_docker_using update' -l blkio-weight -f -d 'Block IO (relative weight), between 10'
+complete -c docker -A -n '__fish_docker_using update' -l cpu-period -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using update' -l cpu-quota -f -d 'Limit CPU CFS (Completely Fair'
+complete -c docker -A -n '__fish_docker_using update' -l cpu-rt-period -f -d 'Limit the CPU real-time period in'
+complete -c docker -A -n '__fish_docker_using update' -l cpu-rt-runtime -f -d 'Limit the CPU real-time runtime in'
+complete -c docker -A -n '__fish_docker_using update' -s c -l cpu-shares -f -d 'CPU shares (relative weight)'
+complete -c docker -A -n '__fish_docker_using update' -l cpus -f -d 'Number of CPUs'
+complete -c docker -A -n '__fish_docker_using update' -l cpuset-cpus -f -d 'CPUs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using update' -l cpuset-mems -f -d 'MEMs in which to allow execution (0-3, 0,1)'
+complete -c docker -A -n '__fish_docker_using update' -s m -l memory -f -d 'Memory limit'
+complete -c docker -A -n '__fish_docker_using update' -l memory-reservation -f -d 'Memory soft limit'
+complete -c docker -A -n '__fish_docker_using update' -l memory-swap -f -d 'Swap limit equal to memory plus swap:'
+complete -c docker -A -n '__fish_docker_using update' -l pids-limit -f -d 'Tune container pids limit (set -1 for'
+complete -c docker -A -n '__fish_docker_using update' -l restart -f -d 'Restart policy to apply when a'
+complete -c docker -A -f -n '__fish_docker_using update' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # wait
 complete -c docker -f -n '__fish_docker_no_subcommand' -a wait -d 'Block until one or more containers stop, then print their exit codes'
-complete -c docker -A -f -n '__fish_seen_subcommand_from wait' -a '(__fish_print_docker_containers running)' -d "Container"
-
+complete -c docker -A -f -n '__fish_docker_using wait' -a '(__fish_print_docker_containers running)' -d "Container"
 
 # compose
-# Helper functions for docker compose completions
-function __fish_docker_compose_no_subcommand --description 'Test if compose has yet to be given a subcommand'
-    set -l cmd (commandline -opc)
-    if not contains compose $cmd
-        return 1
-    end
-    for i in $cmd
-        if contains -- $i attach build commit config cp create down events exec export images kill logs ls pause port ps publish pull push restart rm run scale start stats stop top unpause up version volumes wait watch
-            return 1
-        end
-    end
-    return 0
-end
-
-function __fish_docker_compose_has_subcommand --description 'Test if compose subcommand is given' -a subcmd
-    set -l cmd (commandline -opc)
-    if not contains compose $cmd
-        return 1
-    end
-    if contains -- $subcmd $cmd
-        return 0
-    end
-    return 1
-end
-
-function __fish_print_docker_compose_services --description 'Print a list of docker compose services'
-    docker compose config --services 2>/dev/null | command sort
-end
-
-# compose subcommand
 complete -c docker -f -n '__fish_docker_no_subcommand' -a compose -d 'Define and run multi-container applications'
+complete -c docker -A -n '__fish_docker_using compose' -l all-resources -f -d 'Include all resources'
+complete -c docker -A -n '__fish_docker_using compose' -l ansi -f -d 'Control ANSI output (never|always|auto)'
+complete -c docker -A -n '__fish_docker_using compose' -l compatibility -f -d 'Run in backward compatibility mode'
+complete -c docker -A -n '__fish_docker_using compose' -l dry-run -f -d 'Execute in dry run mode'
+complete -c docker -A -n '__fish_docker_using compose' -l env-file -f -d 'Alternate environment file'
+complete -c docker -A -n '__fish_docker_using compose' -s f -l file -f -d 'Compose configuration files'
+complete -c docker -A -n '__fish_docker_using compose' -l parallel -f -d 'Control max parallelism'
+complete -c docker -A -n '__fish_docker_using compose' -l profile -f -d 'Specify a profile to enable'
+complete -c docker -A -n '__fish_docker_using compose' -l progress -f -d 'Progress output type (auto|tty|plain|json|quiet)'
+complete -c docker -A -n '__fish_docker_using compose' -l project-directory -f -d 'Alternate working directory'
+complete -c docker -A -n '__fish_docker_using compose' -s p -l project-name -f -d 'Project name'
+
+# compose attach
+complete -c docker -f -n '__fish_docker_using compose' -a attach -d 'Attach to a running container'
+complete -c docker -A -f -n '__fish_docker_using compose attach' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose build
+complete -c docker -f -n '__fish_docker_using compose' -a build -d 'Build or rebuild services'
+complete -c docker -A -n '__fish_docker_using compose build' -l build-arg -f -d 'Set build-time variables'
+complete -c docker -A -n '__fish_docker_using compose build' -l builder -f -d 'Set builder to use'
+complete -c docker -A -n '__fish_docker_using compose build' -l memory -f -d 'Set memory limit for build'
+complete -c docker -A -n '__fish_docker_using compose build' -l no-cache -f -d 'Do not use cache'
+complete -c docker -A -n '__fish_docker_using compose build' -l pull -f -d 'Always pull newer image'
+complete -c docker -A -n '__fish_docker_using compose build' -l push -f -d 'Push images after build'
+complete -c docker -A -n '__fish_docker_using compose build' -s q -l quiet -f -d 'Do not print anything'
+complete -c docker -A -n '__fish_docker_using compose build' -l ssh -f -d 'Set SSH agent socket or keys'
+complete -c docker -A -f -n '__fish_docker_using compose build' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose commit
+complete -c docker -f -n '__fish_docker_using compose' -a commit -d 'Create image from container changes'
+
+# compose config
+complete -c docker -f -n '__fish_docker_using compose' -a config -d 'Parse and render compose file'
+
+# compose cp
+complete -c docker -f -n '__fish_docker_using compose' -a cp -d 'Copy files between container and host'
+
+# compose create
+complete -c docker -f -n '__fish_docker_using compose' -a create -d 'Create containers for a service'
+complete -c docker -A -f -n '__fish_docker_using compose create' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose down
+complete -c docker -f -n '__fish_docker_using compose' -a down -d 'Stop and remove containers, networks'
+complete -c docker -A -n '__fish_docker_using compose down' -l remove-orphans -f -d 'Remove containers not in compose file'
+complete -c docker -A -n '__fish_docker_using compose down' -l rmi -f -d 'Remove images (all|local)'
+complete -c docker -A -n '__fish_docker_using compose down' -s t -l timeout -f -d 'Shutdown timeout in seconds'
+complete -c docker -A -n '__fish_docker_using compose down' -s v -l volumes -f -d 'Remove named volumes'
+complete -c docker -A -f -n '__fish_docker_using compose down' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose events
+complete -c docker -f -n '__fish_docker_using compose' -a events -d 'Receive real time events'
+complete -c docker -A -f -n '__fish_docker_using compose events' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose exec
+complete -c docker -f -n '__fish_docker_using compose' -a exec -d 'Execute command in running container'
+complete -c docker -A -n '__fish_docker_using compose exec' -s d -l detach -f -d 'Run in background'
+complete -c docker -A -n '__fish_docker_using compose exec' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using compose exec' -l index -f -d 'Index of container if scaled'
+complete -c docker -A -n '__fish_docker_using compose exec' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
+complete -c docker -A -n '__fish_docker_using compose exec' -l privileged -f -d 'Give extended privileges'
+complete -c docker -A -n '__fish_docker_using compose exec' -s u -l user -f -d 'Run as this user'
+complete -c docker -A -n '__fish_docker_using compose exec' -s w -l workdir -f -d 'Working directory inside container'
+complete -c docker -A -f -n '__fish_docker_using compose exec' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose export
+complete -c docker -f -n '__fish_docker_using compose' -a export -d 'Export container filesystem as tar'
+
+# compose images
+complete -c docker -f -n '__fish_docker_using compose' -a images -d 'List images used by containers'
+
+# compose kill
+complete -c docker -f -n '__fish_docker_using compose' -a kill -d 'Force stop service containers'
+complete -c docker -A -f -n '__fish_docker_using compose kill' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose logs
+complete -c docker -f -n '__fish_docker_using compose' -a logs -d 'View output from containers'
+complete -c docker -A -n '__fish_docker_using compose logs' -s f -l follow -f -d 'Follow log output'
+complete -c docker -A -n '__fish_docker_using compose logs' -l no-color -f -d 'Produce monochrome output'
+complete -c docker -A -n '__fish_docker_using compose logs' -l no-log-prefix -f -d 'Do not print prefix in logs'
+complete -c docker -A -n '__fish_docker_using compose logs' -l since -f -d 'Show logs since timestamp'
+complete -c docker -A -n '__fish_docker_using compose logs' -s n -l tail -f -d 'Number of lines from end of logs'
+complete -c docker -A -n '__fish_docker_using compose logs' -s t -l timestamps -f -d 'Show timestamps'
+complete -c docker -A -n '__fish_docker_using compose logs' -l until -f -d 'Show logs before timestamp'
+complete -c docker -A -f -n '__fish_docker_using compose logs' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose ls
+complete -c docker -f -n '__fish_docker_using compose' -a ls -d 'List running compose projects'
+
+# compose pause
+complete -c docker -f -n '__fish_docker_using compose' -a pause -d 'Pause services'
+complete -c docker -A -f -n '__fish_docker_using compose pause' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose port
+complete -c docker -f -n '__fish_docker_using compose' -a port -d 'Print public port for a port binding'
+
+# compose ps
+complete -c docker -f -n '__fish_docker_using compose' -a ps -d 'List containers'
+complete -c docker -A -n '__fish_docker_using compose ps' -s a -l all -f -d 'Show all containers'
+complete -c docker -A -n '__fish_docker_using compose ps' -l filter -f -d 'Filter output'
+complete -c docker -A -n '__fish_docker_using compose ps' -l format -f -d 'Format output (table|json)'
+complete -c docker -A -n '__fish_docker_using compose ps' -l no-trunc -f -d 'Do not truncate output'
+complete -c docker -A -n '__fish_docker_using compose ps' -l orphans -f -d 'Include orphaned containers'
+complete -c docker -A -n '__fish_docker_using compose ps' -s q -l quiet -f -d 'Only display container IDs'
+complete -c docker -A -n '__fish_docker_using compose ps' -l services -f -d 'Display services'
+complete -c docker -A -n '__fish_docker_using compose ps' -l status -f -d 'Filter by status'
+complete -c docker -A -f -n '__fish_docker_using compose ps' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose publish
+complete -c docker -f -n '__fish_docker_using compose' -a publish -d 'Publish compose application'
+
+# compose pull
+complete -c docker -f -n '__fish_docker_using compose' -a pull -d 'Pull service images'
+complete -c docker -A -n '__fish_docker_using compose pull' -l ignore-buildable -f -d 'Ignore images that can be built'
+complete -c docker -A -n '__fish_docker_using compose pull' -l ignore-pull-failures -f -d 'Pull what it can and ignore failures'
+complete -c docker -A -n '__fish_docker_using compose pull' -l include-deps -f -d 'Also pull service dependencies'
+complete -c docker -A -n '__fish_docker_using compose pull' -l policy -f -d 'Apply pull policy (missing|always)'
+complete -c docker -A -n '__fish_docker_using compose pull' -s q -l quiet -f -d 'Pull without printing progress'
+complete -c docker -A -f -n '__fish_docker_using compose pull' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose push
+complete -c docker -f -n '__fish_docker_using compose' -a push -d 'Push service images'
+complete -c docker -A -n '__fish_docker_using compose push' -l ignore-push-failures -f -d 'Push what it can and ignore failures'
+complete -c docker -A -n '__fish_docker_using compose push' -l include-deps -f -d 'Also push service dependencies'
+complete -c docker -A -n '__fish_docker_using compose push' -s q -l quiet -f -d 'Push without printing progress'
+complete -c docker -A -f -n '__fish_docker_using compose push' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose restart
+complete -c docker -f -n '__fish_docker_using compose' -a restart -d 'Restart service containers'
+complete -c docker -A -f -n '__fish_docker_using compose restart' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose rm
+complete -c docker -f -n '__fish_docker_using compose' -a rm -d 'Remove stopped service containers'
+complete -c docker -A -f -n '__fish_docker_using compose rm' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose run
+complete -c docker -f -n '__fish_docker_using compose' -a run -d 'Run a one-off command'
+complete -c docker -A -n '__fish_docker_using compose run' -l build -f -d 'Build image before running'
+complete -c docker -A -n '__fish_docker_using compose run' -l cap-add -f -d 'Add Linux capabilities'
+complete -c docker -A -n '__fish_docker_using compose run' -l cap-drop -f -d 'Drop Linux capabilities'
+complete -c docker -A -n '__fish_docker_using compose run' -s d -l detach -f -d 'Run in background'
+complete -c docker -A -n '__fish_docker_using compose run' -l entrypoint -f -d 'Override entrypoint'
+complete -c docker -A -n '__fish_docker_using compose run' -s e -l env -f -d 'Set environment variables'
+complete -c docker -A -n '__fish_docker_using compose run' -s i -l interactive -f -d 'Keep STDIN open'
+complete -c docker -A -n '__fish_docker_using compose run' -s l -l label -f -d 'Add or override label'
+complete -c docker -A -n '__fish_docker_using compose run' -l name -f -d 'Assign a name to the container'
+complete -c docker -A -n '__fish_docker_using compose run' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
+complete -c docker -A -n '__fish_docker_using compose run' -l no-deps -f -d 'Do not start linked services'
+complete -c docker -A -n '__fish_docker_using compose run' -s p -l publish -f -d 'Publish container port'
+complete -c docker -A -n '__fish_docker_using compose run' -l quiet-pull -f -d 'Pull without printing progress'
+complete -c docker -A -n '__fish_docker_using compose run' -l rm -f -d 'Remove container when it exits'
+complete -c docker -A -n '__fish_docker_using compose run' -l service-ports -f -d 'Run with service port mappings'
+complete -c docker -A -n '__fish_docker_using compose run' -l use-aliases -f -d 'Use service network aliases'
+complete -c docker -A -n '__fish_docker_using compose run' -s u -l user -f -d 'Run as this user'
+complete -c docker -A -n '__fish_docker_using compose run' -s v -l volume -f -d 'Bind mount a volume'
+complete -c docker -A -n '__fish_docker_using compose run' -s w -l workdir -f -d 'Working directory inside container'
+complete -c docker -A -f -n '__fish_docker_using compose run' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose scale
+complete -c docker -f -n '__fish_docker_using compose' -a scale -d 'Scale services'
+
+# compose start
+complete -c docker -f -n '__fish_docker_using compose' -a start -d 'Start services'
+complete -c docker -A -f -n '__fish_docker_using compose start' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose stats
+complete -c docker -f -n '__fish_docker_using compose' -a stats -d 'Display container resource usage'
+
+# compose stop
+complete -c docker -f -n '__fish_docker_using compose' -a stop -d 'Stop services'
+complete -c docker -A -f -n '__fish_docker_using compose stop' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose top
+complete -c docker -f -n '__fish_docker_using compose' -a top -d 'Display running processes'
+complete -c docker -A -f -n '__fish_docker_using compose top' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose unpause
+complete -c docker -f -n '__fish_docker_using compose' -a unpause -d 'Unpause services'
+complete -c docker -A -f -n '__fish_docker_using compose unpause' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose up
+complete -c docker -f -n '__fish_docker_using compose' -a up -d 'Create and start containers'
+complete -c docker -A -n '__fish_docker_using compose up' -l abort-on-container-exit -f -d 'Stop all containers if any stop'
+complete -c docker -A -n '__fish_docker_using compose up' -l always-recreate-deps -f -d 'Recreate dependent containers'
+complete -c docker -A -n '__fish_docker_using compose up' -l attach -f -d 'Restrict attaching to specific services'
+complete -c docker -A -n '__fish_docker_using compose up' -l build -f -d 'Build images before starting'
+complete -c docker -A -n '__fish_docker_using compose up' -s d -l detach -f -d 'Run containers in background'
+complete -c docker -A -n '__fish_docker_using compose up' -l exit-code-from -f -d 'Return exit code from service'
+complete -c docker -A -n '__fish_docker_using compose up' -l force-recreate -f -d 'Recreate containers even if unchanged'
+complete -c docker -A -n '__fish_docker_using compose up' -l no-build -f -d 'Do not build images'
+complete -c docker -A -n '__fish_docker_using compose up' -l no-deps -f -d 'Do not start linked services'
+complete -c docker -A -n '__fish_docker_using compose up' -l no-recreate -f -d 'Do not recreate existing containers'
+complete -c docker -A -n '__fish_docker_using compose up' -l no-start -f -d 'Do not start services after creating'
+complete -c docker -A -n '__fish_docker_using compose up' -l pull -f -d 'Pull image policy (always|missing|never)'
+complete -c docker -A -n '__fish_docker_using compose up' -l quiet-pull -f -d 'Pull without printing progress'
+complete -c docker -A -n '__fish_docker_using compose up' -l remove-orphans -f -d 'Remove containers not in compose file'
+complete -c docker -A -n '__fish_docker_using compose up' -l scale -f -d 'Scale service to NUM instances'
+complete -c docker -A -n '__fish_docker_using compose up' -s t -l timeout -f -d 'Shutdown timeout in seconds'
+complete -c docker -A -n '__fish_docker_using compose up' -l wait -f -d 'Wait for services to be healthy'
+complete -c docker -A -n '__fish_docker_using compose up' -l watch -f -d 'Watch source and rebuild/refresh'
+complete -c docker -A -f -n '__fish_docker_using compose up' -a '(__fish_print_docker_compose_services)' -d "Service"
+
+# compose version
+complete -c docker -f -n '__fish_docker_using compose' -a version -d 'Show Docker Compose version'
+
+# compose volumes
+complete -c docker -f -n '__fish_docker_using compose' -a volumes -d 'List volumes'
+
+# compose wait
+complete -c docker -f -n '__fish_docker_using compose' -a wait -d 'Block until containers stop'
+
+# compose watch
+complete -c docker -f -n '__fish_docker_using compose' -a watch -d 'Watch build context and rebuild'
 
-# compose options (before subcommand)
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l all-resources -f -d 'Include all resources'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l ansi -f -d 'Control ANSI output (never|always|auto)'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l compatibility -f -d 'Run in backward compatibility mode'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l dry-run -f -d 'Execute in dry run mode'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l env-file -f -d 'Alternate environment file'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -s f -l file -f -d 'Compose configuration files'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l parallel -f -d 'Control max parallelism'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l profile -f -d 'Specify a profile to enable'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l progress -f -d 'Progress output type (auto|tty|plain|json|quiet)'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l project-directory -f -d 'Alternate working directory'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -s p -l project-name -f -d 'Project name'
-
-# compose subcommands
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a attach -d 'Attach to a running container'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a build -d 'Build or rebuild services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a commit -d 'Create image from container changes'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a config -d 'Parse and render compose file'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a cp -d 'Copy files between container and host'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a create -d 'Create containers for a service'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a down -d 'Stop and remove containers, networks'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a events -d 'Receive real time events'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a exec -d 'Execute command in running container'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a export -d 'Export container filesystem as tar'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a images -d 'List images used by containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a kill -d 'Force stop service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a logs -d 'View output from containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a ls -d 'List running compose projects'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a pause -d 'Pause services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a port -d 'Print public port for a port binding'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a ps -d 'List containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a pull -d 'Pull service images'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a push -d 'Push service images'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a restart -d 'Restart service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a rm -d 'Remove stopped service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a run -d 'Run a one-off command'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a scale -d 'Scale services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a start -d 'Start services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a stats -d 'Display container resource usage'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a stop -d 'Stop services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a top -d 'Display running processes'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a unpause -d 'Unpause services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a up -d 'Create and start containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a version -d 'Show Docker Compose version'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a wait -d 'Block until containers stop'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a watch -d 'Watch build context and rebuild'
-
-# compose up options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l abort-on-container-exit -f -d 'Stop all containers if any stop'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l always-recreate-deps -f -d 'Recreate dependent containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l attach -f -d 'Restrict attaching to specific services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l build -f -d 'Build images before starting'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -s d -l detach -f -d 'Run containers in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l exit-code-from -f -d 'Return exit code from service'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l force-recreate -f -d 'Recreate containers even if unchanged'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-build -f -d 'Do not build images'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-deps -f -d 'Do not start linked services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-recreate -f -d 'Do not recreate existing containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-start -f -d 'Do not start services after creating'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l pull -f -d 'Pull image policy (always|missing|never)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l quiet-pull -f -d 'Pull without printing progress'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l remove-orphans -f -d 'Remove containers not in compose file'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l scale -f -d 'Scale service to NUM instances'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -s t -l timeout -f -d 'Shutdown timeout in seconds'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l wait -f -d 'Wait for services to be healthy'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l watch -f -d 'Watch source and rebuild/refresh'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand up' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose down options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -l remove-orphans -f -d 'Remove containers not in compose file'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -l rmi -f -d 'Remove images (all|local)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -s t -l timeout -f -d 'Shutdown timeout in seconds'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -s v -l volumes -f -d 'Remove named volumes'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand down' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose logs options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s f -l follow -f -d 'Follow log output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l no-color -f -d 'Produce monochrome output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l no-log-prefix -f -d 'Do not print prefix in logs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l since -f -d 'Show logs since timestamp'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s n -l tail -f -d 'Number of lines from end of logs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s t -l timestamps -f -d 'Show timestamps'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l until -f -d 'Show logs before timestamp'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand logs' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose exec options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s d -l detach -f -d 'Run in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -l index -f -d 'Index of container if scaled'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -l privileged -f -d 'Give extended privileges'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s u -l user -f -d 'Run as this user'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s w -l workdir -f -d 'Working directory inside container'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand exec' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose run options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l build -f -d 'Build image before running'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l cap-add -f -d 'Add Linux capabilities'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l cap-drop -f -d 'Drop Linux capabilities'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s d -l detach -f -d 'Run in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l entrypoint -f -d 'Override entrypoint'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s i -l interactive -f -d 'Keep STDIN open'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s l -l label -f -d 'Add or override label'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l name -f -d 'Assign a name to the container'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l no-deps -f -d 'Do not start linked services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s p -l publish -f -d 'Publish container port'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l quiet-pull -f -d 'Pull without printing progress'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l rm -f -d 'Remove container when it exits'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l service-ports -f -d 'Run with service port mappings'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l use-aliases -f -d 'Use service network aliases'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s u -l user -f -d 'Run as this user'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s v -l volume -f -d 'Bind mount a volume'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s w -l workdir -f -d 'Working directory inside container'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand run' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose ps options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -s a -l all -f -d 'Show all containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l filter -f -d 'Filter output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l format -f -d 'Format output (table|json)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l no-trunc -f -d 'Do not truncate output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l orphans -f -d 'Include orphaned containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -s q -l quiet -f -d 'Only display container IDs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l services -f -d 'Display services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l status -f -d 'Filter by status'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand ps' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose build options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l build-arg -f -d 'Set build-time variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l builder -f -d 'Set builder to use'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l memory -f -d 'Set memory limit for build'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l no-cache -f -d 'Do not use cache'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l pull -f -d 'Always pull newer image'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l push -f -d 'Push images after build'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -s q -l quiet -f -d 'Do not print anything'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l ssh -f -d 'Set SSH agent socket or keys'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand build' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose pull/push options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l ignore-buildable -f -d 'Ignore images that can be built'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l ignore-pull-failures -f -d 'Pull what it can and ignore failures'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l include-deps -f -d 'Also pull service dependencies'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l policy -f -d 'Apply pull policy (missing|always)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -s q -l quiet -f -d 'Pull without printing progress'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand pull' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -l ignore-push-failures -f -d 'Push what it can and ignore failures'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -l include-deps -f -d 'Also push service dependencies'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -s q -l quiet -f -d 'Push without printing progress'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand push' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# Service completions for other compose subcommands
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand start' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand stop' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand restart' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand pause' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand unpause' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand kill' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand rm' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand create' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand attach' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand top' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand events' -a '(__fish_print_docker_compose_services)' -d "Service"
 
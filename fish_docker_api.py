@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""Completion backend that queries the Docker Engine API over its unix socket.
+
+Prints the same candidates as the docker.fish listing helpers without
+starting the docker CLI. Point fish at it with:
+
+    set -U fish_docker_api_helper /path/to/fish_docker_api.py
+
+Exits non-zero when the daemon can't be reached over a unix socket (for
+example when DOCKER_HOST is tcp:// or ssh://), so the helpers fall back to
+the docker CLI.
+"""
+import http.client
+import json
+import os
+import re
+import socket
+import sys
+from argparse import ArgumentParser
+from urllib.parse import urlencode
+
+DEFAULT_SOCKET = '/var/run/docker.sock'
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class DockerAPI(object):
+    # a short-lived client: the helper runs once per listing and opens one
+    # connection for its single query
+
+    def __init__(self, socket_path, timeout=2.0):
+        self.connection = UnixHTTPConnection(socket_path, timeout)
+
+    def get(self, path, **params):
+        if params:
+            path += '?' + urlencode(params)
+        self.connection.request('GET', path)
+        response = self.connection.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise RuntimeError('%s returned HTTP %d' % (path, response.status))
+        return json.loads(body)
+
+    def containers(self, select, **filters):
+        params = {}
+        if select == 'running':
+            filters['status'] = ['running']
+        elif select == 'stopped':
+            filters['status'] = ['exited', 'created']
+            params['all'] = 1
+        else:
+            params['all'] = 1
+        if filters:
+            params['filters'] = json.dumps(filters)
+        return self.get('/containers/json', **params)
+
+    def images(self, **filters):
+        if filters:
+            return self.get('/images/json', filters=json.dumps(filters))
+        return self.get('/images/json')
+
+
+def socket_path():
+    host = os.environ.get('DOCKER_HOST')
+    if not host:
+        return DEFAULT_SOCKET
+    if host.startswith('unix://'):
+        return host[len('unix://'):]
+    raise RuntimeError('DOCKER_HOST %r is not a unix socket' % host)
+
+
+def image_tags(image):
+    return [tag for tag in image.get('RepoTags') or [] if tag != '<none>:<none>']
+
+
+def reference_filters(prefix):
+    # '*' doesn't match '/' in reference filters
+    if not prefix:
+        return {}
+    return {'reference': [prefix + '*', prefix + '*/*', prefix + '*/*/*']}
+
+
+def print_containers(api, select, prefix):
+    # same as __fish_docker_list_command containers: names matching prefix, or
+    # short IDs and names of every container
+    if prefix:
+        containers = api.containers(select, name=['^/?' + re.escape(prefix)])
+    else:
+        containers = api.containers(select)
+    for container in containers:
+        if not prefix:
+            yield container['Id'][:12]
+        for name in container.get('Names') or []:
+            yield name.lstrip('/')
+
+
+def print_container_ids(api, select, prefix):
+    # the id filter matches anywhere in the ID, and a short ID can't start
+    # with a prefix longer than itself
+    length = 12 if len(prefix) <= 12 else None
+    for container in api.containers(select, id=[prefix]):
+        if container['Id'].startswith(prefix):
+            yield container['Id'][:length]
+
+
+def print_images(api, prefix):
+    # same as: docker images --format '{{if eq .Repository "<none>"}}{{.ID}}\tUnnamed Image{{else}}...'
+    for image in api.images(**reference_filters(prefix)):
+        tags = image_tags(image)
+        if not tags:
+            short_id = image['Id'].split(':', 1)[-1][:12]
+            yield '%s\tUnnamed Image' % short_id
+        for tag in tags:
+            yield tag
+
+
+def print_image_ids(api, prefix):
+    # same as __fish_docker_list_command image-ids: images have no id filter,
+    # and only unnamed ones are completed by ID
+    for image in api.images(dangling=['true']):
+        short_id = image['Id'].split(':', 1)[-1][:12]
+        if short_id.startswith(prefix):
+            yield '%s\tUnnamed Image' % short_id
+
+
+def print_repositories(api, prefix):
+    repositories = set()
+    for image in api.images(**reference_filters(prefix)):
+        for tag in image_tags(image):
+            repositories.add(tag.rpartition(':')[0])
+    return sorted(repositories)
+
+
+def main():
+    parser = ArgumentParser(description='List docker containers and images for fish completions.')
+    parser.add_argument(
+        'resource',
+        choices=['containers', 'container-ids', 'images', 'image-ids', 'repositories']
+    )
+    parser.add_argument(
+        'select',
+        nargs='?',
+        choices=['running', 'stopped', 'all'],
+        default='running',
+        help='which containers to list (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--prefix',
+        default='',
+        help='only list names, IDs or references starting with this'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=2.0,
+        help='seconds to wait for the daemon (default: %(default)s)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        api = DockerAPI(socket_path(), args.timeout)
+        if args.resource == 'containers':
+            lines = list(print_containers(api, args.select, args.prefix))
+        elif args.resource == 'container-ids':
+            lines = list(print_container_ids(api, args.select, args.prefix))
+        elif args.resource == 'images':
+            lines = list(print_images(api, args.prefix))
+        elif args.resource == 'image-ids':
+            lines = list(print_image_ids(api, args.prefix))
+        else:
+            lines = print_repositories(api, args.prefix)
+    except (OSError, RuntimeError, http.client.HTTPException, ValueError) as e:
+        print('fish_docker_api: %s' % e, file=sys.stderr)
+        sys.exit(1)
+
+    # only print once every query succeeded so a fallback never sees partial output
+    for line in lines:
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,23 @@
 function docker-util --description 'Docker utilities for fish shell'
     if test (count $argv) -lt 1
         echo "Usage: docker-util <subcommand> [args]"
-        echo "Subcommands: nsenter, get-veth, get-ip"
+        echo "Subcommands: nsenter, nsenter-all, get-veth, get-ip, watch-veth, watch-ip"
         return 1
     end
 
     switch $argv[1]
         case nsenter
             __docker_util_nsenter $argv[2..-1]
+        case nsenter-all
+            __docker_util_nsenter_all $argv[2..-1]
         case get-veth
             __docker_util_get_veth $argv[2..-1]
         case get-ip
             __docker_util_get_ip $argv[2..-1]
+        case watch-veth
+            __docker_util_watch veth $argv[2..-1]
+        case watch-ip
+            __docker_util_watch ip $argv[2..-1]
         case '*'
             echo "Unknown subcommand: $argv[1]"
             return 1
@@ -57,6 +63,91 @@ function __docker_util_nsenter --description 'Enter container namespace with nse
     sudo nsenter --target $pid $nsenter_args
 end
 
+function __docker_util_nsenter_all --description 'Run a command in the namespaces of many containers in parallel'
+    set -l dash_idx (contains -i -- -- $argv)
+    if not set -q dash_idx[1]; or test $dash_idx -eq (count $argv)
+        echo "Usage: docker-util nsenter-all [--jobs N] [--container NAME]... [nsenter-args] -- <command> [args...]"
+        return 1
+    end
+    set -l command $argv[(math $dash_idx + 1)..-1]
+    set -l options
+    if test $dash_idx -gt 1
+        set options $argv[1..(math $dash_idx - 1)]
+    end
+
+    # Anything argparse doesn't know is an nsenter arg
+    argparse -i 'j/jobs=!_validate_int --min 1' 'container=+' -- $options
+    or return 1
+    set -l nsenter_args $argv
+    set -q _flag_jobs[1]; or set _flag_jobs 8
+    # Without a namespace nsenter runs the command on the host, once per container
+    if not string match -qr -- '^(-[a-zA-Z]*[amuinpCUT]|--(all|mount|uts|ipc|net|pid|cgroup|user|time)(=|$))' $nsenter_args
+        set -p nsenter_args --net
+    end
+
+    set -l containers $_flag_container
+    if not set -q containers[1]
+        # No containers given: all running containers sorted by name
+        set containers (docker ps --format '{{.Names}}' 2>/dev/null | sort)
+        if not set -q containers[1]
+            echo "No running containers found" >&2
+            return 1
+        end
+    end
+
+    # Every PID from one docker call
+    set -l names
+    set -l targets
+    for row in (__docker_util_inspect '{{.State.Pid}}' $containers)
+        set -l fields (string split \t -- $row)
+        if test -z "$fields[2]" -o "$fields[2]" = "0"
+            echo "Error: Could not get PID for container '$fields[1]'" >&2
+            continue
+        end
+        set -a names $fields[1]
+        # index:pid, the index names the output files
+        set -a targets (count $names):$fields[2]
+    end
+    set -q names[1]; or return 1
+
+    # Ask for the password once, not in every parallel nsenter
+    sudo -v; or return 1
+
+    # xargs keeps at most --jobs nsenters running, each writes its output and
+    # exit code to files so they can be printed in order afterwards. xargs
+    # appends the target (index:pid) to the arguments, nothing is substituted
+    # into the command itself.
+    set -l dir (command mktemp -d)
+    printf '%s\n' $targets | command xargs -n 1 -P $_flag_jobs sh -c '
+        dir=$1
+        shift
+        n=$# i=0
+        for arg do
+            i=$((i + 1))
+            [ $i -eq 1 ] && set --
+            if [ $i -eq $n ]; then target=$arg; else set -- "$@" "$arg"; fi
+        done
+        i=${target%%:*} pid=${target#*:}
+        sudo nsenter --target "$pid" "$@" > "$dir/$i.out" 2>&1
+        echo $? > "$dir/$i.status"' sh $dir $nsenter_args -- $command
+
+    # Output: container_name<TAB>line, container by container in the order above
+    set -l failed 0
+    for i in (seq (count $names))
+        string replace -r -- '^' "$names[$i]"\t < $dir/$i.out 2>/dev/null
+        set -l code
+        read code < $dir/$i.status 2>/dev/null
+        if test "$code" != 0
+            test -n "$code"; or set code unknown
+            echo "Error: '$command' exited with $code in container '$names[$i]'" >&2
+            set failed (math $failed + 1)
+        end
+    end
+    command rm -rf -- $dir
+
+    test $failed -eq 0
+end
+
 function __docker_util_get_veth --description 'Get veth interface names for containers'
     set -l containers $argv
     if test (count $containers) -lt 1
@@ -68,44 +159,36 @@ function __docker_util_get_veth --description 'Get veth interface names for cont
         end
     end
 
-    for container in $containers
-        # Get container name (in case ID was passed)
-        set -l name (docker inspect --format '{{.Name}}' $container 2>/dev/null | string replace -r '^/' '')
-        if test -z "$name"
-            echo "Error: Container '$container' not found" >&2
-            continue
-        end
+    # Host-side interface index:name, read once for all containers
+    set -l links (__docker_util_host_links)
 
-        # Get docker networks (comma-separated)
-        set -l networks (docker inspect --format '{{range $k, $v := .NetworkSettings.Networks}}{{$k}},{{end}}' $container 2>/dev/null | string replace -r ',$' '')
-
-        # Get container PID
-        set -l pid (docker inspect --format '{{.State.Pid}}' $container 2>/dev/null)
+    __docker_util_inspect '{{.State.Pid}}'\t'{{range $k, $v := .NetworkSettings.Networks}}{{$k}},{{end}}' $containers | while read -l -d \t name pid networks
         if test -z "$pid" -o "$pid" = "0"
-            echo "Error: Could not get PID for container '$container'" >&2
+            echo "Error: Could not get PID for container '$name'" >&2
             continue
         end
 
-        # Get all interfaces (except lo) and find their host-side veth pairs
-        # Need both --net and --mount to access /sys/class/net inside container
-        set -l veths
-        for iface in (sudo nsenter --target $pid --net --mount ls /sys/class/net/ 2>/dev/null)
-            if test "$iface" = "lo"
-                continue
-            end
-            # Get peer interface index from iflink
-            set -l iflink (sudo nsenter --target $pid --net --mount cat /sys/class/net/$iface/iflink 2>/dev/null)
-            if test -n "$iflink"
-                # Find the veth on host with this index, strip @ifN suffix if present
-                set -l veth (ip link show 2>/dev/null | string replace -rf "^$iflink: ([^@:]+).*" '$1')
-                if test -n "$veth"
-                    set -a veths $veth
-                end
-            end
+        # Output: container_name<TAB>networks<TAB>veths
+        # string reads stdin, the rest of this pipe, when there are no veths to join
+        printf '%s\t%s\t%s\n' $name (string replace -r ',$' '' -- "$networks") (string join ',' (__docker_util_veths $pid $links) </dev/null)
+    end
+end
+
+function __docker_util_host_links --description 'Print index:name of every host network interface'
+    for dev in /sys/class/net/*
+        if read -l index < $dev/ifindex 2>/dev/null
+            echo $index:(string replace -r '.*/' '' -- $dev)
         end
+    end
+end
 
-        # Output: container_name<TAB>networks<TAB>veths
-        printf '%s\t%s\t%s\n' $name $networks (string join ',' $veths)
+function __docker_util_veths --description 'Print the host veths of a container, given its PID and the host links' -a pid
+    set -l links $argv[2..-1]
+    # Peer interface index (iflink) of every interface except lo, in one namespace entry.
+    # Need both --net and --mount to access /sys/class/net inside container
+    for iflink in (sudo nsenter --target $pid --net --mount sh -c 'for dev in /sys/class/net/*; do [ "${dev##*/}" = lo ] || { read -r iflink < "$dev/iflink" && echo "$iflink"; }; done' 2>/dev/null)
+        # Find the veth on host with this index
+        string replace -rf "^$iflink:" '' -- $links
     end
 end
 
@@ -120,18 +203,120 @@ function __docker_util_get_ip --description 'Get IP addresses for containers'
         end
     end
 
+    # Output: container_name<TAB>network:ip,network:ip
+    __docker_util_inspect '{{range $k, $v := .NetworkSettings.Networks}}{{$k}}:{{$v.IPAddress}},{{end}}' $containers | string replace -r ',$' ''
+end
+
+function __docker_util_inspect --description 'Inspect containers with a single docker call' -a format
+    # Prints container_name<TAB><format output> for each container, in argument order,
+    # and an error for each container that doesn't exist
+    set -l containers $argv[2..-1]
+    set -l rows (docker container inspect --format '{{.Id}}'\t'{{.Name}}'\t"$format" $containers 2>/dev/null)
+
+    # docker inspect skips missing containers, so match rows back to the arguments
+    set -l i 1
     for container in $containers
-        # Get container name (in case ID was passed)
-        set -l name (docker inspect --format '{{.Name}}' $container 2>/dev/null | string replace -r '^/' '')
-        if test -z "$name"
+        set -l row (string split \t -- $rows[$i])
+        if test -n "$row[1]"; and begin
+                string match -q -- "$container*" $row[1]
+                or test "/$container" = "$row[2]" -o "$container" = "$row[2]"
+            end
+            string join \t -- (string replace -r '^/' '' -- $row[2]) $row[3..-1]
+            set i (math $i + 1)
+        else
             echo "Error: Container '$container' not found" >&2
-            continue
         end
+    end
+end
+
+function __docker_util_watch --description 'Print container rows, then stream the rows that change' -a kind
+    # Output: +<TAB>row for a new or changed row, -<TAB>container_name for a removed one,
+    # where row is what get-veth or get-ip prints
+    set -l targets $argv[2..-1]
+    set -l ids
+    set -l rows
+
+    # replay events from just before the first inspect, so none are missed in between;
+    # a replayed event only re-inspects a container whose row is already current
+    set -l since (date +%s)
+    set -l initial $targets
+    set -q initial[1]; or set initial (docker ps -q --no-trunc 2>/dev/null)
+    if set -q initial[1]
+        for line in (__docker_util_watch_rows $kind $initial)
+            set -l row (string split -m1 \t -- $line)
+            set -a ids $row[1]
+            set -a rows $row[2]
+        end
+        set -q rows[1]; and printf '+\t%s\n' $rows | sort
+    end
+
+    docker events --since $since --filter type=container --filter type=network \
+        --filter event=start --filter event=die --filter event=connect --filter event=disconnect \
+        --format '{{.Type}}'\t'{{.Actor.ID}}'\t'{{index .Actor.Attributes "name"}}'\t'{{index .Actor.Attributes "container"}}' |
+    while read -l line
+        set -l event (string split \t -- $line)
+        set -l id $event[2]
+        set -l name $event[3]
+        if test "$event[1]" = network
+            # network events are about the network; the container is an attribute
+            set id $event[4]
+            set name
+        end
+        test -n "$id"; or continue
+
+        set -l i (contains -i -- $id $ids)
+        if not set -q i[1]; and set -q targets[1]
+            __docker_util_watch_wanted $id "$name" $targets; or continue
+        end
+
+        # one inspect of the container the event is about, whatever the event;
+        # stdin is the event stream, keep it away from everything in there
+        set -l row
+        set -l current (__docker_util_watch_rows $kind $id </dev/null)
+        set -q current[1]; and set row (string split -m1 \t -- $current)
+        if not set -q row[2]
+            if set -q i[1]
+                printf -- '-\t%s\n' (string split -f1 \t -- $rows[$i])
+                set -e ids[$i]
+                set -e rows[$i]
+            end
+        else if not set -q i[1]
+            set -a ids $row[1]
+            set -a rows $row[2]
+            printf '+\t%s\n' $row[2]
+        else if test "$rows[$i]" != "$row[2]"
+            set rows[$i] $row[2]
+            printf '+\t%s\n' $row[2]
+        end
+    end
+end
+
+function __docker_util_watch_rows --description 'Print container_id<TAB>row for each running container, with one docker call' -a kind
+    set -l format '{{range $k, $v := .NetworkSettings.Networks}}{{$k}}:{{$v.IPAddress}},{{end}}'
+    set -l links
+    if test $kind = veth
+        set format '{{.State.Pid}}'\t'{{range $k, $v := .NetworkSettings.Networks}}{{$k}},{{end}}'
+        # veths come and go with the containers, so read them for every update
+        set links (__docker_util_host_links)
+    end
 
-        # Get network names and IPs
-        set -l network_info (docker inspect --format '{{range $k, $v := .NetworkSettings.Networks}}{{$k}}:{{$v.IPAddress}},{{end}}' $container 2>/dev/null | string replace -r ',$' '')
+    for line in (docker container inspect --format '{{.Id}}'\t'{{.Name}}'\t'{{.State.Running}}'\t"$format" $argv[2..-1] 2>/dev/null)
+        set -l fields (string split \t -- $line)
+        test "$fields[3]" = true; or continue
+        set -l name (string replace -r '^/' '' -- $fields[2])
+        if test $kind = veth
+            printf '%s\t%s\t%s\t%s\n' $fields[1] $name (string replace -r ',$' '' -- "$fields[5]") (string join ',' (__docker_util_veths $fields[4] $links) </dev/null)
+        else
+            printf '%s\t%s\t%s\n' $fields[1] $name (string replace -r ',$' '' -- "$fields[4]")
+        end
+    end
+end
 
-        # Output: container_name<TAB>network:ip,network:ip
-        printf '%s\t%s\n' $name $network_info
+function __docker_util_watch_wanted --description 'Check if a container is one of the watched ones' -a id name
+    for target in $argv[3..-1]
+        if test "$target" = "$name"; or string match -q -- "$target*" $id
+            return 0
+        end
     end
+    return 1
 end
@@ -1,20 +1,102 @@
 #!/usr/bin/env python
 import subprocess
+import hashlib
+import json
 import re
 import os
 import sys
+import tarfile
+import threading
+import time
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 
 class Subcommand(object):
-    def __init__(self, command, description, args, switches):
+    __slots__ = ('command', 'description', 'args', 'switches', 'path', 'subcommands', 'aliases')
+
+    def __init__(self, command, description, args, switches, path=None, subcommands=None, aliases=None):
         self.command = command
         self.description = description
         self.args = args
         self.switches = switches
+        # full command path, e.g. ('network', 'ls')
+        self.path = path if path is not None else (command,)
+        self.subcommands = subcommands if subcommands is not None else []
+        self.aliases = aliases if aliases is not None else []
+
+    def standalone_args(self):
+        # argument names from the usage line, e.g. ['CONTAINER', 'IMAGE']
+        unique = set()
+        for args in self.args:
+            m = re.match(r'\[(.+)\.\.\.\]', args)
+            if m:
+                # optional arguments
+                args = m.group(1)
+            unique.update(args.split('|'))
+        return sorted(unique)
+
+    def as_dict(self):
+        # empty fields are left out, the model of docker has a few thousand switches
+        d = {'command': self.command, 'description': self.description}
+        if self.args:
+            d['args'] = self.args
+        if self.switches:
+            d['switches'] = [switch.as_dict() for switch in self.switches]
+        if self.subcommands:
+            d['subcommands'] = [sub.as_dict() for sub in self.subcommands]
+        if self.aliases:
+            d['aliases'] = [list(alias) for alias in self.aliases]
+        return d
+
+    @classmethod
+    def from_dict(cls, d, parent=()):
+        path = parent + (d['command'],)
+        return cls(d['command'], d['description'], d.get('args', []),
+                   [Switch.from_dict(x) for x in d.get('switches', [])],
+                   path=path,
+                   subcommands=[cls.from_dict(x, path) for x in d.get('subcommands', [])],
+                   aliases=[tuple(x) for x in d.get('aliases', [])])
+
+
+class CommandLine(object):
+    """Everything scraped from one binary's help pages.
+
+    Generators only read this, so one scrape can be written out in several
+    formats, and as_dict()/from_dict() round-trip it through JSON (--emit model
+    and --model).
+    """
+    __slots__ = ('binary', 'common_options', 'subcommands')
+
+    # bumped when the JSON layout changes
+    schema = 1
+
+    def __init__(self, binary, common_options, subcommands):
+        self.binary = binary
+        self.common_options = common_options
+        self.subcommands = subcommands
+
+    def as_dict(self):
+        return {
+            'schema': self.schema,
+            'binary': self.binary,
+            'common_options': [switch.as_dict() for switch in self.common_options],
+            'subcommands': [sub.as_dict() for sub in self.subcommands],
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        if d.get('schema') != cls.schema:
+            raise ValueError('unsupported model schema %r' % d.get('schema'))
+        return cls(d['binary'],
+                   [Switch.from_dict(x) for x in d['common_options']],
+                   [Subcommand.from_dict(x) for x in d['subcommands']])
 
 
 class Switch(object):
+    __slots__ = ('shorts', 'longs', 'description', 'metavar')
+
     def __init__(self, shorts, longs, description, metavar):
         self.shorts = shorts
         self.longs = longs
@@ -26,31 +108,466 @@ class Switch(object):
             return False
         return self.metavar == 'FILE' or 'PATH' in self.metavar
 
-    @property
-    def fish_completion(self):
-        complete_arg_spec = ['-s %s' % x for x in self.shorts]
-        complete_arg_spec += ['-l %s' % x for x in self.longs]
-        if not self.is_file_target():
-            complete_arg_spec.append('-f')
-        desc = repr(self.description)
-        return '''{0} -d {1}'''.format(' '.join(complete_arg_spec), desc)
+    def as_dict(self):
+        d = {'description': self.description}
+        if self.shorts:
+            d['shorts'] = self.shorts
+        if self.longs:
+            d['longs'] = self.longs
+        if self.metavar:
+            d['metavar'] = self.metavar
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('shorts', []), d.get('longs', []), d['description'], d.get('metavar'))
+
+
+class HelpCache(object):
+    """Raw help output of one docker binary, persisted between runs.
+
+    The cache file is named after the binary path and only reused while the
+    binary's size, mtime and --version output are unchanged.
+    """
+
+    def __init__(self, filename, identity, outputs):
+        self.filename = filename
+        self.identity = identity
+        self.outputs = outputs
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, cache_dir, docker, refresh=False):
+        binary_path = os.path.abspath(docker.binary_path)
+        st = os.stat(binary_path)
+        identity = {
+            'path': binary_path,
+            'size': st.st_size,
+            'mtime': st.st_mtime_ns,
+            'version': docker.run('--version'),
+        }
+        digest = hashlib.sha1(binary_path.encode('utf-8')).hexdigest()[:12]
+        filename = os.path.join(cache_dir, '%s-%s.json' % (docker.binary, digest))
+        outputs = {}
+        if not refresh:
+            try:
+                with open(filename) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get('identity') == identity:
+                outputs = data.get('outputs', {})
+        cache = cls(filename, identity, outputs)
+        # a refresh must overwrite the old file even if nothing was scraped
+        cache.dirty = refresh
+        return cache
+
+    @staticmethod
+    def key(args):
+        return ' '.join(args)
+
+    def get(self, args):
+        with self.lock:
+            return self.outputs.get(self.key(args))
+
+    def set(self, args, output):
+        with self.lock:
+            self.outputs[self.key(args)] = output
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        tmp = '%s.%d.tmp' % (self.filename, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump({'identity': self.identity, 'outputs': self.outputs}, f, sort_keys=True)
+        os.replace(tmp, self.filename)
+        self.dirty = False
+
+
+class Corpus(object):
+    """Recorded help output of one docker binary, for generating without it.
+
+    A corpus is a JSON document {"binary", "version", "outputs"}; --record
+    writes one <binary>.json per binary into a directory. --replay reads them
+    back from that directory, from a tar archive of it, or from a single JSON
+    file holding one document or a list of them.
+    """
+
+    def __init__(self, binary, version=None, outputs=None):
+        self.binary = binary
+        self.version = version
+        self.outputs = outputs if outputs is not None else {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, source, binary):
+        name = '%s.json' % binary
+        if os.path.isdir(source):
+            filename = os.path.join(source, name)
+            if not os.path.exists(filename):
+                raise LookupError('%s has no %s' % (source, name))
+            with open(filename) as f:
+                documents = [json.load(f)]
+        elif tarfile.is_tarfile(source):
+            with tarfile.open(source) as tar:
+                members = [m for m in tar.getmembers() if m.isfile() and os.path.basename(m.name) == name]
+                if not members:
+                    raise LookupError('%s has no %s' % (source, name))
+                documents = [json.load(tar.extractfile(members[0]))]
+        else:
+            with open(source) as f:
+                documents = json.load(f)
+            if isinstance(documents, dict):
+                documents = [documents]
+        for document in documents:
+            if document.get('binary') == binary:
+                return cls(binary, document.get('version'), document.get('outputs', {}))
+        raise LookupError('%s has no corpus for %s' % (source, binary))
+
+    def get(self, args):
+        with self.lock:
+            return self.outputs.get(HelpCache.key(args))
+
+    def set(self, args, output):
+        with self.lock:
+            self.outputs[HelpCache.key(args)] = output
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        filename = os.path.join(directory, '%s.json' % self.binary)
+        tmp = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump({'binary': self.binary, 'version': self.version, 'outputs': self.outputs},
+                      f, sort_keys=True, separators=(',', ':'))
+        os.replace(tmp, filename)
+
+
+class Stats(object):
+    """Where the time of one generator run goes, reported by --stats."""
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.lock = threading.Lock()
+        self.commands = {}
+        self.stages = {}
+        self.process_spawns = 0
+        self.cache_hits = 0
+        self.switch_parses = 0
+        self.switch_parse_seconds = 0.0
+
+    def command(self, args):
+        # must be called with self.lock held
+        return self.commands.setdefault(' '.join(args), {
+            'seconds': 0.0, 'bytes': 0, 'cached': False, 'parse_seconds': 0.0, 'switches': 0})
+
+    def process(self, args, seconds, nbytes):
+        with self.lock:
+            self.process_spawns += 1
+            entry = self.command(args)
+            entry['seconds'] += seconds
+            entry['bytes'] += nbytes
+
+    def cache_hit(self, args, nbytes):
+        with self.lock:
+            self.cache_hits += 1
+            entry = self.command(args)
+            entry['cached'] = True
+            entry['bytes'] += nbytes
+
+    def parsed(self, args, seconds, switches):
+        with self.lock:
+            entry = self.command(args)
+            entry['parse_seconds'] += seconds
+            entry['switches'] += switches
+
+    def switch_parsed(self, seconds):
+        with self.lock:
+            self.switch_parses += 1
+            self.switch_parse_seconds += seconds
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def as_dict(self):
+        with self.lock:
+            return {
+                'binary': self.binary,
+                'stages': dict(self.stages),
+                'process_spawns': self.process_spawns,
+                'cache_hits': self.cache_hits,
+                'subprocess_seconds': sum(c['seconds'] for c in self.commands.values()),
+                'bytes_read': sum(c['bytes'] for c in self.commands.values()),
+                'parse_switch': {'calls': self.switch_parses, 'seconds': self.switch_parse_seconds},
+                'commands': {argv: dict(entry) for argv, entry in sorted(self.commands.items())},
+            }
+
+
+def default_cache_dir():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'fish-docker')
 
 
 class DockerCmdLine(object):
     binary = 'docker'
-
-    def __init__(self, docker_path):
+    # deepest command path crawled, e.g. 'docker buildx imagetools create'
+    max_depth = 4
+
+    # 'docker compose' is a CLI plugin, so it is described here instead of scraped
+    compose_options = [
+        ('', 'all-resources', 'Include all resources'),
+        ('', 'ansi', 'Control ANSI output (never|always|auto)'),
+        ('', 'compatibility', 'Run in backward compatibility mode'),
+        ('', 'dry-run', 'Execute in dry run mode'),
+        ('', 'env-file', 'Alternate environment file'),
+        ('f', 'file', 'Compose configuration files'),
+        ('', 'parallel', 'Control max parallelism'),
+        ('', 'profile', 'Specify a profile to enable'),
+        ('', 'progress', 'Progress output type (auto|tty|plain|json|quiet)'),
+        ('', 'project-directory', 'Alternate working directory'),
+        ('p', 'project-name', 'Project name'),
+    ]
+    compose_commands = [
+        ('attach', 'Attach to a running container'),
+        ('build', 'Build or rebuild services'),
+        ('commit', 'Create image from container changes'),
+        ('config', 'Parse and render compose file'),
+        ('cp', 'Copy files between container and host'),
+        ('create', 'Create containers for a service'),
+        ('down', 'Stop and remove containers, networks'),
+        ('events', 'Receive real time events'),
+        ('exec', 'Execute command in running container'),
+        ('export', 'Export container filesystem as tar'),
+        ('images', 'List images used by containers'),
+        ('kill', 'Force stop service containers'),
+        ('logs', 'View output from containers'),
+        ('ls', 'List running compose projects'),
+        ('pause', 'Pause services'),
+        ('port', 'Print public port for a port binding'),
+        ('ps', 'List containers'),
+        ('publish', 'Publish compose application'),
+        ('pull', 'Pull service images'),
+        ('push', 'Push service images'),
+        ('restart', 'Restart service containers'),
+        ('rm', 'Remove stopped service containers'),
+        ('run', 'Run a one-off command'),
+        ('scale', 'Scale services'),
+        ('start', 'Start services'),
+        ('stats', 'Display container resource usage'),
+        ('stop', 'Stop services'),
+        ('top', 'Display running processes'),
+        ('unpause', 'Unpause services'),
+        ('up', 'Create and start containers'),
+        ('version', 'Show Docker Compose version'),
+        ('volumes', 'List volumes'),
+        ('wait', 'Block until containers stop'),
+        ('watch', 'Watch build context and rebuild'),
+    ]
+    compose_command_options = {
+        'up': [
+            ('', 'abort-on-container-exit', 'Stop all containers if any stop'),
+            ('', 'always-recreate-deps', 'Recreate dependent containers'),
+            ('', 'attach', 'Restrict attaching to specific services'),
+            ('', 'build', 'Build images before starting'),
+            ('d', 'detach', 'Run containers in background'),
+            ('', 'exit-code-from', 'Return exit code from service'),
+            ('', 'force-recreate', 'Recreate containers even if unchanged'),
+            ('', 'no-build', 'Do not build images'),
+            ('', 'no-deps', 'Do not start linked services'),
+            ('', 'no-recreate', 'Do not recreate existing containers'),
+            ('', 'no-start', 'Do not start services after creating'),
+            ('', 'pull', 'Pull image policy (always|missing|never)'),
+            ('', 'quiet-pull', 'Pull without printing progress'),
+            ('', 'remove-orphans', 'Remove containers not in compose file'),
+            ('', 'scale', 'Scale service to NUM instances'),
+            ('t', 'timeout', 'Shutdown timeout in seconds'),
+            ('', 'wait', 'Wait for services to be healthy'),
+            ('', 'watch', 'Watch source and rebuild/refresh'),
+        ],
+        'down': [
+            ('', 'remove-orphans', 'Remove containers not in compose file'),
+            ('', 'rmi', 'Remove images (all|local)'),
+            ('t', 'timeout', 'Shutdown timeout in seconds'),
+            ('v', 'volumes', 'Remove named volumes'),
+        ],
+        'logs': [
+            ('f', 'follow', 'Follow log output'),
+            ('', 'no-color', 'Produce monochrome output'),
+            ('', 'no-log-prefix', 'Do not print prefix in logs'),
+            ('', 'since', 'Show logs since timestamp'),
+            ('n', 'tail', 'Number of lines from end of logs'),
+            ('t', 'timestamps', 'Show timestamps'),
+            ('', 'until', 'Show logs before timestamp'),
+        ],
+        'exec': [
+            ('d', 'detach', 'Run in background'),
+            ('e', 'env', 'Set environment variables'),
+            ('', 'index', 'Index of container if scaled'),
+            ('T', 'no-TTY', 'Disable pseudo-TTY allocation'),
+            ('', 'privileged', 'Give extended privileges'),
+            ('u', 'user', 'Run as this user'),
+            ('w', 'workdir', 'Working directory inside container'),
+        ],
+        'run': [
+            ('', 'build', 'Build image before running'),
+            ('', 'cap-add', 'Add Linux capabilities'),
+            ('', 'cap-drop', 'Drop Linux capabilities'),
+            ('d', 'detach', 'Run in background'),
+            ('', 'entrypoint', 'Override entrypoint'),
+            ('e', 'env', 'Set environment variables'),
+            ('i', 'interactive', 'Keep STDIN open'),
+            ('l', 'label', 'Add or override label'),
+            ('', 'name', 'Assign a name to the container'),
+            ('T', 'no-TTY', 'Disable pseudo-TTY allocation'),
+            ('', 'no-deps', 'Do not start linked services'),
+            ('p', 'publish', 'Publish container port'),
+            ('', 'quiet-pull', 'Pull without printing progress'),
+            ('', 'rm', 'Remove container when it exits'),
+            ('', 'service-ports', 'Run with service port mappings'),
+            ('', 'use-aliases', 'Use service network aliases'),
+            ('u', 'user', 'Run as this user'),
+            ('v', 'volume', 'Bind mount a volume'),
+            ('w', 'workdir', 'Working directory inside container'),
+        ],
+        'ps': [
+            ('a', 'all', 'Show all containers'),
+            ('', 'filter', 'Filter output'),
+            ('', 'format', 'Format output (table|json)'),
+            ('', 'no-trunc', 'Do not truncate output'),
+            ('', 'orphans', 'Include orphaned containers'),
+            ('q', 'quiet', 'Only display container IDs'),
+            ('', 'services', 'Display services'),
+            ('', 'status', 'Filter by status'),
+        ],
+        'build': [
+            ('', 'build-arg', 'Set build-time variables'),
+            ('', 'builder', 'Set builder to use'),
+            ('', 'memory', 'Set memory limit for build'),
+            ('', 'no-cache', 'Do not use cache'),
+            ('', 'pull', 'Always pull newer image'),
+            ('', 'push', 'Push images after build'),
+            ('q', 'quiet', 'Do not print anything'),
+            ('', 'ssh', 'Set SSH agent socket or keys'),
+        ],
+        'pull': [
+            ('', 'ignore-buildable', 'Ignore images that can be built'),
+            ('', 'ignore-pull-failures', 'Pull what it can and ignore failures'),
+            ('', 'include-deps', 'Also pull service dependencies'),
+            ('', 'policy', 'Apply pull policy (missing|always)'),
+            ('q', 'quiet', 'Pull without printing progress'),
+        ],
+        'push': [
+            ('', 'ignore-push-failures', 'Push what it can and ignore failures'),
+            ('', 'include-deps', 'Also push service dependencies'),
+            ('q', 'quiet', 'Push without printing progress'),
+        ],
+    }
+    compose_service_commands = [
+        'up', 'down', 'logs', 'exec', 'run', 'ps', 'build', 'pull', 'push', 'start', 'stop', 'restart', 'pause', 'unpause', 'kill', 'rm', 'create', 'attach', 'top', 'events'
+    ]
+
+    def __init__(self, docker_path, jobs=1):
         self.docker_path = docker_path
+        self.jobs = jobs
+        self.cache = None
+        # Corpus instances for --replay and --record
+        self.replay = None
+        self.record = None
+        self.stats = Stats(self.binary)
+        self._model = None
 
-    def get_output(self, *args):
-        cmd = [os.path.join(self.docker_path, self.binary)] + list(args)
+    @property
+    def binary_path(self):
+        return os.path.join(self.docker_path, self.binary)
+
+    @property
+    def model(self):
+        # scraped once per instance so every generator stage reads the same parse
+        if self._model is None:
+            lines = list(self.get_output('--help'))
+            start = time.perf_counter()
+            common_options = list(self.common_options(iter(lines)))
+            self.stats.parsed(('--help',), time.perf_counter() - start, len(common_options))
+            self._model = CommandLine(
+                self.binary,
+                common_options,
+                self.commands(self.subcommands(iter(lines))))
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        # a model exported by an earlier run (--model), instead of scraping
+        if model.binary != self.binary:
+            raise ValueError('model is of %s, not %s' % (model.binary, self.binary))
+        self._model = model
+
+    def commands(self, subcommands):
+        # the scraped subcommands, with compose replaced by the described one
+        return [sub for sub in subcommands if sub.command != 'compose'] + [self.compose()]
+
+    def compose(self):
+        def switch(short, long, description):
+            return Switch([short] if short else [], [long], description, None)
+
+        subcommands = [
+            Subcommand(command, description,
+                       ['[SERVICE...]'] if command in self.compose_service_commands else [],
+                       [switch(*x) for x in self.compose_command_options.get(command, [])],
+                       path=('compose', command))
+            for command, description in self.compose_commands
+        ]
+        return Subcommand('compose', 'Define and run multi-container applications', [],
+                          [switch(*x) for x in self.compose_options], subcommands=subcommands)
+
+    def map(self, func, items):
+        # run func over items on up to self.jobs threads; results keep the input order
+        items = list(items)
+        if self.jobs <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def run(self, *args):
+        cmd = [self.binary_path] + list(args)
+        start = time.perf_counter()
         # docker returns non-zero exit code for some help commands so can't use subprocess.check_output here
         ps = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         out, _ = ps.communicate()
-        out = out.decode('utf-8')
+        self.stats.process(args, time.perf_counter() - start, len(out))
+        return out.decode('utf-8')
+
+    def get_output(self, *args):
+        if self.replay is not None:
+            out = self.replay.get(args)
+            if out is None:
+                raise LookupError('%s %s was not recorded' % (self.binary, ' '.join(args)))
+            self.stats.cache_hit(args, len(out))
+        else:
+            out = self.cache.get(args) if self.cache is not None else None
+            if out is None:
+                out = self.run(*args)
+                if self.cache is not None:
+                    self.cache.set(args, out)
+            else:
+                self.stats.cache_hit(args, len(out))
+        if self.record is not None:
+            self.record.set(args, out)
         return iter(out.splitlines())
 
     def parse_switch(self, line):
+        start = time.perf_counter()
+        switch = self._parse_switch(line)
+        self.stats.switch_parsed(time.perf_counter() - start)
+        return switch
+
+    def _parse_switch(self, line):
         line = line.strip()
         if '  ' not in line:
             # ignore continuation lines
@@ -68,8 +585,9 @@ class DockerCmdLine(object):
         longs = [x[2:] for x in switches if x.startswith('--')]
         return Switch(shorts, longs, description, metavar)
 
-    def common_options(self):
-        lines = self.get_output('--help')
+    def common_options(self, lines=None):
+        if lines is None:
+            lines = self.get_output('--help')
         # skip header - look for Options: or Global Options:
         for line in lines:
             if line in ('Options:', 'Global Options:'):
@@ -85,9 +603,9 @@ class DockerCmdLine(object):
             if switch:
                 yield switch
 
-    def subcommands(self):
-        lines = self.get_output('help')
+    def command_entries(self, lines):
         in_commands_section = False
+        entries = []
 
         for line in lines:
             # Check for any commands section header
@@ -109,10 +627,44 @@ class DockerCmdLine(object):
             # Skip management commands marked with * (plugins)
             if command.endswith('*'):
                 continue
-            yield self.subcommand(command, description)
-
-    def subcommand(self, command, description):
-        lines = self.get_output('help', command)
+            entries.append((command, description))
+        return entries
+
+    def subcommands(self, lines=None):
+        if lines is None:
+            lines = self.get_output('help')
+        root = Subcommand(None, None, [], [], path=())
+        pending = [(root, command, description) for command, description in self.command_entries(lines)]
+        # help pages already scraped under another name, keyed by command path
+        pages = {}
+
+        def scrape(item):
+            parent, command, description = item
+            path = parent.path + (command,)
+            if path in pages:
+                sub, entries = pages[path]
+                return Subcommand(command, description, sub.args, sub.switches, path=path), entries
+            return self.subcommand(path, description)
+
+        # breadth-first over management commands (network, volume, ...); each help
+        # page is a separate docker process, so every level is scraped concurrently
+        for _ in range(self.max_depth):
+            if not pending:
+                break
+            results = self.map(scrape, pending)
+            next_pending = []
+            for (parent, _, _), (sub, entries) in zip(pending, results):
+                parent.subcommands.append(sub)
+                for path in [sub.path] + sub.aliases:
+                    pages.setdefault(path, (sub, entries))
+                next_pending += [(sub, command, description) for command, description in entries]
+            pending = next_pending
+        return root.subcommands
+
+    def subcommand(self, path, description):
+        command = path[-1]
+        lines = self.get_output('help', *path)
+        start = time.perf_counter()
         usage = None
         for line in lines:
             if line.startswith('Usage:'):
@@ -120,16 +672,17 @@ class DockerCmdLine(object):
                 break
         else:
             raise RuntimeError(
-                "Can't find Usage in command: %r" % command
+                "Can't find Usage in command: %r" % ' '.join(path)
             )
-        args = usage.split()[3:]
+        args = usage.split()[2 + len(path):]
         if args and args[0].upper() == '[OPTIONS]':
             args = args[1:]
-        if command in ('push', 'pull'):
+        if path in (('push',), ('pull',), ('image', 'push'), ('image', 'pull')):
             # improve completion for docker push/pull
             args = ['REPOSITORY|IMAGE']
-        elif command == 'images':
+        elif path in (('images',), ('image', 'ls')):
             args = ['REPOSITORY']
+        lines = list(lines)
         switches = []
         for line in lines:
             if not line.strip().startswith('-'):
@@ -137,67 +690,449 @@ class DockerCmdLine(object):
             switch = self.parse_switch(line)
             if switch:
                 switches.append(switch)
-        return Subcommand(command, description, args, switches)
+        sub = Subcommand(command, description, args, switches, path=path, aliases=self.aliases(lines))
+        entries = self.command_entries(lines)
+        self.stats.parsed(('help',) + path, time.perf_counter() - start, len(switches))
+        return sub, entries
+
+    def aliases(self, lines):
+        # Aliases:
+        #   docker container ls, docker container list, docker ps
+        aliases = []
+        in_aliases_section = False
+        for line in lines:
+            if line == 'Aliases:':
+                in_aliases_section = True
+            elif in_aliases_section and line.startswith(' '):
+                for alias in line.split(','):
+                    aliases.append(tuple(alias.split()[1:]))
+            else:
+                in_aliases_section = False
+        return aliases
 
 
 class DockerComposeCmdLine(DockerCmdLine):
     binary = 'docker-compose'
 
+    def commands(self, subcommands):
+        return subcommands
+
+
+class CompletionFile(object):
+    """A completion file that only replaces the old one once it is complete.
+
+    Output is streamed into a temporary file next to filename, which is
+    fsynced and renamed over filename when the with block exits normally. On
+    an error the temporary file is removed and the old file is left alone.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.tmp = '%s.%d.tmp' % (filename, os.getpid())
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.tmp, 'w')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            self.file.close()
+            if exc_type is None:
+                os.replace(self.tmp, self.filename)
+        finally:
+            if os.path.exists(self.tmp):
+                os.unlink(self.tmp)
+
+    def write(self, text):
+        self.file.write(text)
+
+
+# Shared by docker.fish and docker-compose.fish: `docker compose config --services`
+# parses and interpolates every compose file, so its output is kept per project
+# and only recomputed when one of the compose or .env files changes.
+COMPOSE_SERVICES_FUNCTION = """
+function __fish_docker_compose_services --description 'Print the services of the compose project on the command line'
+    # argv is the compose command, e.g. `docker compose` or `docker-compose`
+    set -l cmd (commandline -opc)
+    set -l i (contains -i -- $argv[-1] $cmd); or return
+    set -l opts
+    set -l files
+    set -l env_files
+    set -l dir
+    set -l option
+    # only the options before the compose subcommand select the project
+    for token in $cmd[(math $i + 1)..-1]
+        if not set -q option[1]
+            switch $token
+                case -f --file --profile --env-file --project-directory
+                    set option $token
+                    continue
+                case '--file=*' '--profile=*' '--env-file=*' '--project-directory=*'
+                    set option (string split -m 1 = -- $token)
+                    set token $option[2]
+                    set option $option[1]
+                case -p --project-name --ansi --progress --parallel
+                    # takes a value that doesn't change the service list
+                    set option skip
+                    continue
+                case '-*'
+                    continue
+                case '*'
+                    break
+            end
+        end
+        switch $option
+            case -f --file
+                set -a files $token
+            case --env-file
+                set -a env_files $token
+            case --project-directory
+                set dir $token
+        end
+        if test $option != skip
+            set -a opts $option $token
+        end
+        set option
+    end
+
+    if not set -q files[1]
+        if set -q COMPOSE_FILE[1]
+            set -q COMPOSE_PATH_SEPARATOR[1]; or set -l COMPOSE_PATH_SEPARATOR :
+            set files (string split -- $COMPOSE_PATH_SEPARATOR $COMPOSE_FILE)
+        else
+            # like compose, use the first directory upwards that has a compose file
+            set -l search (path resolve -- $dir .)[1]
+            while true
+                set files (path filter -f -- $search/{compose,docker-compose}{,.override}.{yaml,yml})
+                if set -q files[1]; or test "$search" = /
+                    break
+                end
+                set search (path dirname -- $search)
+            end
+        end
+    end
+    set -q files[1]; or return
+    set files (path resolve -- $files)
+    set -q dir[1]; or set dir (path dirname -- $files[1])
+    set dir (path resolve -- $dir)
+
+    # an entry is reused while every file still has the mtime it had when it was made
+    set -l stamp
+    for file in $files $dir/.env (path resolve -- $env_files)
+        set -a stamp $file (path mtime -- $file; or echo -)
+    end
+    set -l var __fish_docker_compose_services_(string escape --style=var -- "$argv $dir $opts $COMPOSE_PROFILES")
+    if not set -q $var; or test "$$var[1][1]" != "$stamp"
+        set -l services ($argv config --services $opts 2>/dev/null); or return
+        set -g $var "$stamp" (path sort -- $services)
+    end
+    string join \\n -- $$var[1][2..-1]
+end
+"""
+
 
 class BaseFishGenerator(object):
     header_text = ''
 
-    def __init__(self, docker):
+    def __init__(self, docker, out, layout='single', functions_dir=None):
         self.docker = docker
+        self.out = out
+        self.layout = layout
+        # split layout: per-subcommand completions go to autoloaded functions here
+        self.functions_dir = functions_dir
+        self.fragments = []
+
+    def emit(self, text=''):
+        self.out.write(text + '\n')
+
+    def fragment_name(self, command):
+        return '__fish_%s_complete_%s' % (self.docker.binary, command)
+
+    @contextmanager
+    def fragment(self, command):
+        # in the split layout, what is emitted inside the block goes into a function
+        # that the stub only loads once command is on the command line
+        if self.layout != 'split':
+            yield
+            return
+        name = self.fragment_name(command)
+        stub = self.out
+        with CompletionFile(os.path.join(self.functions_dir, name + '.fish')) as self.out:
+            self.emit("function %s --description 'Load the completions of %s %s'" % (
+                name, self.docker.binary, command))
+            yield
+            self.emit('end')
+        self.out = stub
+        self.fragments.append(name)
 
     # Generate fish completions definitions for docker
     def generate(self):
-        self.header()
-        self.common_options()
-        self.subcommands()
+        stats = self.docker.stats
+        with stats.stage('header'):
+            self.header()
+        if self.layout == 'table':
+            with stats.stage('dispatch'):
+                self.dispatch()
+            return
+        with stats.stage('common_options'):
+            self.common_options()
+        with stats.stage('subcommands'):
+            self.subcommands()
+
+    def finish(self):
+        # called after generate() once every stage has emitted its fragments
+        if self.layout == 'split':
+            self.lazy_loader()
+            self.remove_stale_fragments()
+
+    def commands(self):
+        # the top-level subcommands to complete
+        return self.docker.model.subcommands
 
     def header(self):
-        cmds = sorted(sub.command for sub in self.docker.subcommands())
-        print(self.header_text.lstrip() % ' '.join(cmds))
+        self.emit(self.header_text.lstrip())
+        self.path_functions()
+
+    def command_tree(self):
+        # (path, child commands) for every command path that has subcommands
+        tree = []
+
+        def walk(path, subs):
+            if subs:
+                tree.append((path, sorted(sub.command for sub in subs)))
+            for sub in subs:
+                walk(sub.path, sub.subcommands)
+
+        walk((), self.commands())
+        return tree
+
+    def path_functions(self):
+        # The subcommand path is resolved with one switch per token and cached for the
+        # current command line, so every completion condition after the first is a
+        # single string comparison.
+        prefix = '__fish_%s' % self.docker.binary
+        var = prefix.replace('-', '_') + '_path'
+        self.emit('''function {prefix}_update_path --description 'Find the {binary} subcommand path of the command line'
+    set -l cmd (commandline -opc)
+    if test "$cmd" = "${var}_key"; and set -q {var}
+        return
+    end
+    set -g {var}_key "$cmd"
+    set -g {var}
+    for token in $cmd[2..-1]
+        switch "${var}"'''.format(prefix=prefix, binary=self.docker.binary, var=var))
+        # commands a scrape left out of a group, e.g. 'docker image inspect', are
+        # completed as the top-level command of that name, as seen_subcommand_from did
+        top_level = [sub.command for sub in self.commands() if not sub.subcommands]
+        for path, children in self.command_tree():
+            self.emit('''            case {0}
+                switch $token
+                    case {1}
+                        set -a {2} $token'''.format(repr(' '.join(path)), ' '.join(children), var))
+            fallback = sorted(set(top_level) - set(children))
+            if path and fallback:
+                self.emit('''                    case {0}
+                        set {1} $token'''.format(' '.join(fallback), var))
+            self.emit('                end')
+        self.emit('''        end
+    end
+end
+
+function {prefix}_using --description 'Test if the {binary} subcommand path is exactly the given one'
+    {prefix}_update_path
+    test "${var}" = "$argv"
+end
+
+function {prefix}_no_subcommand --description 'Test if {binary} has yet to be given the subcommand'
+    {prefix}_update_path
+    test -z "${var}"
+end
+'''.format(prefix=prefix, binary=self.docker.binary, var=var))
 
     def common_options(self):
-        print('# common options')
-        for switch in self.docker.common_options():
-            print('''complete -c {binary} -n '__fish_docker_no_subcommand' {completion}'''.format(
+        self.emit('# common options')
+        for switch in self.docker.model.common_options:
+            self.emit('''complete -c {binary} -n '__fish_{binary}_no_subcommand' {completion}'''.format(
                 binary=self.docker.binary,
-                completion=switch.fish_completion))
-        print()
+                completion=self.switch_completion(switch)))
+        self.emit()
+
+    def switch_completion(self, switch):
+        complete_arg_spec = ['-s %s' % x for x in switch.shorts]
+        complete_arg_spec += ['-l %s' % x for x in switch.longs]
+        if not switch.is_file_target():
+            complete_arg_spec.append('-f')
+        desc = repr(switch.description)
+        return '''{0} -d {1}'''.format(' '.join(complete_arg_spec), desc)
+
+    def condition(self, sub):
+        # fish condition under which the switches and arguments of sub apply
+        return '__fish_%s_using %s' % (self.docker.binary, ' '.join(sub.path))
 
     def subcommands(self):
-        print('# subcommands')
-        for sub in self.docker.subcommands():
-            print('# %s' % sub.command)
-            desc = repr(sub.description)
-            print('''complete -c {binary} -f -n '__fish_docker_no_subcommand' -a {command} -d {desc}'''.format(
+        self.emit('# subcommands')
+        for sub in self.commands():
+            self.emit('# %s' % ' '.join(sub.path))
+            self.subcommand_entry(sub, '__fish_%s_no_subcommand' % self.docker.binary)
+            with self.fragment(sub.command):
+                self.subcommand_completions(sub)
+        self.emit()
+
+    def subcommand(self, sub, needs_command):
+        self.emit('# %s' % ' '.join(sub.path))
+        self.subcommand_entry(sub, needs_command)
+        self.subcommand_completions(sub)
+
+    def subcommand_entry(self, sub, needs_command):
+        self.emit('''complete -c {binary} -f -n '{condition}' -a {command} -d {desc}'''.format(
+            binary=self.docker.binary,
+            condition=needs_command,
+            command=sub.command,
+            desc=repr(sub.description)))
+
+    def subcommand_completions(self, sub):
+        for switch in sub.switches:
+            self.emit('''complete -c {binary} -A -n '{condition}' {completion}'''.format(
                 binary=self.docker.binary,
-                command=sub.command,
-                desc=desc))
-            for switch in sub.switches:
-                print('''complete -c {binary} -A -n '__fish_seen_subcommand_from {command}' {completion}'''.format(
-                    binary=self.docker.binary,
-                    command=sub.command,
-                    completion=switch.fish_completion))
-
-            # standalone arguments
-            unique = set()
-            for args in sub.args:
-                m = re.match(r'\[(.+)\.\.\.\]', args)
-                if m:
-                    # optional arguments
-                    args = m.group(1)
-                unique.update(args.split('|'))
-            for arg in sorted(unique):
-                self.process_subcommand_arg(sub, arg)
-            print()
-        print()
+                condition=self.condition(sub),
+                completion=self.switch_completion(switch)))
+
+        # standalone arguments
+        for arg in sub.standalone_args():
+            self.process_subcommand_arg(sub, arg)
+        self.emit()
+
+        # nested commands, e.g. 'docker network ls'
+        for child in sub.subcommands:
+            self.subcommand(child, self.condition(sub))
 
     def process_subcommand_arg(self, sub, arg):
-        pass
+        completion = self.arg_completion(sub, arg)
+        if completion is not None:
+            self.emit('''complete -c {binary} -A -f -n '{condition}' -a '({function})' -d "{desc}"'''.format(
+                binary=self.docker.binary,
+                condition=self.condition(sub),
+                function=completion[0],
+                desc=completion[1]))
+
+    def arg_completion(self, sub, arg):
+        # (fish command that prints the candidates for arg, description), or None
+        return None
+
+    def table(self):
+        # (path, child commands, switches, argument completions) of the root and every subcommand
+        rows = []
+
+        def walk(path, subs, switches, sub):
+            args = []
+            if sub is not None:
+                args = [self.arg_completion(sub, arg) for arg in sub.standalone_args()]
+            rows.append((path, subs, switches, [x for x in args if x is not None]))
+            for child in subs:
+                walk(child.path, child.subcommands, child.switches, child)
+
+        walk((), self.commands(), self.docker.model.common_options, None)
+        return rows
+
+    def emit_candidates(self, candidates, indent):
+        self.emit(' ' * indent + "printf '%s\\n' \\")
+        lines = ['%s\\t%s' % (candidate, repr(desc)) for candidate, desc in candidates]
+        self.emit(' \\\n'.join(' ' * (indent + 4) + line for line in lines))
+
+    def dispatch(self):
+        # One dynamic completion looks up the subcommand path in a generated table,
+        # so a TAB costs the same however many options the other subcommands have.
+        prefix = '__fish_%s' % self.docker.binary
+        var = prefix.replace('-', '_') + '_path'
+        rows = self.table()
+        self.emit('''function {prefix}_dispatch --description 'Print the completions of the {binary} subcommand path on the command line'
+    {prefix}_update_path
+    if string match -q -- '-*' (commandline -ct)
+        switch "${var}"'''.format(prefix=prefix, binary=self.docker.binary, var=var))
+        for path, children, switches, args in rows:
+            candidates = []
+            for switch in switches:
+                candidates += [('-' + x, switch.description) for x in switch.shorts]
+                candidates += [('--' + x, switch.description) for x in switch.longs]
+            if candidates:
+                self.emit('            case %s' % repr(' '.join(path)))
+                self.emit_candidates(candidates, 16)
+        self.emit('''        end
+        return
+    end
+    switch "${var}"'''.format(var=var))
+        for path, children, switches, args in rows:
+            if not children and not args:
+                continue
+            self.emit('        case %s' % repr(' '.join(path)))
+            if children:
+                self.emit_candidates([(child.command, child.description) for child in children], 12)
+            for function, desc in args:
+                self.emit("            %s | string replace -r -- '^[^\\t]*$' '$0'\\t%s" % (function, repr(desc)))
+        self.emit('''    end
+end
+''')
+
+        # files are completed where the scraped help has nothing better, and after file options
+        takes_files = [path for path, children, switches, args in rows if not children and not args]
+        self.emit('''function {prefix}_dispatch_files --description 'Test if the {binary} command line takes a file next'
+    {prefix}_update_path
+    switch "${var}"'''.format(prefix=prefix, binary=self.docker.binary, var=var))
+        if takes_files:
+            self.emit('''        case {0}
+            return 0'''.format(' '.join(repr(' '.join(path)) for path in takes_files)))
+        for path, children, switches, args in rows:
+            if path in takes_files:
+                continue
+            options = []
+            for switch in switches:
+                if switch.is_file_target():
+                    options += ['-' + x for x in switch.shorts] + ['--' + x for x in switch.longs]
+            if options:
+                self.emit('''        case {0}
+            contains -- (commandline -opc)[-1] {1}
+            return'''.format(repr(' '.join(path)), ' '.join(options)))
+        self.emit('''    end
+    return 1
+end
+
+complete -c {binary} -f -a '({prefix}_dispatch)'
+complete -c {binary} -F -n '{prefix}_dispatch_files'
+'''.format(prefix=prefix, binary=self.docker.binary))
+
+    def lazy_loader(self):
+        prefix = '__fish_%s' % self.docker.binary
+        var = prefix.replace('-', '_') + '_loaded'
+        self.emit()
+        self.emit('''# completions of each subcommand are loaded the first time it is completed
+function {prefix}_lazy_load --description 'Load the completions of the {binary} subcommand on the command line'
+    {prefix}_update_path
+    # nothing to load before a subcommand has been typed
+    set -q __fish_{path}_path[1]; or return 1
+    set -l name {prefix}_complete_$__fish_{path}_path[1]
+    if contains -- $name ${var}; or not functions -q $name
+        return 1
+    end
+    set -ga {var} $name
+    $name
+end
+
+# fish has already picked the completions for this TAB, so the first one after
+# loading asks for them again
+complete -c {binary} -f -n '{prefix}_lazy_load' -a '(complete -C (commandline -cp))'
+'''.format(prefix=prefix, binary=self.docker.binary, var=var, path=self.docker.binary.replace('-', '_')))
+
+    def remove_stale_fragments(self):
+        # fragments of subcommands the binary no longer has
+        prefix = self.fragment_name('')
+        for filename in os.listdir(self.functions_dir):
+            name, ext = os.path.splitext(filename)
+            if ext == '.fish' and name.startswith(prefix) and name not in self.fragments:
+                os.unlink(os.path.join(self.functions_dir, filename))
 
 
 class DockerFishGenerator(BaseFishGenerator):
@@ -211,6 +1146,8 @@ class DockerFishGenerator(BaseFishGenerator):
 # mkdir -p ~/.config/fish/completions
 # cp docker.fish ~/.config/fish/completions
 #
+# Needs fish 3.5 or later, for the path builtin.
+#
 # Completion supported:
 # - parameters
 # - commands
@@ -218,252 +1155,295 @@ class DockerFishGenerator(BaseFishGenerator):
 # - images
 # - repositories
 
-function __fish_docker_no_subcommand --description 'Test if docker has yet to be given the subcommand'
-    for i in (commandline -opc)
-        if contains -- $i compose %s
-            return 1
+function __fish_docker_context --description 'Print the docker host or context that completions are for, fail if it is the local daemon'
+    if set -q DOCKER_HOST[1]
+        echo $DOCKER_HOST
+        not string match -q -- 'unix://*' $DOCKER_HOST
+        return
+    end
+    set -l config_dir ~/.docker
+    set -q DOCKER_CONFIG[1]; and set config_dir $DOCKER_CONFIG
+    set -l context $DOCKER_CONTEXT
+    if not set -q context[1]; and test -r $config_dir/config.json
+        set context (string replace -rf -- '.*"currentContext"\\s*:\\s*"([^"]*)".*' '$1' < $config_dir/config.json)
+    end
+    if test -z "$context"; or test "$context" = default
+        echo default
+        return 1
+    end
+    echo $context
+    # a context is remote when its docker endpoint is, whatever it is called
+    set -l name (string escape --style=regex -- $context)
+    for meta in $config_dir/contexts/meta/*/meta.json
+        read -z -l json < $meta
+        if string match -qr -- '"Name"\\s*:\\s*"'$name'"' "$json"
+            set -l host (string replace -rf -- '(?s).*"docker"\\s*:\\s*\\{[^}]*"Host"\\s*:\\s*"([^"]*)".*' '$1' "$json")
+            string match -qr -- '^(tcp|ssh|https?)://' "$host"
+            return
         end
     end
-    return 0
+    return 1
 end
 
-function __fish_print_docker_containers --description 'Print a list of docker containers' -a select
-    switch $select
-        case running
-            docker ps --no-trunc --filter status=running --format '{{.ID}}\\n{{.Names}}' | tr ',' '\\n'
-        case stopped
-            docker ps --no-trunc --filter status=exited --filter status=created --format '{{.ID}}\\n{{.Names}}' | tr ',' '\\n'
-        case all
-            docker ps --no-trunc --all --format '{{.ID}}\\n{{.Names}}' | tr ',' '\\n'
+function __fish_docker_cached --description 'List docker containers or images, reusing the output for fish_docker_cache_ttl seconds' -a resource select prefix
+    set -q fish_docker_cache_ttl; or set -l fish_docker_cache_ttl 10
+    set -l context (__fish_docker_context)
+    set -l remote (test $status -eq 0; and echo 1)
+    if test "$fish_docker_cache_ttl" -le 0
+        __fish_docker_query $resource $select $prefix
+        return
+    end
+    set -q __fish_docker_cache_gen; or set -g __fish_docker_cache_gen 0
+
+    # A list cached for a shorter prefix, or for none, already holds every
+    # match, so typing on only filters it the way docker would have. Short IDs
+    # can't be filtered by a prefix longer than they are, and containers are
+    # listed by ID too until there is a prefix.
+    set -l shortest 0
+    set -l escaped (string escape --style=regex -- "$prefix")
+    set -l match '^'$escaped'.*'
+    switch $resource
+        case containers
+            test -n "$prefix"; and set shortest 1
+            set match '^(?:[^,]*,)*'$escaped'.*'
+        case container-ids
+            test (string length -- "$prefix") -gt 12; and set shortest 13
+        case images
+            # unnamed images never match a reference filter, image-ids lists them
+            test -n "$prefix"; and set match '^'$escaped'[^\\t]*$'
+    end
+    set -l length (string length -- "$prefix")
+    while test $length -ge $shortest
+        set -l cached ''
+        test $length -gt 0; and set cached (string sub -l $length -- $prefix)
+        set -l key (string escape --style=var -- "$context $resource $select $cached")
+        if set -q remote[1]
+            # Remote engines are cached in files, so that a refresh running in the
+            # background can update them: a stale list is shown straight away.
+            set -l file (__fish_docker_cache_dir)/$key
+            if test -f $file
+                read -z -l lines < $file
+                set -l output (string split -n \\n -- "$lines")
+                if test (path mtime -R -- $file) -ge $fish_docker_cache_ttl
+                    __fish_docker_refresh $file $resource $select $cached
+                end
+                set -q output[1]; and string match -r -- $match $output
+                return 0
+            end
+        else
+            set -l var __fish_docker_cache_entry_$key
+            if set -q $var
+                # entry: command line generation, timestamp, output lines
+                set -l entry $$var
+                if test "$entry[1]" = $__fish_docker_cache_gen; or test (math (__fish_docker_now) - $entry[2]) -lt $fish_docker_cache_ttl
+                    set -q entry[3]; and string match -r -- $match $entry[3..-1]
+                    return 0
+                end
+            end
+        end
+        set length (math $length - 1)
     end
+
+    set -l key (string escape --style=var -- "$context $resource $select $prefix")
+    set -l output (__fish_docker_query $resource $select $prefix)
+    set -l query_status $status
+    if set -q remote[1]
+        test $query_status -eq 0; or return $query_status
+        set -l dir (__fish_docker_cache_dir)
+        # past 64 files, listings older than the TTL go
+        set -l files $dir/*
+        if test (count $files) -gt 64
+            set -l stale
+            for file in $files
+                test (path mtime -R -- $file) -lt $fish_docker_cache_ttl; or set -a stale $file
+            end
+            set -q stale[1]; and command rm -f -- $stale
+        end
+        printf '%s\\n' $output > $dir/$key
+    else
+        set -g __fish_docker_cache_entry_$key $__fish_docker_cache_gen (__fish_docker_now) $output
+    end
+    # docker's filters are looser than a prefix, e.g. id= matches anywhere in the ID
+    set -q output[1]; and string match -r -- $match $output
+    return 0
 end
 
-function __fish_print_docker_images --description 'Print a list of docker images'
-    docker images --format '{{if eq .Repository "<none>"}}{{.ID}}\\tUnnamed Image{{else}}{{.Repository}}:{{.Tag}}{{end}}'
+function __fish_docker_cache_dir --description 'Print the directory that keeps cached docker listings and the clock'
+    set -l dir ~/.cache/fish-docker/runtime
+    set -q XDG_CACHE_HOME[1]; and set dir $XDG_CACHE_HOME/fish-docker/runtime
+    path is -d -- $dir; or command mkdir -p -- $dir
+    echo $dir
 end
 
-function __fish_print_docker_repositories --description 'Print a list of docker repositories'
-    docker images --format '{{.Repository}}' | command grep -v '<none>' | command sort | command uniq
+function __fish_docker_now --description 'Print the current time in seconds, without starting date'
+    set -l clock (__fish_docker_cache_dir)/clock
+    true > $clock
+    path mtime -- $clock
 end
-"""
 
-    def process_subcommand_arg(self, sub, arg):
-        if arg == 'CONTAINER' or arg == '[CONTAINER...]':
-            if sub.command in ('start', 'rm'):
-                select = 'stopped'
-            elif sub.command in ('commit', 'diff', 'export', 'inspect'):
-                select = 'all'
-            else:
-                select = 'running'
-            print('''complete -c docker -A -f -n '__fish_seen_subcommand_from {0}' -a '(__fish_print_docker_containers {1})' -d "Container"'''.format(sub.command, select))
-        elif arg == 'IMAGE':
-            print('''complete -c docker -A -f -n '__fish_seen_subcommand_from {0}' -a '(__fish_print_docker_images)' -d "Image"'''.format(sub.command))
-        elif arg == 'REPOSITORY':
-            print('''complete -c docker -A -f -n '__fish_seen_subcommand_from {0}' -a '(__fish_print_docker_repositories)' -d "Repository"'''.format(sub.command))
+function __fish_docker_refresh --description 'Refresh a cached docker listing in the background' -a file resource select prefix
+    set -q fish_docker_timeout; or set -l fish_docker_timeout 3
+    # one refresh at a time; a lock older than the timeout was left by one that died
+    if test -f $file.lock; and test (path mtime -R -- $file.lock) -le $fish_docker_timeout
+        return
+    end
+    true > $file.lock
+    set -l cmd (__fish_docker_timeout) (__fish_docker_list_command $resource $select $prefix)
+    command sh -c 'f=$1; shift; "$@" > "$f.$$" 2>/dev/null && mv "$f.$$" "$f"; rm -f "$f.$$" "$f.lock"' sh $file $cmd </dev/null >/dev/null 2>&1 &
+    disown
+end
 
-    def generate(self):
-        super().generate()
-        self.compose_completions()
-
-    def compose_completions(self):
-        """Generate completions for 'docker compose' subcommand."""
-        print('''# compose
-# Helper functions for docker compose completions
-function __fish_docker_compose_no_subcommand --description 'Test if compose has yet to be given a subcommand'
-    set -l cmd (commandline -opc)
-    if not contains compose $cmd
-        return 1
+function __fish_docker_cache_invalidate --on-event fish_preexec --description 'Expire cached docker listings'
+    # TABs within one command line always reuse the cache, afterwards the TTL applies
+    set -q __fish_docker_cache_gen; or set -g __fish_docker_cache_gen 0
+    set -g __fish_docker_cache_gen (math $__fish_docker_cache_gen + 1)
+    set -l entries (set -n | string match '__fish_docker_cache_entry_*')
+    set -l tokens (string split -n ' ' -- $argv[1])
+    if contains -- docker $tokens
+        for token in $tokens
+            if contains -- $token build commit compose create down import kill load prune pull rename restart rm rmi run start stop tag up
+                set -q entries[1]; and set -e $entries
+                if __fish_docker_context >/dev/null
+                    set -l files (__fish_docker_cache_dir)/*
+                    set -q files[1]; and command rm -f -- $files
+                end
+                return
+            end
+        end
     end
-    for i in $cmd
-        if contains -- $i attach build commit config cp create down events exec export images kill logs ls pause port ps publish pull push restart rm run scale start stats stop top unpause up version volumes wait watch
-            return 1
+    # one entry is left per prefix typed; drop the ones the TTL has run out on
+    if set -q entries[1]
+        set -q fish_docker_cache_ttl; or set -l fish_docker_cache_ttl 10
+        set -l now (__fish_docker_now)
+        for var in $entries
+            set -l entry $$var
+            test (math $now - $entry[2]) -lt $fish_docker_cache_ttl; or set -e $var
         end
     end
+end
+
+function __fish_docker_timeout --description 'Print the command prefix that bounds a docker call by fish_docker_timeout seconds, one argument per line'
+    set -q fish_docker_timeout; or set -l fish_docker_timeout 3
+    command -q timeout; and printf '%s\\n' timeout $fish_docker_timeout
+end
+
+function __fish_docker_list_command --description 'Print the docker command that lists containers or images, one argument per line' -a resource select prefix
+    # a prefix is pushed down into docker filters, so only matches are sent back
+    switch $resource
+        case containers container-ids
+            set -l cmd docker ps
+            switch $select
+                case running
+                    set -a cmd --filter status=running
+                case stopped
+                    set -a cmd --filter status=exited --filter status=created
+                case all
+                    set -a cmd --all
+            end
+            if test $resource = container-ids
+                # the id filter matches anywhere in the ID, __fish_docker_cached keeps the
+                # ones that start with prefix; short IDs can't start with a longer one
+                set -a cmd --filter id=$prefix --format '{{.ID}}'
+                test (string length -- "$prefix") -gt 12; and set -a cmd --no-trunc
+            else if test -n "$prefix"
+                set -a cmd --filter 'name=^/?'(string escape --style=regex -- $prefix) --format '{{.Names}}'
+            else
+                set -a cmd --format '{{.ID}}\\n{{.Names}}'
+            end
+            printf '%s\\n' $cmd
+        case image-ids
+            # images have no id filter; only unnamed ones are completed by ID
+            printf '%s\\n' docker images --filter dangling=true --format '{{.ID}}\\tUnnamed Image'
+        case images repositories
+            set -l cmd docker images
+            if test $resource = repositories
+                set -a cmd --format '{{.Repository}}'
+            else
+                set -a cmd --format '{{if eq .Repository "<none>"}}{{.ID}}\\tUnnamed Image{{else}}{{.Repository}}:{{.Tag}}{{end}}'
+            end
+            # '*' doesn't match '/' in reference filters
+            if test -n "$prefix"
+                for pattern in $prefix\\* $prefix\\*/\\* $prefix\\*/\\*/\\*
+                    set -a cmd --filter reference=$pattern
+                end
+            end
+            printf '%s\\n' $cmd
+    end
+end
+
+function __fish_docker_query --description 'List docker containers or images, through fish_docker_api_helper when it is set' -a resource select prefix
+    set -l context (__fish_docker_context)
+    if test $status -eq 0
+        # remote engine: never let an unreachable one hang the shell
+        set -l cmd (__fish_docker_timeout) (__fish_docker_list_command $resource $select $prefix)
+        $cmd
+        return
+    end
+    # the helper only knows DOCKER_HOST and the default socket, not other local contexts
+    if set -q fish_docker_api_helper[1]; and contains -- "$context" default $DOCKER_HOST
+        $fish_docker_api_helper $resource $select --prefix "$prefix" 2>/dev/null
+        and return
+    end
+    set -l cmd (__fish_docker_list_command $resource $select $prefix)
+    $cmd
+end
+
+function __fish_docker_token --description 'Print the token being completed if it can narrow down a docker listing, fail if nothing can match it'
+    set -l token (commandline -ct)
+    # options are completed elsewhere, and docker names never start with a dash
+    string match -q -- '-*' $token; and return 1
+    # quoted or escaped tokens are left to fish to match
+    string match -qr -- '^[\\w.:/@-]+$' $token; and echo $token
     return 0
 end
 
-function __fish_docker_compose_has_subcommand --description 'Test if compose subcommand is given' -a subcmd
-    set -l cmd (commandline -opc)
-    if not contains compose $cmd
-        return 1
+function __fish_print_docker_containers --description 'Print a list of docker containers' -a select
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached containers $select $prefix | string split ,)
+    if string match -qr -- '^[0-9a-f]+$' "$prefix"
+        set -a candidates (__fish_docker_cached container-ids $select $prefix)
     end
-    if contains -- $subcmd $cmd
-        return 0
+    string join \\n -- $candidates[1..$fish_docker_max_candidates]
+end
+
+function __fish_print_docker_images --description 'Print a list of docker images'
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached images all $prefix)
+    if string match -qr -- '^[0-9a-f]+$' "$prefix"
+        set -a candidates (__fish_docker_cached image-ids all $prefix)
     end
-    return 1
+    string join \\n -- $candidates[1..$fish_docker_max_candidates]
+end
+
+function __fish_print_docker_repositories --description 'Print a list of docker repositories'
+    set -l prefix (__fish_docker_token); or return
+    set -q fish_docker_max_candidates; or set -l fish_docker_max_candidates 500
+    set -l candidates (__fish_docker_cached repositories all $prefix | string match -v '<none>' | path sort -u)
+    string join \\n -- $candidates[1..$fish_docker_max_candidates]
 end
 
 function __fish_print_docker_compose_services --description 'Print a list of docker compose services'
-    docker compose config --services 2>/dev/null | command sort
+    __fish_docker_compose_services docker compose
 end
+""" + COMPOSE_SERVICES_FUNCTION
 
-# compose subcommand
-complete -c docker -f -n '__fish_docker_no_subcommand' -a compose -d 'Define and run multi-container applications'
-
-# compose options (before subcommand)
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l all-resources -f -d 'Include all resources'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l ansi -f -d 'Control ANSI output (never|always|auto)'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l compatibility -f -d 'Run in backward compatibility mode'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l dry-run -f -d 'Execute in dry run mode'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l env-file -f -d 'Alternate environment file'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -s f -l file -f -d 'Compose configuration files'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l parallel -f -d 'Control max parallelism'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l profile -f -d 'Specify a profile to enable'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l progress -f -d 'Progress output type (auto|tty|plain|json|quiet)'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -l project-directory -f -d 'Alternate working directory'
-complete -c docker -A -n '__fish_docker_compose_no_subcommand' -s p -l project-name -f -d 'Project name'
-
-# compose subcommands
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a attach -d 'Attach to a running container'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a build -d 'Build or rebuild services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a commit -d 'Create image from container changes'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a config -d 'Parse and render compose file'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a cp -d 'Copy files between container and host'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a create -d 'Create containers for a service'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a down -d 'Stop and remove containers, networks'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a events -d 'Receive real time events'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a exec -d 'Execute command in running container'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a export -d 'Export container filesystem as tar'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a images -d 'List images used by containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a kill -d 'Force stop service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a logs -d 'View output from containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a ls -d 'List running compose projects'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a pause -d 'Pause services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a port -d 'Print public port for a port binding'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a ps -d 'List containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a pull -d 'Pull service images'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a push -d 'Push service images'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a restart -d 'Restart service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a rm -d 'Remove stopped service containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a run -d 'Run a one-off command'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a scale -d 'Scale services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a start -d 'Start services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a stats -d 'Display container resource usage'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a stop -d 'Stop services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a top -d 'Display running processes'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a unpause -d 'Unpause services'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a up -d 'Create and start containers'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a version -d 'Show Docker Compose version'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a wait -d 'Block until containers stop'
-complete -c docker -f -n '__fish_docker_compose_no_subcommand' -a watch -d 'Watch build context and rebuild'
-
-# compose up options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l abort-on-container-exit -f -d 'Stop all containers if any stop'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l always-recreate-deps -f -d 'Recreate dependent containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l attach -f -d 'Restrict attaching to specific services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l build -f -d 'Build images before starting'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -s d -l detach -f -d 'Run containers in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l exit-code-from -f -d 'Return exit code from service'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l force-recreate -f -d 'Recreate containers even if unchanged'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-build -f -d 'Do not build images'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-deps -f -d 'Do not start linked services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-recreate -f -d 'Do not recreate existing containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l no-start -f -d 'Do not start services after creating'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l pull -f -d 'Pull image policy (always|missing|never)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l quiet-pull -f -d 'Pull without printing progress'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l remove-orphans -f -d 'Remove containers not in compose file'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l scale -f -d 'Scale service to NUM instances'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -s t -l timeout -f -d 'Shutdown timeout in seconds'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l wait -f -d 'Wait for services to be healthy'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand up' -l watch -f -d 'Watch source and rebuild/refresh'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand up' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose down options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -l remove-orphans -f -d 'Remove containers not in compose file'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -l rmi -f -d 'Remove images (all|local)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -s t -l timeout -f -d 'Shutdown timeout in seconds'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand down' -s v -l volumes -f -d 'Remove named volumes'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand down' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose logs options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s f -l follow -f -d 'Follow log output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l no-color -f -d 'Produce monochrome output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l no-log-prefix -f -d 'Do not print prefix in logs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l since -f -d 'Show logs since timestamp'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s n -l tail -f -d 'Number of lines from end of logs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -s t -l timestamps -f -d 'Show timestamps'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand logs' -l until -f -d 'Show logs before timestamp'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand logs' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose exec options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s d -l detach -f -d 'Run in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -l index -f -d 'Index of container if scaled'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -l privileged -f -d 'Give extended privileges'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s u -l user -f -d 'Run as this user'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand exec' -s w -l workdir -f -d 'Working directory inside container'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand exec' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose run options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l build -f -d 'Build image before running'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l cap-add -f -d 'Add Linux capabilities'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l cap-drop -f -d 'Drop Linux capabilities'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s d -l detach -f -d 'Run in background'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l entrypoint -f -d 'Override entrypoint'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s e -l env -f -d 'Set environment variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s i -l interactive -f -d 'Keep STDIN open'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s l -l label -f -d 'Add or override label'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l name -f -d 'Assign a name to the container'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s T -l no-TTY -f -d 'Disable pseudo-TTY allocation'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l no-deps -f -d 'Do not start linked services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s p -l publish -f -d 'Publish container port'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l quiet-pull -f -d 'Pull without printing progress'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l rm -f -d 'Remove container when it exits'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l service-ports -f -d 'Run with service port mappings'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -l use-aliases -f -d 'Use service network aliases'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s u -l user -f -d 'Run as this user'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s v -l volume -f -d 'Bind mount a volume'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand run' -s w -l workdir -f -d 'Working directory inside container'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand run' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose ps options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -s a -l all -f -d 'Show all containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l filter -f -d 'Filter output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l format -f -d 'Format output (table|json)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l no-trunc -f -d 'Do not truncate output'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l orphans -f -d 'Include orphaned containers'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -s q -l quiet -f -d 'Only display container IDs'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l services -f -d 'Display services'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand ps' -l status -f -d 'Filter by status'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand ps' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose build options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l build-arg -f -d 'Set build-time variables'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l builder -f -d 'Set builder to use'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l memory -f -d 'Set memory limit for build'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l no-cache -f -d 'Do not use cache'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l pull -f -d 'Always pull newer image'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l push -f -d 'Push images after build'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -s q -l quiet -f -d 'Do not print anything'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand build' -l ssh -f -d 'Set SSH agent socket or keys'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand build' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# compose pull/push options
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l ignore-buildable -f -d 'Ignore images that can be built'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l ignore-pull-failures -f -d 'Pull what it can and ignore failures'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l include-deps -f -d 'Also pull service dependencies'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -l policy -f -d 'Apply pull policy (missing|always)'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand pull' -s q -l quiet -f -d 'Pull without printing progress'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand pull' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -l ignore-push-failures -f -d 'Push what it can and ignore failures'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -l include-deps -f -d 'Also push service dependencies'
-complete -c docker -A -n '__fish_docker_compose_has_subcommand push' -s q -l quiet -f -d 'Push without printing progress'
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand push' -a '(__fish_print_docker_compose_services)' -d "Service"
-
-# Service completions for other compose subcommands
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand start' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand stop' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand restart' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand pause' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand unpause' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand kill' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand rm' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand create' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand attach' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand top' -a '(__fish_print_docker_compose_services)' -d "Service"
-complete -c docker -A -f -n '__fish_docker_compose_has_subcommand events' -a '(__fish_print_docker_compose_services)' -d "Service"
-''')
+    def arg_completion(self, sub, arg):
+        if arg == 'CONTAINER' or arg == '[CONTAINER...]':
+            if sub.command in ('start', 'rm'):
+                select = 'stopped'
+            elif sub.command in ('commit', 'diff', 'export', 'inspect'):
+                select = 'all'
+            else:
+                select = 'running'
+            return '__fish_print_docker_containers %s' % select, 'Container'
+        elif arg == 'IMAGE':
+            return '__fish_print_docker_images', 'Image'
+        elif arg == 'REPOSITORY':
+            return '__fish_print_docker_repositories', 'Repository'
+        elif arg == 'SERVICE':
+            return '__fish_print_docker_compose_services', 'Service'
 
 
 class DockerComposeFishGenerator(BaseFishGenerator):
@@ -477,29 +1457,60 @@ class DockerComposeFishGenerator(BaseFishGenerator):
 # mkdir -p ~/.config/fish/completions
 # cp docker-compose.fish ~/.config/fish/completions
 #
+# Needs fish 3.5 or later, for the path builtin.
+#
 # Completion supported:
 # - parameters
 # - commands
 # - services
 
-function __fish_docker_no_subcommand --description 'Test if docker has yet to be given the subcommand'
-    for i in (commandline -opc)
-        if contains -- $i %s
-            return 1
-        end
-    end
-    return 0
+function __fish_print_docker-compose_services --description 'Print a list of docker-compose services'
+    __fish_docker_compose_services docker-compose
 end
+""" + COMPOSE_SERVICES_FUNCTION
 
-function __fish_print_docker_compose_services --description 'Print a list of docker-compose services'
-    docker-compose config --services ^/dev/null | command sort
-end
-"""
-
-    def process_subcommand_arg(self, sub, arg):
+    def arg_completion(self, sub, arg):
         if arg in ('SERVICE', '[SERVICE...]'):
-            print('''complete -c docker-compose -A -f -n '__fish_seen_subcommand_from {0}' -a '(__fish_print_docker_compose_services)' -d "Service"'''.format(sub.command))
+            return '__fish_print_docker-compose_services', 'Service'
+
+
 
+class JsonIndexGenerator(object):
+    """A JSON index of the completions for tools other than fish.
+
+    One flat entry per command path ('' is the binary itself) with its
+    options, argument names and subcommands, so a lookup needs no tree walk.
+    """
+
+    def __init__(self, docker, out):
+        self.docker = docker
+        self.out = out
+
+    def option(self, switch):
+        return {
+            'names': ['-' + x for x in switch.shorts] + ['--' + x for x in switch.longs],
+            'description': switch.description,
+            'metavar': switch.metavar,
+            'file': switch.is_file_target(),
+        }
+
+    def generate(self):
+        model = self.docker.model
+        commands = {}
+
+        def walk(path, description, switches, args, subs):
+            commands[' '.join(path)] = {
+                'description': description,
+                'options': [self.option(switch) for switch in switches],
+                'args': args,
+                'subcommands': [sub.command for sub in subs],
+            }
+            for sub in subs:
+                walk(sub.path, sub.description, sub.switches, sub.standalone_args(), sub.subcommands)
+
+        walk((), None, model.common_options, [], model.subcommands)
+        json.dump({'binary': model.binary, 'commands': commands}, self.out, indent=2)
+        self.out.write('\n')
 
 
 def main():
@@ -508,30 +1519,161 @@ def main():
         '--docker-path',
         default='/usr/bin'
     )
+    parser.add_argument(
+        '--output-dir',
+        help='directory to write the completion files to (default: completions/ next to this script)'
+    )
+    parser.add_argument(
+        '--layout',
+        choices=['single', 'split', 'table'],
+        default='single',
+        help='single: one file per binary; split: a small completion file that loads the completions '
+             'of each subcommand from --functions-dir when it is first used; table: a few completions '
+             'that look the subcommand up in generated tables (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--emit',
+        nargs='+',
+        choices=['fish', 'model', 'index'],
+        default=['fish'],
+        help='what to write from the one scrape of each binary: fish: <binary>.fish completions; '
+             'model: <binary>.model.json, the scraped model for --model; index: <binary>.index.json, '
+             'a flat JSON index of commands, options and arguments (default: fish)'
+    )
+    parser.add_argument(
+        '--functions-dir',
+        help='where the split layout writes its per-subcommand functions (default: functions/ next to the output directory)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        # help scraping mostly waits on docker processes, so use more threads than CPUs
+        default=min(32, (os.cpu_count() or 1) + 4),
+        help='number of help pages to scrape in parallel (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=default_cache_dir(),
+        help='where scraped help output is kept between runs (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='always run docker and do not read or write the help cache'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='ignore cached help output and re-scrape it'
+    )
+    parser.add_argument(
+        '--stats',
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help='write per-stage timings, docker calls and parse costs as JSON to FILE (default: stdout, '
+             'with progress on stderr)'
+    )
+    corpus = parser.add_mutually_exclusive_group()
+    corpus.add_argument(
+        '--record',
+        metavar='DIR',
+        help='save every docker output the generator reads to DIR/<binary>.json'
+    )
+    corpus.add_argument(
+        '--replay',
+        metavar='CORPUS',
+        help='generate from a recorded corpus (directory, tar archive or JSON file) without running docker'
+    )
+    corpus.add_argument(
+        '--model',
+        metavar='DIR',
+        help='generate from the <binary>.model.json files a run with --emit model wrote to DIR, without running docker'
+    )
 
     args = parser.parse_args()
+    # --stats without FILE leaves stdout to the JSON report alone
+    progress = sys.stderr if args.stats == '-' else sys.stdout
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    completions_dir = os.path.join(script_dir, 'completions')
+    completions_dir = args.output_dir or os.path.join(script_dir, 'completions')
     os.makedirs(completions_dir, exist_ok=True)
-
-    docker_fish = os.path.join(completions_dir, 'docker.fish')
-    print(f'Generating {docker_fish}...')
-    with open(docker_fish, 'w') as f:
-        old_stdout = sys.stdout
-        sys.stdout = f
-        DockerFishGenerator(DockerCmdLine(args.docker_path)).generate()
-        sys.stdout = old_stdout
-
-    compose_fish = os.path.join(completions_dir, 'docker-compose.fish')
-    print(f'Generating {compose_fish}...')
-    with open(compose_fish, 'w') as f:
-        old_stdout = sys.stdout
-        sys.stdout = f
-        DockerComposeFishGenerator(DockerComposeCmdLine(args.docker_path)).generate()
-        sys.stdout = old_stdout
-
-    print('Done.')
+    functions_dir = None
+    if args.layout == 'split' and 'fish' in args.emit:
+        # fish looks for functions/ beside completions/ in the same config directory
+        functions_dir = args.functions_dir or os.path.join(os.path.dirname(os.path.abspath(completions_dir)), 'functions')
+        os.makedirs(functions_dir, exist_ok=True)
+
+    replay = {}
+    if args.replay:
+        for cls in (DockerCmdLine, DockerComposeCmdLine):
+            try:
+                replay[cls.binary] = Corpus.load(args.replay, cls.binary)
+            except (OSError, ValueError, LookupError, tarfile.TarError) as e:
+                parser.error('cannot replay %s: %s' % (args.replay, e))
+    models = {}
+    if args.model:
+        for cls in (DockerCmdLine, DockerComposeCmdLine):
+            filename = os.path.join(args.model, '%s.model.json' % cls.binary)
+            try:
+                with open(filename) as f:
+                    models[cls.binary] = CommandLine.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                parser.error('cannot load %s: %s' % (filename, e))
+
+    def generate(cmdline_cls, generator_cls):
+        start = time.perf_counter()
+        docker = cmdline_cls(args.docker_path, args.jobs)
+        if args.model:
+            docker.model = models[docker.binary]
+        elif args.replay:
+            docker.replay = replay[docker.binary]
+        elif not args.no_cache:
+            docker.cache = HelpCache.load(args.cache_dir, docker, args.refresh)
+        if args.record:
+            docker.record = Corpus(docker.binary, docker.run('--version').strip())
+        # every emitter reads this one scrape
+        with docker.stats.stage('scrape'):
+            docker.model
+        for emit in args.emit:
+            filename = os.path.join(completions_dir, docker.binary + {
+                'fish': '.fish', 'model': '.model.json', 'index': '.index.json'}[emit])
+            print(f'Generating {filename}...', file=progress)
+            with docker.stats.stage(emit), CompletionFile(filename) as out:
+                if emit == 'fish':
+                    generator = generator_cls(docker, out, args.layout, functions_dir)
+                    generator.generate()
+                    generator.finish()
+                elif emit == 'model':
+                    json.dump(docker.model.as_dict(), out, separators=(',', ':'))
+                else:
+                    JsonIndexGenerator(docker, out).generate()
+        if docker.cache is not None:
+            docker.cache.save()
+        if docker.record is not None:
+            docker.record.save(args.record)
+        docker.stats.stages['total'] = time.perf_counter() - start
+        return docker.stats
+
+    # both binaries are independent, so a regeneration takes as long as the slower one
+    targets = [
+        (DockerCmdLine, DockerFishGenerator),
+        (DockerComposeCmdLine, DockerComposeFishGenerator),
+    ]
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = [executor.submit(generate, *target) for target in targets]
+        stats = [future.result() for future in futures]
+
+    print('Done.', file=progress)
+
+    if args.stats:
+        report = [s.as_dict() for s in stats]
+        if args.stats == '-':
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.stats, 'w') as f:
+                json.dump(report, f, indent=2)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,33 @@
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+BENCH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench', 'bench_completions.py')
+
+
+class CheckSpawnsTest(unittest.TestCase):
+    def bench(self, *args, **env):
+        return subprocess.run([sys.executable, BENCH, '--check-spawns', '--no-generator'] + list(args),
+                              env=dict(os.environ, **env), capture_output=True, text=True)
+
+    def test_fails_without_fish(self):
+        result = self.bench(PATH=os.path.dirname(sys.executable))
+        self.assertEqual(result.returncode, 2, result.stderr)
+        self.assertIn('needs fish', result.stderr)
+
+    @unittest.skipIf(shutil.which('fish') is None, 'fish is not installed')
+    def test_every_helper_spawns_what_it_expects(self):
+        result = self.bench('--runs', '2', '--repeat', '3', '--containers', '20', '--images', '20')
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+    @unittest.skipIf(shutil.which('fish') is None, 'fish is not installed')
+    @unittest.skipIf(shutil.which('timeout') is None, 'timeout is not installed')
+    def test_remote_engine(self):
+        result = self.bench('--runs', '2', '--repeat', '3', '--docker-host', 'tcp://remote:2376')
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+import fish_docker_api
+
+HELPER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fish_docker_api.py')
+
+CONTAINERS = [
+    {'Id': 'abc123def4567890' + '0' * 48, 'Names': ['/web', '/app/web']},
+    {'Id': 'ffabc1230000aaaa' + '1' * 48, 'Names': ['/db']},
+]
+
+IMAGES = [
+    {'Id': 'sha256:' + '2' * 64, 'RepoTags': ['nginx:latest', 'nginx:1.25']},
+    {'Id': 'sha256:' + '3' * 64, 'RepoTags': ['library/redis:7']},
+    {'Id': 'sha256:' + '4' * 64, 'RepoTags': ['<none>:<none>']},
+]
+
+
+class StubEngine(BaseHTTPRequestHandler):
+    # answers every list with the same objects, the filters are only recorded
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.server.requests.append((url.path, query))
+        body = {'/containers/json': CONTAINERS, '/images/json': IMAGES}.get(url.path)
+        if body is None:
+            self.send_error(404)
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        return 'stub'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class DockerAPITest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket = os.path.join(self.tmp.name, 'docker.sock')
+        self.server = StubServer(self.socket, StubEngine)
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.api = fish_docker_api.DockerAPI(self.socket)
+
+    def tearDown(self):
+        self.api.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def filters(self):
+        path, query = self.server.requests[-1]
+        return json.loads(query.get('filters', '{}'))
+
+    def test_containers(self):
+        lines = list(fish_docker_api.print_containers(self.api, 'running', ''))
+        self.assertEqual(lines, ['abc123def456', 'web', 'app/web', 'ffabc1230000', 'db'])
+        self.assertEqual(self.server.requests[-1][0], '/containers/json')
+        self.assertEqual(self.filters(), {'status': ['running']})
+
+    def test_containers_prefix(self):
+        list(fish_docker_api.print_containers(self.api, 'all', 'we.b'))
+        path, query = self.server.requests[-1]
+        self.assertEqual(query['all'], '1')
+        self.assertEqual(self.filters(), {'name': ['^/?we\\.b']})
+
+    def test_container_ids_prefix(self):
+        # the stub ignores the id filter, like docker matching 'abc123' inside ffabc123...
+        lines = list(fish_docker_api.print_container_ids(self.api, 'stopped', 'abc123'))
+        self.assertEqual(lines, ['abc123def456'])
+        self.assertEqual(self.filters(), {'id': ['abc123'], 'status': ['exited', 'created']})
+
+    def test_container_ids_long_prefix(self):
+        lines = list(fish_docker_api.print_container_ids(self.api, 'all', 'abc123def4567'))
+        self.assertEqual(lines, [CONTAINERS[0]['Id']])
+
+    def test_images(self):
+        lines = list(fish_docker_api.print_images(self.api, ''))
+        self.assertEqual(lines, ['nginx:latest', 'nginx:1.25', 'library/redis:7', '444444444444\tUnnamed Image'])
+        self.assertEqual(self.server.requests[-1], ('/images/json', {}))
+
+    def test_images_prefix(self):
+        list(fish_docker_api.print_images(self.api, 'ngi'))
+        self.assertEqual(self.filters(), {'reference': ['ngi*', 'ngi*/*', 'ngi*/*/*']})
+
+    def test_image_ids_prefix(self):
+        # the stub ignores dangling=true, so only the prefix leaves the tagged images out
+        lines = list(fish_docker_api.print_image_ids(self.api, '44'))
+        self.assertEqual(lines, ['444444444444\tUnnamed Image'])
+        self.assertEqual(self.filters(), {'dangling': ['true']})
+
+    def test_repositories(self):
+        lines = fish_docker_api.print_repositories(self.api, 'lib')
+        self.assertEqual(lines, ['library/redis', 'nginx'])
+        self.assertEqual(self.filters(), {'reference': ['lib*', 'lib*/*', 'lib*/*/*']})
+
+    def test_helper_prints_lines(self):
+        env = dict(os.environ, DOCKER_HOST='unix://' + self.socket)
+        output = subprocess.run(
+            [sys.executable, HELPER, 'container-ids', 'all', '--prefix', 'ffabc'],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output, 'ffabc1230000\n')
+
+    def test_helper_fails_without_unix_socket(self):
+        env = dict(os.environ, DOCKER_HOST='tcp://127.0.0.1:2375')
+        result = subprocess.run([sys.executable, HELPER, 'images'], env=env, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stdout, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
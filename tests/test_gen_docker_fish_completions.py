@@ -0,0 +1,191 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+
+from gen_docker_fish_completions import CommandLine
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GENERATOR = os.path.join(REPO_DIR, 'gen_docker_fish_completions.py')
+FAKE_DOCKER = os.path.join(REPO_DIR, 'bench', 'fake_docker.py')
+
+
+class GeneratorTestCase(unittest.TestCase):
+    """Runs the generator against bench/fake_docker.py in a temporary directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='fish-docker-test-')
+        self.bin_dir = os.path.join(self.tmp, 'bin')
+        os.makedirs(self.bin_dir)
+        # a copy, so a test can change the binary's mtime
+        shutil.copy(FAKE_DOCKER, os.path.join(self.bin_dir, 'docker'))
+        os.symlink('docker', os.path.join(self.bin_dir, 'docker-compose'))
+        self.log = os.path.join(self.tmp, 'docker.log')
+        self.env = dict(os.environ, FAKE_DOCKER_LOG=self.log, XDG_CACHE_HOME=os.path.join(self.tmp, 'cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def generate(self, output_dir, *args):
+        """Generate into output_dir and return the number of docker processes started."""
+        open(self.log, 'w').close()
+        subprocess.run([sys.executable, GENERATOR, '--docker-path', self.bin_dir, '--output-dir', output_dir] + list(args),
+                       env=self.env, check=True, stdout=subprocess.DEVNULL)
+        with open(self.log) as f:
+            return sum(1 for line in f if line.strip())
+
+    def read(self, output_dir, name='docker.fish'):
+        with open(os.path.join(output_dir, name)) as f:
+            return f.read()
+
+
+class NestedCrawlTest(GeneratorTestCase):
+    def test_management_subcommands(self):
+        out = os.path.join(self.tmp, 'out')
+        self.generate(out, '--no-cache')
+        fish = self.read(out)
+        for path, completion in [
+                ('network ls', "-l no-trunc"),
+                ('volume rm', "-s f -l force"),
+                ('container prune', "-l filter")]:
+            self.assertIn("-n '__fish_docker_using %s' %s" % (path, completion), fish)
+        self.assertIn("complete -c docker -f -n '__fish_docker_using network' -a ls -d 'List networks'", fish)
+
+
+class HelpCacheTest(GeneratorTestCase):
+    def test_warm_run_only_asks_for_versions(self):
+        out = os.path.join(self.tmp, 'out')
+        cold = self.generate(out)
+        fish = self.read(out)
+        # docker --version and docker-compose --version identify the binaries
+        self.assertEqual(self.generate(out), 2)
+        self.assertEqual(self.read(out), fish)
+        self.assertGreater(cold, 2)
+
+    def test_changed_binary_is_scraped_again(self):
+        out = os.path.join(self.tmp, 'out')
+        cold = self.generate(out)
+        docker = os.path.join(self.bin_dir, 'docker')
+        st = os.stat(docker)
+        os.utime(docker, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.generate(out), cold)
+
+    def test_refresh(self):
+        out = os.path.join(self.tmp, 'out')
+        cold = self.generate(out)
+        self.assertEqual(self.generate(out, '--refresh'), cold)
+        # and the refreshed cache is used afterwards
+        self.assertEqual(self.generate(out), 2)
+
+
+class CorpusTest(GeneratorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.corpus = os.path.join(self.tmp, 'corpus')
+        self.recorded = os.path.join(self.tmp, 'recorded')
+        self.generate(self.recorded, '--no-cache', '--record', self.corpus)
+
+    def assertReplays(self, source):
+        out = os.path.join(self.tmp, 'replayed')
+        self.assertEqual(self.generate(out, '--replay', source), 0)
+        for name in ('docker.fish', 'docker-compose.fish'):
+            self.assertEqual(self.read(out, name), self.read(self.recorded, name))
+
+    def test_directory(self):
+        self.assertReplays(self.corpus)
+
+    def test_tar_archive(self):
+        archive = os.path.join(self.tmp, 'corpus.tar.gz')
+        with tarfile.open(archive, 'w:gz') as tar:
+            tar.add(self.corpus, arcname='corpus')
+        self.assertReplays(archive)
+
+    def test_json_list(self):
+        documents = []
+        for name in ('docker.json', 'docker-compose.json'):
+            with open(os.path.join(self.corpus, name)) as f:
+                documents.append(json.load(f))
+        filename = os.path.join(self.tmp, 'corpus.json')
+        with open(filename, 'w') as f:
+            json.dump(documents, f)
+        self.assertReplays(filename)
+
+    def test_missing_page(self):
+        filename = os.path.join(self.corpus, 'docker.json')
+        with open(filename) as f:
+            document = json.load(f)
+        del document['outputs']['help network ls']
+        with open(filename, 'w') as f:
+            json.dump(document, f)
+        result = subprocess.run([sys.executable, GENERATOR, '--replay', self.corpus,
+                                 '--output-dir', os.path.join(self.tmp, 'replayed')],
+                                env=self.env, capture_output=True, text=True)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('help network ls was not recorded', result.stderr)
+
+
+class JobsTest(GeneratorTestCase):
+    def test_concurrent_scrape_matches_serial(self):
+        serial = os.path.join(self.tmp, 'serial')
+        parallel = os.path.join(self.tmp, 'parallel')
+        self.generate(serial, '--no-cache', '-j', '1')
+        self.generate(parallel, '--no-cache', '-j', '16')
+        for name in ('docker.fish', 'docker-compose.fish'):
+            self.assertEqual(self.read(parallel, name), self.read(serial, name))
+
+
+class ModelTest(GeneratorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraped = os.path.join(self.tmp, 'scraped')
+        self.docker_calls = self.generate(self.scraped, '--no-cache', '--emit', 'fish', 'model', 'index')
+
+    def test_round_trip(self):
+        for binary in ('docker', 'docker-compose'):
+            with open(os.path.join(self.scraped, binary + '.model.json')) as f:
+                d = json.load(f)
+            self.assertEqual(CommandLine.from_dict(d).as_dict(), d)
+            self.assertEqual(d['binary'], binary)
+
+    def test_unknown_schema(self):
+        with open(os.path.join(self.scraped, 'docker.model.json')) as f:
+            d = json.load(f)
+        d['schema'] += 1
+        with self.assertRaises(ValueError):
+            CommandLine.from_dict(d)
+
+    def test_generate_from_model(self):
+        out = os.path.join(self.tmp, 'from-model')
+        self.assertEqual(self.generate(out, '--model', self.scraped), 0)
+        for name in ('docker.fish', 'docker-compose.fish'):
+            self.assertEqual(self.read(out, name), self.read(self.scraped, name))
+
+    def test_one_scrape_for_every_format(self):
+        out = os.path.join(self.tmp, 'fish-only')
+        self.assertEqual(self.generate(out, '--no-cache'), self.docker_calls)
+        with open(os.path.join(self.scraped, 'docker.index.json')) as f:
+            commands = json.load(f)['commands']
+        self.assertIn('ls', commands['network']['subcommands'])
+        self.assertIn(['--no-trunc'], [option['names'] for option in commands['network ls']['options']])
+
+
+class StatsTest(GeneratorTestCase):
+    def test_stdout_is_json(self):
+        result = subprocess.run([sys.executable, GENERATOR, '--docker-path', self.bin_dir, '--no-cache',
+                                 '--output-dir', os.path.join(self.tmp, 'out'), '--stats'],
+                                env=self.env, capture_output=True, text=True, check=True)
+        report = {stats['binary']: stats for stats in json.loads(result.stdout)}
+        self.assertIn('Done.', result.stderr)
+        with open(self.log) as f:
+            self.assertEqual(sum(s['process_spawns'] for s in report.values()), len(f.readlines()))
+        # the common options come from the top-level --help
+        for binary in ('docker', 'docker-compose'):
+            self.assertGreater(report[binary]['commands']['--help']['switches'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()